@@ -0,0 +1,104 @@
+import hmac
+from typing import Any, Dict, Optional, Tuple, Union
+from flask import Blueprint, abort, jsonify, request
+from adversity import DIFFICULTIES
+from room_manager import RoomManager
+
+# Requests without a token are accepted from these addresses when no token is configured
+LOCAL_ADDRESSES: Tuple[str, ...] = ('127.0.0.1', '::1')
+
+# Longest cProfile capture, in ticks
+MAX_PROFILE_TICKS: int = 10000
+
+
+def check_admin_access(token: Optional[str]) -> None:
+    """
+    Reject the current request without the admin token, in the X-Admin-Token
+    header or as an Authorization: Bearer token (as sent by Prometheus).
+
+    Args:
+        token (str, optional): Expected token, None to only accept local requests
+    """
+    if token is None:
+        if request.remote_addr not in LOCAL_ADDRESSES:
+            abort(403)
+        return
+    sent: str = request.headers.get('X-Admin-Token', '')
+    authorization: str = request.headers.get('Authorization', '')
+    if not sent and authorization.startswith('Bearer '):
+        sent = authorization[len('Bearer '):]
+    if not hmac.compare_digest(sent, token):
+        abort(403)
+
+
+def create_admin_blueprint(rooms: RoomManager, token: Optional[str] = None) -> Blueprint:
+    """
+    Build the HTTP admin endpoints replacing the game manager window on headless servers.
+
+        GET  /admin/status                  rooms, players and loop statistics
+        POST /admin/start|pause|resume      control a room, ?room=CODE (default room if omitted)
+        POST /admin/difficulty              {"difficulty": "hard"}, applied to every room
+        POST /admin/profile                 cProfile the next ticks of a room, ?room=CODE&ticks=N (300 default)
+        GET  /admin/profile                 last cProfile report of a room, ?room=CODE
+
+    Args:
+        rooms (RoomManager): The rooms of the server
+        token (str, optional): Expected in the X-Admin-Token header, None to only accept local requests
+
+    Returns:
+        Blueprint: The endpoints, to register on the Flask app
+    """
+    admin = Blueprint('admin', __name__, url_prefix='/admin')
+
+    @admin.before_request
+    def check_access() -> None:
+        """Reject the requests without the admin token"""
+        check_admin_access(token)
+
+    @admin.get('/status')
+    def status() -> Any:
+        """Describe the rooms and their players"""
+        stats: Dict[str, Any] = rooms.get_stats()
+        stats['difficulty'] = rooms.difficulty
+        stats['players_by_room'] = {code: len(rooms.get_room(code).players) for code in stats['loops']
+                                    if rooms.get_room(code) is not None}
+        return jsonify(stats)
+
+    @admin.route('/profile', methods=['GET', 'POST'])
+    def profile() -> Union[Any, Tuple[Any, int]]:
+        """Start a cProfile capture of a room, or get its last report"""
+        code: str = RoomManager.normalize_code(request.args.get('room')) or RoomManager.DEFAULT_ROOM
+        game = rooms.get_room(code)
+        if game is None:
+            return jsonify({'error': f"Unknown room: {code}"}), 404
+        if request.method == 'POST':
+            ticks: int = request.args.get('ticks', 300, type=int)
+            if not 0 < ticks <= MAX_PROFILE_TICKS:
+                return jsonify({'error': f"ticks must be between 1 and {MAX_PROFILE_TICKS}"}), 400
+            game.start_profile(ticks)
+            return jsonify({'room': code, 'ticks': ticks})
+        stats: Dict[str, Any] = game.get_loop_stats().get('profile', {})
+        return jsonify({'room': code, 'profiling': stats.get('profiling', 0), 'report': stats.get('report')})
+
+    @admin.post('/<action>')
+    def control(action: str) -> Union[Any, Tuple[Any, int]]:
+        """Start, pause or resume a room"""
+        if action not in ('start', 'pause', 'resume'):
+            abort(404)
+        code: str = RoomManager.normalize_code(request.args.get('room')) or RoomManager.DEFAULT_ROOM
+        game = rooms.get_room(code)
+        if game is None:
+            return jsonify({'error': f"Unknown room: {code}"}), 404
+        getattr(game, action)()
+        return jsonify({'room': code, 'action': action})
+
+    @admin.post('/difficulty')
+    def difficulty() -> Union[Any, Tuple[Any, int]]:
+        """Apply a difficulty preset to every room"""
+        name: Optional[str] = (request.get_json(silent=True) or {}).get('difficulty')
+        if name not in DIFFICULTIES:
+            return jsonify({'error': f"Unknown difficulty: {name}", 'difficulties': sorted(DIFFICULTIES)}), 400
+        rooms.set_difficulty(name)
+        return jsonify({'difficulty': name})
+
+    return admin
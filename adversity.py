@@ -8,11 +8,22 @@ from typing import TYPE_CHECKING
 if TYPE_CHECKING:
     from game import Game
 
+# Difficulty presets: asteroid and enemy spawn intervals in seconds (0 disables), damages per hit
+DIFFICULTIES: Dict[str, Dict[str, float]] = {
+    'off':    {'spawn_interval_asteroid': 0.0,  'spawn_interval_enemy': 0.0,  'asteroid_damage': 2.0, 'enemy_damage': 5.0},
+    'easy':   {'spawn_interval_asteroid': 1.0,  'spawn_interval_enemy': 20.0, 'asteroid_damage': 1.0, 'enemy_damage': 3.0},
+    'normal': {'spawn_interval_asteroid': 0.5,  'spawn_interval_enemy': 10.0, 'asteroid_damage': 2.0, 'enemy_damage': 5.0},
+    'hard':   {'spawn_interval_asteroid': 0.25, 'spawn_interval_enemy': 5.0,  'asteroid_damage': 4.0, 'enemy_damage': 8.0},
+}
+
 class Adversity(GameObject):
     """
     Adversity system that spawns asteroids and enemy ships at regular intervals.
     Implemented as a GameObject so it can be updated naturally by the game loop.
     """
+    __slots__ = ('spawn_interval_asteroid', 'last_spawn_time_asteroid', 'spawn_interval_enemy', 'last_spawn_time_enemy',
+                 'asteroid_damage', 'enemy_damage')
+
     def __init__(self, game_reference:'Game'):
         """
         Initialize the adversity system.
@@ -34,6 +45,18 @@ class Adversity(GameObject):
         self.asteroid_damage: float = 2.0  # Default asteroid damage
         self.enemy_damage: float = 5.0    # Default enemy projectile damage
 
+    def apply_difficulty(self, difficulty: str) -> None:
+        """
+        Set the spawn intervals and damages of a difficulty preset.
+
+        Args:
+            difficulty (str): Name of a preset of DIFFICULTIES
+        """
+        if difficulty not in DIFFICULTIES:
+            raise ValueError(f"Unknown difficulty: {difficulty}")
+        for name, value in DIFFICULTIES[difficulty].items():
+            setattr(self, name, value)
+
     def update(self, players: Dict, player_keys: Dict, delta_time: float) -> None:
         """
         Update method called by the game loop. Spawns asteroids and enemy ships at intervals.
@@ -80,7 +103,7 @@ class Adversity(GameObject):
             direction: Vector = Vector(-1, random.uniform(-1, 1))  # Moving left
 
         # Create the asteroid and add it to the game with configured damage
-        asteroid: Asteroid = Asteroid(game=self.game, x=x, y=y, direction=direction, damage=self.asteroid_damage)
+        asteroid: Asteroid = self.game.acquire(Asteroid, game=self.game, x=x, y=y, direction=direction, damage=self.asteroid_damage)
         self.game.add_game_object(asteroid)
 
     def spawn_enemyship(self) -> None:
@@ -10,6 +10,10 @@ class Asteroid(GameObjectWithHealth):
     """
     Represents an asteroid that moves in a specific direction.
     """
+    __slots__ = ('speed', 'damage', 'direction')
+    BATCHED_KINEMATICS: bool = True
+    POOLED: bool = True  # Recycled by Game.acquire, see reset()
+    
     def __init__(self, game:'Game', x: float, y: float, direction: Vector, speed: float = 40, max_health: float = 5, damage:float = 2.0):
         """
         Initialize an asteroid.
@@ -35,15 +39,39 @@ class Asteroid(GameObjectWithHealth):
             offset_y=0
         )
 
+    def reset(self, game:'Game', x: float, y: float, direction: Vector, speed: float = 40, max_health: float = 5, damage:float = 2.0) -> None:
+        """
+        Reinitialize a pooled asteroid, reusing its position, health and collider.
+        Takes the same arguments as __init__.
+        """
+        self.game = game
+        self.revive(x, y)
+        self.speed = speed
+        self.damage = damage
+        self.direction.set_(direction.x, direction.y).normalize_()
+        self.health.setMaxHealth(max_health)
+        self.health.setHealth(max_health)
+
     def update(self, players: Dict[str, Any], player_keys: Dict[str, Any], delta_time: float) -> None:
         """
         Update the asteroid's position.
+        Movement is skipped when the game's batched kinematics stage already moved it.
 
         Args:
             players (dict): Dictionary of players.
             player_keys (dict): Dictionary of player keys.
             delta_time (float): Time elapsed since the last update.
         """
+        if not self.kinematics_batched:
+            self.integrate(delta_time)
+
+    def integrate(self, delta_time: float) -> None:
+        """
+        Move the asteroid and deactivate it once it leaves the screen.
+
+        Args:
+            delta_time (float): Time elapsed since the last update.
+        """
         move_vector: Vector = self.direction * self.speed * delta_time
         self.position += move_vector
 
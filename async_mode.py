@@ -0,0 +1,69 @@
+import time
+import threading
+from typing import Any, Callable, Optional, Tuple
+
+# Networking backends the server can run on, see prepare()
+ASYNC_MODES: Tuple[str, ...] = ('eventlet', 'threading')
+
+
+def prepare(async_mode: str) -> None:
+    """
+    Get the process ready for a networking backend, before the server is imported.
+    The eventlet mode monkey patches the standard library, so that the game
+    loops, locks and emits become green threads cooperating with the
+    eventlet web server instead of OS threads blocking its hub.
+
+    Args:
+        async_mode (str): One of ASYNC_MODES
+    """
+    if async_mode not in ASYNC_MODES:
+        raise ValueError(f"Unknown async mode: {async_mode}")
+    if async_mode == 'eventlet':
+        import eventlet
+        eventlet.monkey_patch()
+
+
+def start_task(socketio: Any, target: Callable[..., None], *args: Any) -> Any:
+    """
+    Run a loop in the background with the server's backend: a green thread
+    in eventlet mode, a daemon thread otherwise or without a server.
+
+    Args:
+        socketio: The SocketIO instance, or None (or any object without start_background_task)
+        target (callable): Function to run
+        *args: Arguments of target
+
+    Returns:
+        The task, to pass to join_task()
+    """
+    if hasattr(socketio, 'start_background_task'):
+        return socketio.start_background_task(target, *args)
+    thread: threading.Thread = threading.Thread(target=target, args=args, daemon=True)
+    thread.start()
+    return thread
+
+
+def join_task(task: Any, timeout: Optional[float] = None) -> None:
+    """
+    Wait for a task started by start_task() to end.
+
+    Args:
+        task: The task, or None
+        timeout (float, optional): Maximum wait in seconds
+    """
+    if task is not None and hasattr(task, 'join'):
+        task.join(timeout=timeout)
+
+
+def sleep(socketio: Any, seconds: float) -> None:
+    """
+    Sleep in a background loop, yielding to the other green threads in eventlet mode.
+
+    Args:
+        socketio: The SocketIO instance, or None
+        seconds (float): Duration of the sleep
+    """
+    if hasattr(socketio, 'sleep'):
+        socketio.sleep(seconds)
+    else:
+        time.sleep(seconds)
@@ -0,0 +1,146 @@
+"""
+Compare the networking backends of the server (see async_mode.ASYNC_MODES).
+
+Runs headless.py once per mode with the main room started, connects many
+python-socketio clients at once and reports, for each mode:
+
+    connected   clients connected within the timeout
+    dropped     clients disconnected by the server during the measurement
+    connect s   time to connect them all
+    frames/s    state frames received per second by each client (target: the emit rate)
+    rtt p50/p95 round trip of an acknowledged input event, in milliseconds,
+                measured while every client receives the state frames
+
+The clients run in this process, on their own threads, so on small machines
+they compete with the server for the CPU: compare modes on the same machine,
+not the absolute numbers. Needs the client extras:
+pip install "python-socketio[client]" (requests and websocket-client).
+
+Usage:
+    python benchmarks/bench_async_modes.py [--clients 50] [--modes eventlet,threading] [--seconds 5]
+"""
+import argparse
+import os
+import subprocess
+import sys
+import threading
+import time
+from typing import Dict, List
+
+import socketio
+
+ROOT: str = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..')
+
+
+def wait_for_server(url: str, timeout: float) -> bool:
+    """Poll the page until the server answers."""
+    import requests
+    deadline: float = time.perf_counter() + timeout
+    while time.perf_counter() < deadline:
+        try:
+            if requests.get(url, timeout=1.0).ok:
+                return True
+        except requests.RequestException:
+            pass
+        time.sleep(0.2)
+    return False
+
+
+def connect_clients(url: str, count: int, timeout: float) -> List[socketio.Client]:
+    """Connect the clients in parallel, return the ones that made it."""
+    clients: List[socketio.Client] = []
+    lock = threading.Lock()
+
+    def connect() -> None:
+        client = socketio.Client(reconnection=False)
+        client.frames = 0
+        client.on('game_state_update', lambda data: setattr(client, 'frames', client.frames + 1))
+        client.on('game_state_delta', lambda data: setattr(client, 'frames', client.frames + 1))
+        try:
+            client.connect(url, wait_timeout=timeout)
+        except socketio.exceptions.ConnectionError:
+            return
+        with lock:
+            clients.append(client)
+
+    threads: List[threading.Thread] = [threading.Thread(target=connect, daemon=True) for _ in range(count)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join(timeout)
+    return clients
+
+
+def percentile(values: List[float], fraction: float) -> float:
+    """Nearest rank percentile of a list of values."""
+    if not values:
+        return float('nan')
+    ordered: List[float] = sorted(values)
+    return ordered[min(len(ordered) - 1, int(fraction * len(ordered)))]
+
+
+def measure(mode: str, port: int, clients: int, seconds: float, emit_rate: float) -> Dict[str, float]:
+    """Run the server in a mode and measure it with the clients."""
+    url: str = f"http://127.0.0.1:{port}"
+    server = subprocess.Popen(
+        [sys.executable, os.path.join(ROOT, 'headless.py'), '--async-mode', mode, '--host', '127.0.0.1',
+         '--port', str(port), '--emit-rate', str(emit_rate), '--autostart'],
+        cwd=ROOT, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+    connected: List[socketio.Client] = []
+    try:
+        if not wait_for_server(url, timeout=15.0):
+            raise RuntimeError(f"The server did not start in {mode} mode")
+        start: float = time.perf_counter()
+        connected = connect_clients(url, clients, timeout=10.0)
+        connect_time: float = time.perf_counter() - start
+
+        time.sleep(1.0)  # Let the keyframes arrive
+        frames_before: int = sum(client.frames for client in connected)
+        rtts: List[float] = []
+        start = time.perf_counter()
+        while time.perf_counter() - start < seconds:
+            for client in connected:
+                sent: float = time.perf_counter()
+                try:
+                    client.call('key_up', {'key': 'none'}, timeout=5)
+                except (socketio.exceptions.TimeoutError, socketio.exceptions.BadNamespaceError):
+                    continue
+                rtts.append((time.perf_counter() - sent) * 1000.0)
+        elapsed: float = time.perf_counter() - start
+        frames: int = sum(client.frames for client in connected) - frames_before
+        dropped: int = sum(1 for client in connected if not client.connected)
+    finally:
+        for client in connected:
+            if client.connected:
+                client.disconnect()
+        server.terminate()
+        server.wait(timeout=10)
+    return {
+        'connected': len(connected),
+        'dropped': dropped,
+        'connect_time': connect_time,
+        'frames_per_client': frames / elapsed / max(1, len(connected)),
+        'rtt_p50': percentile(rtts, 0.50),
+        'rtt_p95': percentile(rtts, 0.95),
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--clients', type=int, default=50, help='clients connected at once')
+    parser.add_argument('--modes', default='eventlet,threading', help='comma separated modes to compare')
+    parser.add_argument('--seconds', type=float, default=5.0, help='measurement duration per mode')
+    parser.add_argument('--emit-rate', type=float, default=30.0, help='state broadcasts per second of the room')
+    parser.add_argument('--port', type=int, default=5099, help='port of the servers')
+    args = parser.parse_args()
+
+    print(f"{args.clients} clients, {args.emit_rate:g} frames/s target, {os.cpu_count()} CPUs")
+    print(f"{'mode':<12}{'connected':>10}{'dropped':>9}{'connect s':>11}{'frames/s':>10}{'rtt p50':>9}{'rtt p95':>9}")
+    for mode in args.modes.split(','):
+        result: Dict[str, float] = measure(mode, args.port, args.clients, args.seconds, args.emit_rate)
+        print(f"{mode:<12}{result['connected']:>10}{result['dropped']:>9}{result['connect_time']:>11.2f}"
+              f"{result['frames_per_client']:>10.1f}{result['rtt_p50']:>9.1f}{result['rtt_p95']:>9.1f}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,100 @@
+"""
+Compare the collision backends of Game.check_collisions.
+
+Runs check_collisions on random scenes of increasing size with the brute
+force BroadPhase, the pure-Python SpatialHashBroadPhase and, when numpy is
+installed, NumpyBroadPhase. Prints the mean time per call and the object
+count from which the NumPy backend becomes faster than the pure-Python one.
+
+Usage:
+    python benchmarks/bench_collision_backends.py [--sizes 25,50,100,...] [--repeat 20]
+"""
+import argparse
+import os
+import random
+import sys
+import time
+from typing import Dict, List, Optional
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+
+from game import Game
+from broad_phase import BroadPhase, SpatialHashBroadPhase
+from asteroids import Asteroid
+from enemy_ship import EnemyShip
+from projectile import Projectile
+from vector import Vector
+from tag import Tag
+try:
+    from numpy_broad_phase import NumpyBroadPhase, np
+except ImportError:
+    NumpyBroadPhase, np = None, None
+
+
+def build_scene(object_count: int, seed: int = 1234) -> Game:
+    """Build a game filled with a mix of asteroids, enemy ships and projectiles."""
+    rng = random.Random(seed)
+    game = Game()
+    for _ in range(object_count):
+        x, y = rng.uniform(-10, 110), rng.uniform(-10, 110)
+        direction = Vector(rng.uniform(-1, 1), rng.uniform(-1, 1))
+        kind = rng.random()
+        if kind < 0.4:
+            obj = Asteroid(game=game, x=x, y=y, direction=direction)
+        elif kind < 0.5:
+            obj = EnemyShip(game=game, x=x, y=y, direction=direction)
+        elif kind < 0.85:
+            obj = Projectile(game=game, x=x, y=y, direction=direction, targets=[Tag.ENEMY])
+        else:
+            obj = Projectile(game=game, x=x, y=y, direction=direction, targets=[Tag.PLAYER])
+        game.add_game_object(obj)
+    return game
+
+
+def time_backend(backend: BroadPhase, object_count: int, repeat: int) -> float:
+    """Return the mean duration of check_collisions in milliseconds."""
+    total: float = 0.0
+    for run in range(repeat):
+        # Collisions kill objects, rebuild the same scene for every run
+        game = build_scene(object_count, seed=run)
+        game.set_broad_phase(backend)
+        start = time.perf_counter()
+        game.check_collisions()
+        total += time.perf_counter() - start
+    return total / repeat * 1000
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--sizes', default='25,50,100,200,400,800,1600')
+    parser.add_argument('--repeat', type=int, default=10)
+    parser.add_argument('--brute-force-limit', type=int, default=400,
+                        help='largest scene timed with the brute force backend')
+    args = parser.parse_args()
+    sizes: List[int] = [int(size) for size in args.sizes.split(',')]
+
+    backends: Dict[str, BroadPhase] = {'spatial_hash': SpatialHashBroadPhase()}
+    if NumpyBroadPhase is not None and np is not None:
+        backends['numpy'] = NumpyBroadPhase()
+    else:
+        print("numpy is not installed, only the pure-Python backends are timed")
+
+    print(f"{'objects':>8} {'brute_force':>12} " + " ".join(f"{name:>12}" for name in backends))
+    crossover: Optional[int] = None
+    for size in sizes:
+        brute = time_backend(BroadPhase(), size, args.repeat) if size <= args.brute_force_limit else None
+        timings = {name: time_backend(backend, size, args.repeat) for name, backend in backends.items()}
+        brute_text = f"{brute:10.3f}ms" if brute is not None else f"{'-':>12}"
+        print(f"{size:>8} {brute_text} " + " ".join(f"{timings[name]:10.3f}ms" for name in backends))
+        if crossover is None and 'numpy' in timings and timings['numpy'] < timings['spatial_hash']:
+            crossover = size
+
+    if 'numpy' in backends:
+        if crossover is None:
+            print("numpy backend never beat the spatial hash on these sizes")
+        else:
+            print(f"numpy backend is faster from about {crossover} objects")
+
+
+if __name__ == '__main__':
+    main()
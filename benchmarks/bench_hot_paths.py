@@ -0,0 +1,271 @@
+"""
+Microbenchmarks of the simulation hot paths, compared against a saved baseline.
+
+Each case times one hot path in isolation on scenes built from fixed seeds:
+
+    collider_aligned        Collider.intersects, unrotated pairs (box test)
+    collider_rotated        Collider.intersects, rotated pairs (SAT), new positions every call
+    check_collisions_<n>    Game.check_collisions on a scene of n objects
+    get_state_moved         Game.get_state after every object moved (dicts rebuilt)
+    get_state_idle          Game.get_state with nothing changed (cached dicts)
+    vector_arithmetic       position += direction * speed * dt, normalize, dot, distance
+    spaceship_update        SpaceShip.update with 64 players moving and firing
+    adversity_burst         Adversity spawning 100 asteroids and 10 enemy ships
+
+Each repeat of a case builds its scene (not timed) and then calls the hot
+path a fixed number of times with the garbage collector off. The cases take
+turns, one repeat each, for --repeat rounds.
+The suite reports the median and the best time per call over the repeats,
+in microseconds, one case per line, always in the same order. The best time
+is the least disturbed by the rest of the machine, so it is the one
+compared with the baseline.
+
+With --save, the results are written to the baseline file with the machine
+they ran on. Later runs print the change against that file, and --check
+exits with status 1 when a case got slower than --threshold. Baselines are
+only comparable on the same machine and Python version.
+
+Usage:
+    python benchmarks/bench_hot_paths.py                       # compare against the saved baseline
+    python benchmarks/bench_hot_paths.py --save                # replace the baseline
+    python benchmarks/bench_hot_paths.py --only collider --check --threshold 0.15
+"""
+import argparse
+import gc
+import json
+import os
+import platform
+import random
+import statistics
+import sys
+import time
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+BENCHMARKS: str = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, os.path.join(BENCHMARKS, '..'))
+
+from bench_collision_backends import build_scene
+from game import Game
+from collider import Collider
+from vector import Vector
+from adversity import Adversity
+
+BASELINE: str = os.path.join(BENCHMARKS, 'baseline_hot_paths.json')
+SEED: int = 1234
+PLAYERS: int = 64
+
+# A setup builds the scene of one repeat and returns the function to time
+Setup = Callable[[], Callable[[], Any]]
+
+
+def collider_setup(angle: float, pairs: int = 1000) -> Setup:
+    """Setup of the Collider.intersects cases: one call tests every pair, half of them overlapping."""
+    def setup() -> Callable[[], Any]:
+        rng = random.Random(SEED)
+        cases: List[Tuple[Collider, Collider, Vector, Vector]] = []
+        for index in range(pairs):
+            first = Collider(rng.uniform(2, 6), rng.uniform(2, 6), angle=angle * rng.random())
+            second = Collider(rng.uniform(2, 6), rng.uniform(2, 6), angle=angle * rng.random())
+            position = Vector(rng.uniform(0, 100), rng.uniform(0, 100))
+            distance: float = rng.uniform(0, 4) if index % 2 else rng.uniform(8, 20)
+            cases.append((first, second, position, position + Vector.from_angle(rng.uniform(0, 6.28), distance)))
+        shift = Vector(0.01, 0.0)
+
+        def run() -> None:
+            for first, second, my_pos, other_pos in cases:
+                # Objects move every tick, so the world shapes are never reused between calls
+                my_pos += shift
+                first.intersects(second, my_pos, other_pos)
+        return run
+    return setup
+
+
+def check_collisions_setup(object_count: int) -> Setup:
+    """Setup of Game.check_collisions, collisions kill objects so each repeat gets a new scene."""
+    def setup() -> Callable[[], Any]:
+        return build_scene(object_count, seed=SEED).check_collisions
+    return setup
+
+
+def get_state_setup(object_count: int, moved: bool) -> Setup:
+    """Setup of Game.get_state, after a kinematics step so that every moving object changed."""
+    def setup() -> Callable[[], Any]:
+        game: Game = build_scene(object_count, seed=SEED)
+        game.get_state()
+
+        def run() -> Any:
+            if moved:
+                game.kinematics.step(1 / 60)
+            return game.get_state()
+        return run
+    return setup
+
+
+def vector_setup(steps: int = 1000) -> Setup:
+    """Setup of the Vector arithmetic case, the operations of the movement and aiming code."""
+    def setup() -> Callable[[], Any]:
+        position, direction, target = Vector(10, 20), Vector(0.6, 0.8), Vector(50, 50)
+
+        def run() -> None:
+            nonlocal position
+            for _ in range(steps):
+                position += direction * 150.0 * (1 / 60)
+                aim: Vector = (target - position).normalize()
+                aim.dot(direction)
+                position.distance_to(target)
+        return run
+    return setup
+
+
+def spaceship_setup(players: int = PLAYERS) -> Setup:
+    """Setup of SpaceShip.update: players spread over the movement keys, every one firing at their own angle."""
+    def setup() -> Callable[[], Any]:
+        rng = random.Random(SEED)
+        game = Game()
+        ship = game.spaceship
+        ship.heat_shoot = 0.0  # Never overheat, so that every call runs the firing code
+        for index in range(players):
+            player_id: str = f"player_{index}"
+            game.add_player(player_id, f"Player {index}")
+            game.player_keys.press(player_id, ('up', 'down', 'left', 'right')[index % 4])
+            game.player_keys.set_value(player_id, 'angle', rng.uniform(0, 360))
+            game.player_keys.set_value(player_id, 'weapon', 1 + index % 4)
+            game.player_keys.press(player_id, 'shoot')
+
+        def run() -> None:
+            ship.update(game.players, game.player_keys, 1 / 60)
+        return run
+    return setup
+
+
+def adversity_setup(asteroids: int = 100, enemies: int = 10) -> Setup:
+    """Setup of an Adversity spawn burst, on a new game with the module random seeded."""
+    def setup() -> Callable[[], Any]:
+        random.seed(SEED)
+        game = Game()
+        adversity: Adversity = game.get_game_object('adversity_manager')
+
+        def run() -> None:
+            for _ in range(asteroids):
+                adversity.spawn_asteroid()
+            for _ in range(enemies):
+                adversity.spawn_enemyship()
+        return run
+    return setup
+
+
+# Name -> (setup, calls per repeat)
+CASES: Dict[str, Tuple[Setup, int]] = {
+    'collider_aligned': (collider_setup(0.0), 20),
+    'collider_rotated': (collider_setup(3.14), 5),
+    'check_collisions_50': (check_collisions_setup(50), 1),
+    'check_collisions_200': (check_collisions_setup(200), 1),
+    'check_collisions_1000': (check_collisions_setup(1000), 1),
+    'get_state_moved': (get_state_setup(200, moved=True), 20),
+    'get_state_idle': (get_state_setup(200, moved=False), 50),
+    'vector_arithmetic': (vector_setup(), 20),
+    'spaceship_update': (spaceship_setup(), 100),
+    'adversity_burst': (adversity_setup(), 1),
+}
+
+
+def time_once(setup: Setup, number: int) -> float:
+    """Run one repeat of a case, returns the microseconds per call."""
+    run: Callable[[], Any] = setup()
+    gc.collect()
+    gc.disable()
+    try:
+        start: float = time.perf_counter()
+        for _ in range(number):
+            run()
+        return (time.perf_counter() - start) / number * 1e6
+    finally:
+        gc.enable()
+
+
+def run_cases(names: List[str], repeat: int) -> Dict[str, Dict[str, float]]:
+    """
+    Time the cases, one repeat of each in turn, so that a slow period of the
+    machine affects every case alike instead of the one running at the time.
+    The first round only warms up the caches and allocator, it is not counted.
+
+    Args:
+        names (list): Names of the cases to run, in CASES
+        repeat (int): Timed repeats of each case
+
+    Returns:
+        dict: Case name -> median and best microseconds per call, calls per repeat and repeats
+    """
+    timings: Dict[str, List[float]] = {name: [] for name in names}
+    for round_index in range(repeat + 1):
+        for name in names:
+            setup, number = CASES[name]
+            elapsed: float = time_once(setup, number)
+            if round_index:
+                timings[name].append(elapsed)
+    return {name: {'median': statistics.median(values), 'min': min(values), 'number': CASES[name][1],
+                   'repeat': repeat}
+            for name, values in timings.items()}
+
+
+def machine() -> Dict[str, Any]:
+    """Describe the machine, saved with the baseline."""
+    return {'python': platform.python_version(), 'implementation': platform.python_implementation(),
+            'platform': platform.platform(), 'cpus': os.cpu_count()}
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--baseline', default=BASELINE, help='baseline file to compare against or save to')
+    parser.add_argument('--save', action='store_true', help='write the results to the baseline file')
+    parser.add_argument('--only', help='run the cases whose name contains this text')
+    parser.add_argument('--repeat', type=int, default=15, help='timed repeats of each case')
+    parser.add_argument('--threshold', type=float, default=0.10, help='relative slowdown reported as a regression')
+    parser.add_argument('--check', action='store_true', help='exit with status 1 on a regression')
+    args = parser.parse_args()
+
+    baseline: Dict[str, Any] = {}
+    if os.path.exists(args.baseline) and not args.save:
+        with open(args.baseline) as file:
+            baseline = json.load(file)
+        if baseline.get('machine') != machine():
+            print(f"Baseline measured on another machine: {baseline.get('machine')}")
+    saved: Dict[str, Dict[str, float]] = baseline.get('results', {})
+
+    names: List[str] = [name for name in CASES if not args.only or args.only in name]
+    results: Dict[str, Dict[str, float]] = run_cases(names, args.repeat)
+    print(f"{'case':<24}{'median us':>12}{'min us':>12}{'baseline':>12}{'change':>9}")
+    regressions: List[str] = []
+    for name, result in results.items():
+        line: str = f"{name:<24}{result['median']:>12.2f}{result['min']:>12.2f}"
+        reference: Optional[Dict[str, float]] = saved.get(name)
+        if reference:
+            change: float = result['min'] / reference['min'] - 1
+            line += f"{reference['min']:>12.2f}{change:>+9.1%}"
+            if change > args.threshold:
+                line += "  slower"
+                regressions.append(name)
+            elif change < -args.threshold:
+                line += "  faster"
+        print(line)
+
+    if args.save:
+        if args.only:
+            # Keep the saved cases that did not run
+            if os.path.exists(args.baseline):
+                with open(args.baseline) as file:
+                    saved = json.load(file).get('results', {})
+            results = {name: results.get(name, saved.get(name)) for name in CASES if name in results or name in saved}
+        with open(args.baseline, 'w') as file:
+            json.dump({'machine': machine(), 'results': results}, file, indent=2)
+            file.write('\n')
+        print(f"Baseline written to {args.baseline}")
+    elif regressions:
+        print(f"{len(regressions)} cases slower than the baseline by more than {args.threshold:.0%}: "
+              f"{', '.join(regressions)}")
+        if args.check:
+            sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
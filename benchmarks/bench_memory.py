@@ -0,0 +1,125 @@
+"""
+Measure the per-object memory footprint and allocation cost of the hot types.
+
+For Vector, Collider, PlayerInput (KeyTouch on older revisions), Health, Overheat and the GameObject classes,
+builds many instances under tracemalloc and reports the bytes retained per
+instance. Also times a Vector arithmetic loop and reports its peak traced
+memory.
+
+Usage:
+    python benchmarks/bench_memory.py                 # current tree
+    python benchmarks/bench_memory.py --compare HEAD~1  # side by side with another git revision
+"""
+import argparse
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import time
+import tracemalloc
+from typing import Callable, Dict, List, Tuple
+
+ROOT: str = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..')
+INSTANCES: int = 20000
+
+
+def footprint(factory: Callable[[], object], count: int = INSTANCES) -> float:
+    """Return the bytes retained per object built by factory."""
+    tracemalloc.start()
+    before, _ = tracemalloc.get_traced_memory()
+    keep: List[object] = [factory() for _ in range(count)]
+    after, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    # The list itself holds one pointer per object
+    return (after - before) / len(keep) - 8
+
+
+def vector_loop(steps: int = 200000) -> Tuple[float, float]:
+    """Return the ns per step of position += direction * speed * dt and the peak traced bytes of the loop."""
+    from vector import Vector
+    position, direction = Vector(10, 20), Vector(0.6, 0.8)
+    start = time.perf_counter()
+    for _ in range(steps):
+        position += direction * 150.0 * 0.01
+    elapsed = time.perf_counter() - start
+    tracemalloc.start()
+    for _ in range(steps // 10):
+        position += direction * 150.0 * 0.01
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return elapsed / steps * 1e9, peak
+
+
+def measure() -> Dict[str, float]:
+    """Measure the current import path, returns name -> bytes per object (or ns for the loop)."""
+    sys.path.insert(0, os.getcwd())
+    from vector import Vector
+    from collider import Collider
+    from health import Health
+    from overheat import Overheat
+    from game import Game
+    from projectile import Projectile
+    from asteroids import Asteroid
+    from enemy_ship import EnemyShip
+
+    game = Game()
+    factories: Dict[str, Callable[[], object]] = {
+        'Vector': lambda: Vector(1.0, 2.0),
+        'Collider': lambda: Collider(2, 2),
+        'Health': lambda: Health(10),
+        'Overheat': lambda: Overheat(),
+        'Projectile': lambda: Projectile(game=game, x=1, y=2, direction=Vector(1, 0)),
+        'Asteroid': lambda: Asteroid(game=game, x=1, y=2, direction=Vector(1, 0)),
+        'EnemyShip': lambda: EnemyShip(game=game, x=1, y=2, direction=Vector(1, 0)),
+    }
+    try:
+        from player_input import PlayerInput
+        factories['PlayerInput'] = lambda: PlayerInput()
+    except ImportError:
+        from key_touch import KeyTouch
+        factories['KeyTouch'] = lambda: KeyTouch('up')
+
+    results: Dict[str, float] = {name: footprint(factory) for name, factory in factories.items()}
+    results['vector_loop_ns'], results['vector_loop_peak_bytes'] = vector_loop()
+    return results
+
+
+def measure_revision(revision: str) -> Dict[str, float]:
+    """Export a git revision to a temporary directory and measure it in a subprocess."""
+    with tempfile.TemporaryDirectory() as directory:
+        archive = subprocess.run(['git', '-C', ROOT, 'archive', revision], check=True, capture_output=True).stdout
+        subprocess.run(['tar', '-x', '-C', directory], input=archive, check=True)
+        output = subprocess.run([sys.executable, os.path.abspath(__file__), '--json'], cwd=directory,
+                                check=True, capture_output=True, text=True).stdout
+    return json.loads(output)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--compare', metavar='REVISION', help='git revision to compare against')
+    parser.add_argument('--json', action='store_true', help='print raw results as JSON (used by --compare)')
+    args = parser.parse_args()
+
+    if args.json:
+        print(json.dumps(measure()))
+        return
+
+    os.chdir(ROOT)
+    current: Dict[str, float] = measure()
+    other: Dict[str, float] = measure_revision(args.compare) if args.compare else {}
+
+    header = f"{'type':<24}{'current':>12}"
+    if other:
+        header += f"{args.compare:>12}{'saved':>10}"
+    print(header)
+    for name, value in current.items():
+        line = f"{name:<24}{value:>12.1f}"
+        if name in other:
+            saved = 1 - value / other[name] if other[name] else 0.0
+            line += f"{other[name]:>12.1f}{saved:>9.0%}"
+        print(line)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,71 @@
+"""
+Measure the simulation throughput of many rooms with and without worker processes.
+
+Hosts the same number of rooms in a RoomManager with each worker count and
+reports the total simulation ticks per second. The tick rate is set high so
+that the rooms are CPU bound: with workers=0 every room shares the GIL of
+one process, with workers > 0 the rooms are spread over that many cores.
+Sharded room statistics are reported once per second by the workers, so
+ticks are counted between two reports taken the same way.
+
+Usage:
+    python benchmarks/bench_room_shards.py [--rooms 8] [--workers 0,2,4] [--seconds 5] [--tick-rate 5000]
+"""
+import argparse
+import os
+import sys
+import time
+from typing import Dict, List
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+
+from room_manager import RoomManager
+from shard_worker import STATS_INTERVAL
+
+
+def total_ticks(manager: RoomManager) -> Dict[str, int]:
+    """Ticks run so far by each player room, as last reported."""
+    loops = manager.get_stats()['loops']
+    return {code: stats['simulation']['ticks'] for code, stats in loops.items()
+            if code != RoomManager.DEFAULT_ROOM and stats}
+
+
+def measure(rooms: int, workers: int, seconds: float, tick_rate: float) -> float:
+    """Return the total ticks per second of the rooms with a worker count."""
+    manager = RoomManager(tick_rate=tick_rate, max_rooms=rooms + 1, workers=workers)
+    manager.start()
+    try:
+        for index in range(rooms):
+            manager.create_room(f"BENCH{index}")
+        # Warm up, and wait for every room to be reported at least once
+        time.sleep(2 * STATS_INTERVAL)
+        start_ticks: Dict[str, int] = total_ticks(manager)
+        start = time.perf_counter()
+        time.sleep(seconds)
+        end_ticks: Dict[str, int] = total_ticks(manager)
+        elapsed: float = time.perf_counter() - start
+    finally:
+        manager.stop()
+    return sum(end_ticks[code] - start_ticks.get(code, 0) for code in end_ticks) / elapsed
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--rooms', type=int, default=8, help='number of rooms hosted')
+    parser.add_argument('--workers', default='0,2,4', help='comma separated worker counts to compare')
+    parser.add_argument('--seconds', type=float, default=5.0, help='measurement duration per worker count')
+    parser.add_argument('--tick-rate', type=float, default=5000.0, help='target ticks per second of each room')
+    args = parser.parse_args()
+
+    worker_counts: List[int] = [int(count) for count in args.workers.split(',')]
+    print(f"{args.rooms} rooms, target {args.tick_rate:.0f} ticks/s each, {os.cpu_count()} CPUs")
+    print(f"{'workers':<10}{'ticks/s':>12}{'vs first':>10}")
+    baseline: float = 0.0
+    for workers in worker_counts:
+        rate: float = measure(args.rooms, workers, args.seconds, args.tick_rate)
+        baseline = baseline or rate
+        print(f"{workers:<10}{rate:>12.0f}{rate / baseline:>9.1f}x")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,79 @@
+"""
+Compare the payload size and encode time of the state frame wire formats.
+
+Simulates a scene for a number of broadcast frames and encodes every frame
+as a full JSON state (the former game_state_update), as JSON keyframes and
+deltas (DeltaEncoder, the default) and as binary frames (BinaryStateCodec).
+The JSON paths are timed including json.dumps, which Socket.IO runs on emit.
+
+Usage:
+    python benchmarks/bench_wire_format.py [--objects 200] [--frames 300]
+"""
+import argparse
+import json
+import os
+import random
+import sys
+import time
+from typing import Any, Callable, Dict, List
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+
+from game import Game
+from asteroids import Asteroid
+from enemy_ship import EnemyShip
+from delta_encoder import DeltaEncoder
+from binary_state_codec import BinaryStateCodec
+from vector import Vector
+
+
+def build_scene(object_count: int, seed: int = 1234) -> Game:
+    """Build a game filled with moving asteroids and enemy ships."""
+    rng = random.Random(seed)
+    game = Game()
+    game.add_player('bench', 'Bench')
+    for _ in range(object_count):
+        x, y = rng.uniform(0, 100), rng.uniform(0, 100)
+        direction = Vector(rng.uniform(-1, 1), rng.uniform(-1, 1))
+        object_class = Asteroid if rng.random() < 0.8 else EnemyShip
+        game.add_game_object(object_class(game=game, x=x, y=y, direction=direction))
+    return game
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--objects', type=int, default=200)
+    parser.add_argument('--frames', type=int, default=300)
+    parser.add_argument('--ticks-per-frame', type=int, default=2, help='simulation ticks between two broadcasts')
+    args = parser.parse_args()
+
+    game = build_scene(args.objects)
+    delta_encoder = DeltaEncoder()
+    binary_codec = BinaryStateCodec()
+    formats: Dict[str, Callable[[int, Dict[str, Any]], bytes]] = {
+        'json_full': lambda tick, state: json.dumps(dict(state, tick=tick)).encode(),
+        'json_delta': lambda tick, state: json.dumps(delta_encoder.encode(tick, state['gameObjects'])[1]).encode(),
+        'binary': lambda tick, state: binary_codec.encode(tick, state['gameObjects']),
+    }
+    totals: Dict[str, List[float]] = {name: [0.0, 0.0] for name in formats}  # bytes, seconds
+
+    for _ in range(args.frames):
+        for _ in range(args.ticks_per_frame):
+            game.update(game.scheduler.tick_interval)
+        state: Dict[str, Any] = game.get_state()
+        for name, encode in formats.items():
+            start = time.perf_counter()
+            payload: bytes = encode(game.tick, state)
+            totals[name][1] += time.perf_counter() - start
+            totals[name][0] += len(payload)
+
+    print(f"{len(game.game_objects)} objects at the end, {args.frames} frames")
+    print(f"{'format':<12}{'bytes/frame':>14}{'encode ms':>12}{'vs json_full':>14}")
+    full_bytes: float = totals['json_full'][0]
+    for name, (size, seconds) in totals.items():
+        print(f"{name:<12}{size / args.frames:>14.0f}{seconds / args.frames * 1000:>12.3f}"
+              f"{full_bytes / size:>13.1f}x")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,433 @@
+"""
+Load test of the game server with simulated players.
+
+Starts headless.py (or targets a running server with --url), connects many
+python-socketio clients grouped in crews of --room-size players, and makes
+each of them play like a browser client does: movement keys pressed and
+released, bursts of rotating cannon fire with rotate_shoot re-sent every
+200 ms, weapon changes, and the cooling key held when the ship gets hot.
+After a warm-up, it measures during --seconds:
+
+    frames/s    state frames received per second by each client (target: the emit rate)
+    bytes/s     state frame payload received per second by each client, as
+                compact JSON (engine.io framing not included)
+    latency     input to state: from the rotate_shoot starting a burst to the
+                first state frame with a projectile flying at the angle of
+                the burst (angles are unique per burst). Bursts started while
+                a crewmate cools the ship are not sampled, those that still
+                could not fire (ship overheated) are counted as missed.
+    server      ticks, overruns and dropped ticks of every room during the
+                measurement, tick duration percentiles and object counts,
+                read from /admin/status (local requests need no token)
+
+and writes everything to a JSON report (--report), to compare runs.
+
+The clients run in this process, on their own threads, so on small machines
+they compete with the server for the CPU: compare runs on the same machine.
+Needs the client extras: pip install "python-socketio[client]" (requests and
+websocket-client).
+
+Usage:
+    python benchmarks/load_test.py [--clients 50] [--room-size 4] [--seconds 30] [--report load_test_report.json]
+    python benchmarks/load_test.py --url http://game.example.com --admin-token secret --clients 200
+"""
+import argparse
+import json
+import math
+import os
+import random
+import subprocess
+import sys
+import threading
+import time
+from typing import Any, Dict, List, Optional
+
+import requests
+import socketio
+
+from bench_async_modes import ROOT, percentile, wait_for_server
+
+# Interval between two rotate_shoot events while firing, as static/js/game.js
+FIRE_REPEAT: float = 0.2
+# A burst without a matching projectile after this delay is counted as missed
+PROBE_TIMEOUT: float = 2.0
+# Fraction of the maximum temperature from which the simulated players cool the ship
+HOT: float = 0.8
+MOVE_KEYS: tuple = ('up', 'down', 'left', 'right')
+
+
+class SimulatedPlayer:
+    """
+    One player: a Socket.IO client, the thread sending its inputs, and the
+    counters of the state frames it receives.
+    """
+
+    def __init__(self, index: int, seed: int):
+        """
+        Initialize the player, not connected yet.
+
+        Args:
+            index (int): Number of the player, used in its name
+            seed (int): Seed of its input stream
+        """
+        self.index: int = index
+        self.random: random.Random = random.Random(seed)
+        self.client = socketio.Client(reconnection=False)
+        self.client.on('game_state_update', self.on_frame)
+        self.client.on('game_state_delta', self.on_frame)
+        self.lock = threading.Lock()
+        self.frames: int = 0
+        self.bytes: int = 0
+        self.inputs: int = 0
+        # Last values received, deltas only send the fields that changed
+        self.temperature: float = 0.0
+        self.max_temperature: float = 100.0
+        self.cooling: bool = False
+        self.crew: List['SimulatedPlayer'] = []  # Players of the same room, this one included
+        self.probes: Dict[float, float] = {}  # Angle of the running burst -> send time
+        self.velocities: Dict[str, Dict[str, float]] = {}  # Object ID -> last velocity received
+        self.latencies: List[float] = []      # Milliseconds
+        self.missed: int = 0
+        self.stopped = threading.Event()
+        self.thread: Optional[threading.Thread] = None
+
+    def connect(self, url: str, room: Optional[str], timeout: float) -> bool:
+        """Connect to the server, in a room or the main one."""
+        query: str = f"?room={room}" if room else ''
+        try:
+            self.client.connect(url + query, wait_timeout=timeout)
+        except socketio.exceptions.ConnectionError:
+            return False
+        self.emit('set_name', {'name': f'Load {self.index}'})
+        return True
+
+    def reset(self) -> None:
+        """Clear the counters, at the start of the measurement."""
+        with self.lock:
+            self.frames = self.bytes = self.inputs = self.missed = 0
+            self.latencies = []
+
+    def emit(self, event: str, data: Optional[Dict[str, Any]] = None) -> None:
+        """Send an input, ignoring a connection dropped by the server."""
+        try:
+            self.client.emit(event, data)
+        except socketio.exceptions.BadNamespaceError:
+            return
+        self.inputs += 1
+
+    def on_frame(self, frame: Dict[str, Any]) -> None:
+        """Count a state frame and match its new projectiles with the running bursts."""
+        received: float = time.perf_counter()
+        size: int = len(json.dumps(frame, separators=(',', ':')))
+        # Keyframes carry every object, deltas the created ones and the changed fields of the others
+        if frame.get('keyframe'):
+            self.velocities = {}
+            objects: List[Dict[str, Any]] = frame.get('gameObjects', [])
+        else:
+            objects = frame.get('created', []) + frame.get('updated', [])
+            for obj_id in frame.get('removed', []):
+                self.velocities.pop(obj_id, None)
+        with self.lock:
+            self.frames += 1
+            self.bytes += size
+            for obj in objects:
+                if 'maxTemperature' in obj:
+                    self.max_temperature = obj['maxTemperature'] or 100.0
+                if 'temperature' in obj:
+                    self.temperature = obj['temperature']
+                if 'velocity' not in obj:
+                    continue
+                # A pooled projectile fired again only sends the velocity components that changed
+                velocity: Dict[str, float] = self.velocities.setdefault(obj['id'], {'x': 0.0, 'y': 0.0})
+                velocity.update(obj['velocity'])
+                if self.probes:
+                    angle: float = math.degrees(math.atan2(velocity['y'], velocity['x'])) % 360.0
+                    for probe, sent in list(self.probes.items()):
+                        if abs((angle - probe + 180.0) % 360.0 - 180.0) < 0.005:
+                            self.latencies.append((received - sent) * 1000.0)
+                            del self.probes[probe]
+
+    def start(self) -> None:
+        """Start sending inputs."""
+        self.thread = threading.Thread(target=self.play, daemon=True)
+        self.thread.start()
+
+    def stop(self) -> None:
+        """Stop sending inputs and disconnect."""
+        self.stopped.set()
+        if self.thread is not None:
+            self.thread.join(timeout=5)
+        if self.client.connected:
+            self.client.disconnect()
+
+    def expire_probes(self, now: float) -> None:
+        """Count the bursts that never produced a projectile as missed."""
+        with self.lock:
+            for probe, sent in list(self.probes.items()):
+                if now - sent > PROBE_TIMEOUT:
+                    self.missed += 1
+                    del self.probes[probe]
+
+    def play(self) -> None:
+        """
+        Input stream of the player: movement presses, fire bursts separated by
+        pauses, and cooling when the ship is hot, scheduled on one thread.
+        """
+        rng: random.Random = self.random
+        now: float = time.perf_counter()
+        move_key: Optional[str] = None
+        next_move: float = now + rng.uniform(0.0, 0.5)
+        firing: bool = False
+        angle: float = 0.0
+        burst_end: float = 0.0
+        next_fire: float = now + rng.uniform(0.0, 1.0)
+        while not self.stopped.is_set():
+            now = time.perf_counter()
+            self.expire_probes(now)
+
+            if now >= next_move:
+                if move_key is None:
+                    move_key = rng.choice(MOVE_KEYS)
+                    self.emit('key_down', {'key': move_key})
+                    next_move = now + rng.uniform(0.2, 0.8)
+                else:
+                    self.emit('key_up', {'key': move_key})
+                    move_key = None
+                    next_move = now + rng.uniform(0.1, 0.6)
+
+            if not firing and not self.cooling and self.temperature >= HOT * self.max_temperature:
+                self.cooling = True
+                self.emit('key_down', {'key': 'cool'})
+                next_fire = now + 1.0
+            elif now >= next_fire:
+                if self.cooling:
+                    self.cooling = False
+                    self.emit('key_up', {'key': 'cool'})
+                    next_fire = now + rng.uniform(0.0, 0.5)
+                elif not firing:
+                    firing = True
+                    if rng.random() < 0.1:
+                        self.emit('weapon_select', {'weapon': rng.randint(1, 4)})
+                    angle = round(rng.uniform(0.0, 360.0), 2)
+                    # A crewmate cooling the ship holds every cannon: not a latency sample
+                    if not any(mate.cooling for mate in self.crew):
+                        with self.lock:
+                            self.probes[angle % 360.0] = time.perf_counter()
+                    self.emit('rotate_shoot', {'angle': angle, 'firing': True})
+                    burst_end = now + rng.uniform(0.6, 2.0)
+                    next_fire = now + FIRE_REPEAT
+                elif now >= burst_end:
+                    firing = False
+                    self.emit('rotate_shoot', {'angle': angle, 'firing': False})
+                    # Longer than the cannon reload, so that the next burst fires at once
+                    next_fire = now + rng.uniform(0.5, 1.5)
+                else:
+                    self.emit('rotate_shoot', {'angle': angle, 'firing': True})
+                    next_fire = now + FIRE_REPEAT
+
+            self.stopped.wait(max(0.0, min(next_move, next_fire) - time.perf_counter()))
+
+        if move_key is not None:
+            self.emit('key_up', {'key': move_key})
+        if self.cooling:
+            self.emit('key_up', {'key': 'cool'})
+        if firing:
+            self.emit('rotate_shoot', {'angle': angle, 'firing': False})
+
+
+def get_status(url: str, token: Optional[str]) -> Dict[str, Any]:
+    """Get the room statistics of the server."""
+    headers: Dict[str, str] = {'X-Admin-Token': token} if token else {}
+    response = requests.get(f"{url}/admin/status", headers=headers, timeout=10.0)
+    response.raise_for_status()
+    return response.json()
+
+
+def stat(values: List[float], fraction: Optional[float] = None) -> Optional[float]:
+    """Percentile of the values, their mean when fraction is None, null in the report when there are none."""
+    if not values:
+        return None
+    return sum(values) / len(values) if fraction is None else percentile(values, fraction)
+
+
+def fmt(value: Optional[float], spec: str) -> str:
+    """Format a report value, 'n/a' when it could not be measured."""
+    return 'n/a' if value is None else format(value, spec)
+
+
+def server_report(before: Dict[str, Any], after: Dict[str, Any]) -> Dict[str, Any]:
+    """Sum the loop counters of every room over the measurement, from two status snapshots."""
+    totals: Dict[str, float] = {'ticks': 0, 'overruns': 0, 'dropped_ticks': 0}
+    tick_p50: List[float] = []
+    tick_p99: List[float] = []
+    objects: Dict[str, int] = {}
+    for code, loop in after['loops'].items():
+        if not loop:
+            continue  # Sharded room not reported yet
+        start: Dict[str, Any] = (before['loops'].get(code) or {}).get('simulation', {})
+        for name in totals:
+            totals[name] += loop['simulation'][name] - start.get(name, 0)
+        tick: Optional[Dict[str, float]] = loop.get('profile', {}).get('phases', {}).get('tick')
+        if tick:
+            tick_p50.append(tick['p50'] * 1000.0)
+            tick_p99.append(tick['p99'] * 1000.0)
+        for name, count in loop.get('objects', {}).items():
+            objects[name] = objects.get(name, 0) + count
+    return {
+        'rooms': after['rooms'],
+        'players': after['players'],
+        'ticks': totals['ticks'],
+        'overruns': totals['overruns'],
+        'overrun_rate': totals['overruns'] / totals['ticks'] if totals['ticks'] else None,
+        'dropped_ticks': totals['dropped_ticks'],
+        # Worst room
+        'tick_ms_p50': max(tick_p50, default=None),
+        'tick_ms_p99': max(tick_p99, default=None),
+        'objects': objects,
+        'workers': after.get('workers', []),
+    }
+
+
+def run(args: argparse.Namespace) -> Dict[str, Any]:
+    """Start the server if needed, play, measure, and build the report."""
+    server: Optional[subprocess.Popen] = None
+    url: str = args.url or f"http://127.0.0.1:{args.port}"
+    if not args.url:
+        server = subprocess.Popen(
+            [sys.executable, os.path.join(ROOT, 'headless.py'), '--async-mode', args.async_mode,
+             '--host', '127.0.0.1', '--port', str(args.port), '--tick-rate', str(args.tick_rate),
+             '--emit-rate', str(args.emit_rate), '--workers', str(args.workers), '--autostart'],
+            cwd=ROOT, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+    players: List[SimulatedPlayer] = [SimulatedPlayer(index, args.seed + index) for index in range(args.clients)]
+    connected: List[SimulatedPlayer] = []
+    try:
+        if not wait_for_server(url, timeout=15.0):
+            raise RuntimeError(f"No server answering on {url}")
+
+        lock = threading.Lock()
+
+        def mate_room(player: SimulatedPlayer) -> Optional[str]:
+            return f"LT{player.index // args.room_size:02d}" if args.room_size else None
+
+        def connect(player: SimulatedPlayer) -> None:
+            if player.connect(url, mate_room(player), timeout=10.0):
+                with lock:
+                    connected.append(player)
+
+        start: float = time.perf_counter()
+        threads: List[threading.Thread] = [threading.Thread(target=connect, args=(player,), daemon=True)
+                                           for player in players]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join(15.0)
+        connect_time: float = time.perf_counter() - start
+
+        for player in connected:
+            player.crew = [mate for mate in connected if mate_room(mate) == mate_room(player)]
+        for player in connected:
+            player.start()
+        time.sleep(args.warmup)
+
+        before: Dict[str, Any] = get_status(url, args.admin_token)
+        for player in connected:
+            player.reset()
+        start = time.perf_counter()
+        time.sleep(args.seconds)
+        elapsed: float = time.perf_counter() - start
+        after: Dict[str, Any] = get_status(url, args.admin_token)
+        for player in connected:
+            player.lock.acquire()
+        # Counters frozen at the same time for every player
+        results: List[Dict[str, Any]] = [{
+            'frames': player.frames, 'bytes': player.bytes, 'inputs': player.inputs,
+            'latencies': list(player.latencies), 'missed': player.missed, 'connected': player.client.connected,
+        } for player in connected]
+        for player in connected:
+            player.lock.release()
+    finally:
+        for player in connected:
+            player.stop()
+        if server is not None:
+            server.terminate()
+            server.wait(timeout=10)
+
+    frame_rates: List[float] = [result['frames'] / elapsed for result in results]
+    byte_rates: List[float] = [result['bytes'] / elapsed for result in results]
+    latencies: List[float] = [latency for result in results for latency in result['latencies']]
+    return {
+        'config': {
+            'url': args.url, 'clients': args.clients, 'room_size': args.room_size, 'seconds': args.seconds,
+            'warmup': args.warmup, 'seed': args.seed, 'async_mode': None if args.url else args.async_mode,
+            'tick_rate': None if args.url else args.tick_rate, 'emit_rate': None if args.url else args.emit_rate,
+            'workers': None if args.url else args.workers, 'cpus': os.cpu_count(),
+        },
+        'clients': {
+            'connected': len(connected),
+            'dropped': sum(1 for result in results if not result['connected']),
+            'connect_time': connect_time,
+        },
+        'frames_per_second': {
+            'mean': stat(frame_rates),
+            'min': min(frame_rates, default=None),
+            'p50': stat(frame_rates, 0.50),
+        },
+        'bytes_per_second': {
+            'mean': stat(byte_rates),
+            'max': max(byte_rates, default=None),
+            'total': sum(byte_rates),
+        },
+        'inputs_per_second': sum(result['inputs'] for result in results) / elapsed,
+        'latency_ms': {
+            'samples': len(latencies),
+            'missed': sum(result['missed'] for result in results),
+            'p50': stat(latencies, 0.50),
+            'p95': stat(latencies, 0.95),
+            'p99': stat(latencies, 0.99),
+            'max': max(latencies, default=None),
+        },
+        'server': server_report(before, after),
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--clients', type=int, default=50, help='simulated players')
+    parser.add_argument('--room-size', type=int, default=4, help='players per room, 0 to put them all in the main room')
+    parser.add_argument('--seconds', type=float, default=30.0, help='measurement duration')
+    parser.add_argument('--warmup', type=float, default=3.0, help='play time before the measurement')
+    parser.add_argument('--seed', type=int, default=1, help='seed of the input streams')
+    parser.add_argument('--report', default='load_test_report.json', help='path of the JSON report')
+    parser.add_argument('--url', help='test a running server instead of starting headless.py')
+    parser.add_argument('--admin-token', default=os.environ.get('PILOT_ADMIN_TOKEN'),
+                        help='admin token of the server, for /admin/status (PILOT_ADMIN_TOKEN)')
+    parser.add_argument('--port', type=int, default=5098, help='port of the started server')
+    parser.add_argument('--async-mode', default='eventlet', help='networking backend of the started server')
+    parser.add_argument('--tick-rate', type=float, default=60.0, help='simulation ticks per second of the started server')
+    parser.add_argument('--emit-rate', type=float, default=30.0, help='state broadcasts per second of the started server')
+    parser.add_argument('--workers', type=int, default=0, help='worker processes of the started server')
+    args = parser.parse_args()
+    if args.clients <= 0 or args.room_size < 0:
+        parser.error("--clients must be positive and --room-size not negative")
+
+    report: Dict[str, Any] = run(args)
+    with open(args.report, 'w') as file:
+        json.dump(report, file, indent=2, allow_nan=False)
+
+    clients, frames, latency, server = (report['clients'], report['frames_per_second'], report['latency_ms'],
+                                        report['server'])
+    print(f"{clients['connected']}/{args.clients} clients connected in {clients['connect_time']:.2f} s, "
+          f"{clients['dropped']} dropped, {server['rooms']} rooms, {os.cpu_count()} CPUs")
+    print(f"frames/s per client   mean {fmt(frames['mean'], '.1f')}  min {fmt(frames['min'], '.1f')}")
+    print(f"bytes/s per client    mean {fmt(report['bytes_per_second']['mean'], '.0f')}  "
+          f"max {fmt(report['bytes_per_second']['max'], '.0f')}")
+    print(f"input to state ms     p50 {fmt(latency['p50'], '.1f')}  p95 {fmt(latency['p95'], '.1f')}  "
+          f"p99 {fmt(latency['p99'], '.1f')}  ({latency['samples']} samples, {latency['missed']} missed)")
+    print(f"server ticks          {server['ticks']}  overruns {server['overruns']} "
+          f"({fmt(server['overrun_rate'], '.1%')})  dropped {server['dropped_ticks']}  "
+          f"tick p99 {fmt(server['tick_ms_p99'], '.2f')} ms")
+    print(f"Report written to {args.report}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,157 @@
+import struct
+from typing import Any, Dict, List, Optional
+
+class BinaryStateCodec:
+    """
+    Compact binary encoding of a full game state frame, sent as a Socket.IO binary attachment.
+    Numeric fields are packed little-endian in fixed records instead of JSON
+    dicts, image URLs and non-numeric object IDs are replaced by small indexes
+    into a string table sent at the start of the frame. Collider definitions,
+    only used by the debug view, are not included.
+
+    Frame layout:
+        header   '<2sBBIdHB' magic b'PT', version, reserved, tick, time (ms), object count, string count
+        strings  per string: u8 length + UTF-8 bytes
+        objects  '<iBBhffff' id, image index, flags, z_index, x, y, width, height
+                 + '<ffff'   image width, height, angle, opacity  if FLAG_IMAGE
+                 + '<ff'     health current, max                  if FLAG_HEALTH
+                 + '<ffB'    temperature, max temperature, active cannons  if FLAG_SHIP
+                 + '<ff'     velocity x, y (% per second)          if FLAG_VELOCITY
+    An object ID 'obj_<n>' is sent as n, any other ID as -(string index + 1).
+    """
+    MAGIC: bytes = b'PT'
+    VERSION: int = 3
+    NO_IMAGE: int = 0xFF
+
+    FLAG_ACTIVE: int = 1
+    FLAG_IMAGE: int = 2
+    FLAG_RELATIVE_SIZE: int = 4
+    FLAG_HEALTH: int = 8
+    FLAG_SHIP: int = 16
+    FLAG_VELOCITY: int = 32  # Straight-line movers, extrapolated by the client between frames
+
+    HEADER = struct.Struct('<2sBBIdHB')
+    OBJECT = struct.Struct('<iBBhffff')
+    IMAGE = struct.Struct('<ffff')
+    HEALTH = struct.Struct('<ff')
+    SHIP = struct.Struct('<ffB')
+    VELOCITY = struct.Struct('<ff')
+
+    def encode(self, tick: int, objects: List[Dict[str, Any]], time: float = 0.0) -> bytes:
+        """
+        Encode the state of a tick.
+
+        Args:
+            tick (int): Simulation tick of the state
+            objects (list): Object dicts of Game.get_state(), each with its 'id'
+            time (float): Simulation time of the tick in milliseconds
+
+        Returns:
+            bytes: The binary frame
+        """
+        strings: List[str] = []
+        string_indexes: Dict[str, int] = {}
+
+        def string_index(value: str) -> int:
+            index: Optional[int] = string_indexes.get(value)
+            if index is None:
+                index = string_indexes[value] = len(strings)
+                strings.append(value)
+            return index
+
+        body = bytearray()
+        for obj in objects:
+            obj_id: str = obj['id']
+            if obj_id.startswith('obj_') and obj_id[4:].isdigit():
+                numeric_id: int = int(obj_id[4:])
+            else:
+                numeric_id = -(string_index(obj_id) + 1)
+
+            flags: int = self.FLAG_ACTIVE if obj.get('active', True) else 0
+            image: Optional[Dict[str, Any]] = obj.get('image')
+            image_index: int = self.NO_IMAGE
+            if image is not None:
+                flags |= self.FLAG_IMAGE
+                image_index = string_index(image['url'])
+                if image.get('useRelativeSize'):
+                    flags |= self.FLAG_RELATIVE_SIZE
+            health: Optional[Dict[str, Any]] = obj.get('health')
+            if health is not None:
+                flags |= self.FLAG_HEALTH
+            if 'temperature' in obj:
+                flags |= self.FLAG_SHIP
+            velocity: Optional[Dict[str, float]] = obj.get('velocity')
+            if velocity is not None:
+                flags |= self.FLAG_VELOCITY
+
+            body += self.OBJECT.pack(numeric_id, image_index, flags, obj.get('z_index', 0),
+                                     obj['x'], obj['y'], obj['width'], obj['height'])
+            if image is not None:
+                body += self.IMAGE.pack(image['width'], image['height'], image['angle'], image['opacity'])
+            if health is not None:
+                body += self.HEALTH.pack(health['current'], health['max'])
+            if flags & self.FLAG_SHIP:
+                body += self.SHIP.pack(obj['temperature'], obj['maxTemperature'], obj['active_cannons'])
+            if velocity is not None:
+                body += self.VELOCITY.pack(velocity['x'], velocity['y'])
+
+        if len(strings) >= self.NO_IMAGE:
+            raise ValueError("Too many distinct image URLs and object names for a binary frame")
+        frame = bytearray(self.HEADER.pack(self.MAGIC, self.VERSION, 0, tick & 0xFFFFFFFF, time, len(objects),
+                                           len(strings)))
+        for value in strings:
+            encoded: bytes = value.encode('utf-8')
+            frame.append(len(encoded))
+            frame += encoded
+        frame += body
+        return bytes(frame)
+
+    def decode(self, frame: bytes) -> Dict[str, Any]:
+        """
+        Decode a binary frame back to a state dict, as the client does.
+
+        Args:
+            frame (bytes): A frame built by encode()
+
+        Returns:
+            dict: 'tick', 'time' and 'gameObjects' (without colliders)
+        """
+        magic, version, _, tick, time, object_count, string_count = self.HEADER.unpack_from(frame, 0)
+        if magic != self.MAGIC or version != self.VERSION:
+            raise ValueError("Not a binary state frame")
+        offset: int = self.HEADER.size
+        strings: List[str] = []
+        for _ in range(string_count):
+            length: int = frame[offset]
+            strings.append(bytes(frame[offset + 1:offset + 1 + length]).decode('utf-8'))
+            offset += 1 + length
+
+        objects: List[Dict[str, Any]] = []
+        for _ in range(object_count):
+            numeric_id, image_index, flags, z_index, x, y, width, height = self.OBJECT.unpack_from(frame, offset)
+            offset += self.OBJECT.size
+            obj: Dict[str, Any] = {
+                'id': f"obj_{numeric_id}" if numeric_id >= 0 else strings[-numeric_id - 1],
+                'x': x, 'y': y, 'width': width, 'height': height,
+                'active': bool(flags & self.FLAG_ACTIVE),
+                'z_index': z_index
+            }
+            if flags & self.FLAG_IMAGE:
+                image_width, image_height, angle, opacity = self.IMAGE.unpack_from(frame, offset)
+                offset += self.IMAGE.size
+                obj['image'] = {'url': strings[image_index], 'width': image_width, 'height': image_height,
+                                'angle': angle, 'opacity': opacity,
+                                'useRelativeSize': bool(flags & self.FLAG_RELATIVE_SIZE)}
+            if flags & self.FLAG_HEALTH:
+                current, maximum = self.HEALTH.unpack_from(frame, offset)
+                offset += self.HEALTH.size
+                obj['health'] = {'current': current, 'max': maximum}
+            if flags & self.FLAG_SHIP:
+                obj['temperature'], obj['maxTemperature'], obj['active_cannons'] = self.SHIP.unpack_from(frame, offset)
+                offset += self.SHIP.size
+            if flags & self.FLAG_VELOCITY:
+                velocity_x, velocity_y = self.VELOCITY.unpack_from(frame, offset)
+                offset += self.VELOCITY.size
+                obj['velocity'] = {'x': velocity_x, 'y': velocity_y}
+            objects.append(obj)
+        return {'tick': tick, 'time': time, 'gameObjects': objects}
@@ -0,0 +1,103 @@
+import math
+from typing import Dict, List, Set, Tuple, TYPE_CHECKING
+if TYPE_CHECKING:
+    from game_object import GameObject
+
+class BroadPhase:
+    """
+    Base broad phase for collision detection.
+    Selects the pairs of objects handed to the narrow phase (collides_with).
+    This implementation tests every pair (brute force) and is kept as the reference.
+    """
+    def find_pairs(self, objects: List[Tuple[str, 'GameObject']]) -> List[Tuple[int, int]]:
+        """
+        Find the candidate pairs among a list of collider objects.
+
+        Args:
+            objects (list): (obj_id, GameObject) tuples, all with at least one collider
+
+        Returns:
+            list: (i, j) index pairs with i < j, sorted in ascending order
+        """
+        count: int = len(objects)
+        return [(i, j) for i in range(count) for j in range(i + 1, count)]
+
+    def narrow_phase(self, i: int, obj1: 'GameObject', j: int, obj2: 'GameObject') -> bool:
+        """
+        Run the narrow phase on a candidate pair returned by find_pairs.
+
+        Args:
+            i (int): Index of the first object in the list given to find_pairs
+            obj1 (GameObject): First game object
+            j (int): Index of the second object
+            obj2 (GameObject): Second game object
+
+        Returns:
+            bool: True if the objects collide
+        """
+        return obj1.collides_with(obj2)
+
+
+class SpatialHashBroadPhase(BroadPhase):
+    """
+    Uniform grid broad phase (spatial hash).
+    Each object is inserted in every cell its collider bounds overlap and only
+    objects sharing a cell become candidate pairs. Cells are hashed by their
+    integer coordinates, so objects outside the 0-100 playfield are handled too.
+    """
+    # Padding added to the bounds so that rounding in rotated corners never drops a touching pair
+    EPSILON: float = 1e-6
+
+    def __init__(self, cell_size: float = 10.0):
+        """
+        Initialize the spatial hash.
+
+        Args:
+            cell_size (float): Size of a grid cell in playfield units (0-100)
+        """
+        if cell_size <= 0:
+            raise ValueError("cell_size must be positive")
+        self.cell_size: float = cell_size
+
+    def find_pairs(self, objects: List[Tuple[str, 'GameObject']]) -> List[Tuple[int, int]]:
+        """
+        Find the candidate pairs among a list of collider objects.
+        Pairs are returned in the same order as the brute force loop, so collision
+        handlers run in the same sequence and give the same results.
+
+        Args:
+            objects (list): (obj_id, GameObject) tuples, all with at least one collider
+
+        Returns:
+            list: (i, j) index pairs with i < j, sorted in ascending order
+        """
+        inv_cell: float = 1.0 / self.cell_size
+        eps: float = self.EPSILON
+        cells: Dict[Tuple[int, int], List[int]] = {}
+
+        for index, (_, obj) in enumerate(objects):
+            min_x, min_y, max_x, max_y = obj.get_collider_bounds()
+            x0: int = math.floor((min_x - eps) * inv_cell)
+            x1: int = math.floor((max_x + eps) * inv_cell)
+            y0: int = math.floor((min_y - eps) * inv_cell)
+            y1: int = math.floor((max_y + eps) * inv_cell)
+            for cx in range(x0, x1 + 1):
+                for cy in range(y0, y1 + 1):
+                    cell = cells.get((cx, cy))
+                    if cell is None:
+                        cells[(cx, cy)] = [index]
+                    else:
+                        cell.append(index)
+
+        # Indices are appended in increasing order, so members[a] < members[b]
+        pairs: Set[Tuple[int, int]] = set()
+        for members in cells.values():
+            count: int = len(members)
+            if count < 2:
+                continue
+            for a in range(count - 1):
+                first: int = members[a]
+                for b in range(a + 1, count):
+                    pairs.add((first, members[b]))
+
+        return sorted(pairs)
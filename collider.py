@@ -7,6 +7,7 @@ class Collider:
     Defines a collider for game objects to enable collision detection.
     Currently implements a rotatable rectangle collider.
     """
+    __slots__ = ('width', 'height', 'offset', 'angle', '_local_key', '_local_corners', '_shape_key', '_shape')
     
     def __init__(self, width: float = 0, height: float = 0, offset_x: float = 0, offset_y: float = 0, angle: float = 0):
         """
@@ -24,6 +25,24 @@ class Collider:
         self.offset: Vector = Vector(offset_x, offset_y)
         self.angle: float = angle  # Rotation in radians
         
+        # Cached rotated corner offsets and world-space shape, see get_world_shape
+        self._local_key: Optional[Tuple[float, float, float]] = None
+        self._local_corners: List[Tuple[float, float]] = []
+        self._shape_key: Optional[Tuple[float, ...]] = None
+        self._shape: Tuple[List[Tuple[float, float]], List[Tuple[float, float]]] = ([], [])
+        
+    def resize(self, width: float, height: float) -> None:
+        """
+        Change the size of the collider and drop the cached shape.
+        
+        Args:
+            width (float): New width of the collider
+            height (float): New height of the collider
+        """
+        self.width = width
+        self.height = height
+        self._shape_key = None
+        
     def get_corners(self, position: Vector) -> List[Vector]:
         """
         Get the four corners of the collider based on a given position.
@@ -55,11 +74,75 @@ class Collider:
             rotated_corners.append(world_corner)
             
         return rotated_corners
+
+    def get_bounds(self, position: Vector) -> Tuple[float, float, float, float]:
+        """
+        Get the axis-aligned bounding box of the collider in world space.
+        For rotated colliders the box encloses all four rotated corners.
+
+        Args:
+            position (Vector): The position of the game object
+
+        Returns:
+            tuple: (min_x, min_y, max_x, max_y)
+        """
+        center_x: float = position.x + self.offset.x
+        center_y: float = position.y + self.offset.y
+        half_w: float = self.width / 2
+        half_h: float = self.height / 2
+        if self.angle != 0:
+            cos_a: float = abs(math.cos(self.angle))
+            sin_a: float = abs(math.sin(self.angle))
+            half_w, half_h = half_w * cos_a + half_h * sin_a, half_w * sin_a + half_h * cos_a
+        return (center_x - half_w, center_y - half_h, center_x + half_w, center_y + half_h)
+
+    def get_world_shape(self, position: Vector) -> Tuple[List[Tuple[float, float]], List[Tuple[float, float]]]:
+        """
+        Get the world-space corners and SAT axes of the collider as float tuples.
+        The rotation is only recomputed when the angle or size changes and the
+        translation when the position or offset changes. The attributes are read
+        on every call, so changing them directly (not through resize) is safe.
+        
+        Args:
+            position (Vector): The position of the game object
+            
+        Returns:
+            tuple: (corners, axes), four (x, y) corners and the four normalized edge normals
+        """
+        key: Tuple[float, ...] = (position.x, position.y, self.angle, self.width, self.height,
+                                  self.offset.x, self.offset.y)
+        if key == self._shape_key:
+            return self._shape
+        
+        local_key: Tuple[float, float, float] = (self.angle, self.width, self.height)
+        if local_key != self._local_key:
+            half_w: float = self.width / 2
+            half_h: float = self.height / 2
+            self._local_corners = []
+            for corner in (Vector(-half_w, -half_h), Vector(half_w, -half_h), Vector(half_w, half_h), Vector(-half_w, half_h)):
+                rotated: Vector = corner.rotate(self.angle)
+                self._local_corners.append((rotated.x, rotated.y))
+            self._local_key = local_key
+        
+        center_x: float = position.x + self.offset.x
+        center_y: float = position.y + self.offset.y
+        corners: List[Tuple[float, float]] = [(center_x + x, center_y + y) for x, y in self._local_corners]
+        axes: List[Tuple[float, float]] = []
+        for i in range(4):
+            x1, y1 = corners[i]
+            x2, y2 = corners[(i + 1) % 4]
+            normal: Vector = Vector(-(y2 - y1), x2 - x1).normalize()
+            axes.append((normal.x, normal.y))
+        
+        self._shape_key = key
+        self._shape = (corners, axes)
+        return self._shape
     
     def intersects(self, other: 'Collider', my_pos: Vector, other_pos: Vector) -> bool:
         """
         Check if this collider intersects with another collider.
-        Uses the Separating Axis Theorem (SAT) for rotated rectangles.
+        Unrotated pairs use an axis-aligned box test, rotated ones the
+        Separating Axis Theorem (SAT). Both give the same result for angle 0.
         
         Args:
             other (Collider): The other collider to check against
@@ -72,50 +155,35 @@ class Collider:
         # If either collider has zero size, no collision
         if self.width == 0 or self.height == 0 or other.width == 0 or other.height == 0:
             return False
-            
-        # Get the corners of both colliders
-        corners_a: List[Vector] = self.get_corners(my_pos)
-        corners_b: List[Vector] = other.get_corners(other_pos)
-        
-        # Get the axes to test (perpendicular to each side)
-        axes: List[Vector] = []
-        
-        # Axes from this collider
-        for i in range(len(corners_a)):
-            edge: Vector = corners_a[(i + 1) % len(corners_a)] - corners_a[i]
-            normal: Vector = Vector(-edge.y, edge.x).normalize()
-            axes.append(normal)
-            
-        # Axes from other collider
-        for i in range(len(corners_b)):
-            edge: Vector = corners_b[(i + 1) % len(corners_b)] - corners_b[i]
-            normal: Vector = Vector(-edge.y, edge.x).normalize()
-            axes.append(normal)
-        
-        # Test projection overlap on each axis
-        for axis in axes:
-            # Project both colliders onto the axis
-            min_a: float = float('inf')
-            max_a: float = float('-inf')
-            min_b: float = float('inf')
-            max_b: float = float('-inf')
-            
-            # Project first collider
-            for corner in corners_a:
-                projection: float = axis.dot(corner)
-                min_a = min(min_a, projection)
-                max_a = max(max_a, projection)
+        
+        # Axis-aligned fast path, touching edges count as a collision like in SAT
+        if self.angle == 0 and other.angle == 0:
+            center_ax: float = my_pos.x + self.offset.x
+            center_ay: float = my_pos.y + self.offset.y
+            center_bx: float = other_pos.x + other.offset.x
+            center_by: float = other_pos.y + other.offset.y
+            half_aw: float = self.width / 2
+            half_ah: float = self.height / 2
+            half_bw: float = other.width / 2
+            half_bh: float = other.height / 2
+            return not (center_ax + half_aw < center_bx - half_bw or center_bx + half_bw < center_ax - half_aw or
+                        center_ay + half_ah < center_by - half_bh or center_by + half_bh < center_ay - half_ah)
+        
+        corners_a, axes_a = self.get_world_shape(my_pos)
+        corners_b, axes_b = other.get_world_shape(other_pos)
+        
+        # Test projection overlap on each axis (perpendicular to each side)
+        for axes in (axes_a, axes_b):
+            for axis_x, axis_y in axes:
+                # Project first collider
+                projections_a: List[float] = [axis_x * x + axis_y * y for x, y in corners_a]
+                # Project second collider
+                projections_b: List[float] = [axis_x * x + axis_y * y for x, y in corners_b]
                 
-            # Project second collider
-            for corner in corners_b:
-                projection: float = axis.dot(corner)
-                min_b = min(min_b, projection)
-                max_b = max(max_b, projection)
-            
-            # Check for overlap
-            if max_a < min_b or max_b < min_a:
-                # Found a separating axis, no collision
-                return False
+                # Check for overlap
+                if max(projections_a) < min(projections_b) or max(projections_b) < min(projections_a):
+                    # Found a separating axis, no collision
+                    return False
         
         # No separating axis found, objects collide
         return True
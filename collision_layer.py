@@ -0,0 +1,83 @@
+from enum import Enum, IntFlag
+from typing import Dict, Tuple
+from tag import Tag
+
+
+class CollisionKind(Enum):
+    BODY = "body"              # Objects with health: spaceship, asteroids, enemy ships
+    PROJECTILE = "projectile"
+    BARRIER = "barrier"
+
+
+class CollisionLayer(IntFlag):
+    NONE = 0
+    PLAYER_BODY = 1
+    ENEMY_BODY = 2
+    NEUTRAL_BODY = 4
+    PLAYER_PROJECTILE = 8      # Projectiles targeting Tag.ENEMY
+    ENEMY_PROJECTILE = 16      # Projectiles targeting Tag.PLAYER
+    NEUTRAL_PROJECTILE = 32    # Projectiles targeting Tag.EMPTY
+    BARRIER = 64
+    DEFAULT = 128              # Objects that did not declare a layer
+    ALL = 255
+
+
+# Layer of an object, keyed on its tag and kind.
+# Projectiles are keyed on the tag they target, not on their own tag.
+LAYERS: Dict[Tuple[Tag, CollisionKind], CollisionLayer] = {
+    (Tag.PLAYER, CollisionKind.BODY):       CollisionLayer.PLAYER_BODY,
+    (Tag.ENEMY, CollisionKind.BODY):        CollisionLayer.ENEMY_BODY,
+    (Tag.EMPTY, CollisionKind.BODY):        CollisionLayer.NEUTRAL_BODY,
+    (Tag.ENEMY, CollisionKind.PROJECTILE):  CollisionLayer.PLAYER_PROJECTILE,
+    (Tag.PLAYER, CollisionKind.PROJECTILE): CollisionLayer.ENEMY_PROJECTILE,
+    (Tag.EMPTY, CollisionKind.PROJECTILE):  CollisionLayer.NEUTRAL_PROJECTILE,
+    (Tag.PLAYER, CollisionKind.BARRIER):    CollisionLayer.BARRIER,
+    (Tag.ENEMY, CollisionKind.BARRIER):     CollisionLayer.BARRIER,
+    (Tag.EMPTY, CollisionKind.BARRIER):     CollisionLayer.BARRIER,
+}
+
+# Layers each layer can interact with. Pairs missing from the matrix have no
+# on_collision effect (two asteroids, an asteroid and an enemy ship, two player
+# projectiles...) and are rejected before the narrow phase.
+COLLISION_MATRIX: Dict[CollisionLayer, CollisionLayer] = {
+    CollisionLayer.PLAYER_BODY:        CollisionLayer.ENEMY_BODY | CollisionLayer.ENEMY_PROJECTILE | CollisionLayer.DEFAULT,
+    CollisionLayer.ENEMY_BODY:         CollisionLayer.PLAYER_BODY | CollisionLayer.PLAYER_PROJECTILE | CollisionLayer.DEFAULT,
+    CollisionLayer.NEUTRAL_BODY:       CollisionLayer.NEUTRAL_PROJECTILE | CollisionLayer.DEFAULT,
+    CollisionLayer.PLAYER_PROJECTILE:  CollisionLayer.ENEMY_BODY | CollisionLayer.DEFAULT,
+    CollisionLayer.ENEMY_PROJECTILE:   CollisionLayer.PLAYER_BODY | CollisionLayer.BARRIER | CollisionLayer.DEFAULT,
+    CollisionLayer.NEUTRAL_PROJECTILE: CollisionLayer.NEUTRAL_BODY | CollisionLayer.DEFAULT,
+    CollisionLayer.BARRIER:            CollisionLayer.ENEMY_PROJECTILE | CollisionLayer.DEFAULT,
+    CollisionLayer.DEFAULT:            CollisionLayer.ALL,
+}
+
+
+def layer_for(tag: Tag, kind: CollisionKind) -> CollisionLayer:
+    """
+    Get the collision layer of an object from its tag and kind.
+
+    Args:
+        tag (Tag): Tag of the object (target tag for projectiles)
+        kind (CollisionKind): Kind of the object
+
+    Returns:
+        CollisionLayer: The matching layer, DEFAULT if none is declared
+    """
+    return LAYERS.get((tag, kind), CollisionLayer.DEFAULT)
+
+
+def mask_for(layer: CollisionLayer) -> CollisionLayer:
+    """
+    Get the collision mask of a layer from the collision matrix.
+    Layers combining several flags get the union of their masks.
+
+    Args:
+        layer (CollisionLayer): The layer
+
+    Returns:
+        CollisionLayer: Layers that objects on this layer can interact with
+    """
+    mask: CollisionLayer = CollisionLayer.NONE
+    for flag, flag_mask in COLLISION_MATRIX.items():
+        if layer & flag:
+            mask |= flag_mask
+    return mask
@@ -0,0 +1,153 @@
+from typing import Any, Dict, List, Optional, Tuple
+
+class DeltaEncoder:
+    """
+    Turns successive full game states into keyframes and deltas.
+    A keyframe carries every object in full. A delta is relative to the previous
+    frame and only carries the objects created since then (in full), the fields
+    that changed on the other objects (one level deep for the image and health
+    dicts) and the IDs of the removed objects. Fields an object no longer has
+    (colliders removed, image dropped) are listed in the 'cleared' key of its
+    update, a nested dict that lost keys is cleared and sent whole. Objects that only moved, the
+    bulk of a frame, are packed as [id, x, y] triples.
+    Static fields such as the image URL, sizes, z_index and colliders are
+    therefore only sent once. Floats are rounded to `precision` decimals so
+    sub-pixel jitter does not count as a change.
+    Every frame carries its tick and the simulation time of that tick, the
+    clock on which clients interpolate.
+    Objects whose dict is the same instance as in the previous frame (see
+    GameObject.get_state_dict) are neither rounded nor diffed again.
+    """
+    def __init__(self, keyframe_interval: int = 60, precision: Optional[int] = 3):
+        """
+        Initialize the encoder.
+
+        Args:
+            keyframe_interval (int): A full keyframe is produced every keyframe_interval frames
+            precision (int, optional): Decimals kept for float values, None to keep them as is
+        """
+        self.keyframe_interval: int = keyframe_interval
+        self.precision: Optional[int] = precision
+        self.frame_count: int = 0
+        # (tick, objects by ID, time) of the last encoded frame, replaced as a whole so other threads can read it
+        self.last_frame: Optional[Tuple[int, Dict[str, Dict[str, Any]], float]] = None
+        self.last_sources: Dict[str, Dict[str, Any]] = {}  # Unrounded dicts of the last frame, by ID
+
+    def encode(self, tick: int, objects: List[Dict[str, Any]], time: float = 0.0) -> Tuple[bool, Dict[str, Any]]:
+        """
+        Encode the state of a tick.
+
+        Args:
+            tick (int): Simulation tick of the state
+            objects (list): Object dicts of Game.get_state(), each with its 'id'
+            time (float): Simulation time of the tick in milliseconds
+
+        Returns:
+            tuple: (is_keyframe, frame) where frame is a keyframe or a delta message
+        """
+        previous: Optional[Tuple[int, Dict[str, Dict[str, Any]], float]] = self.last_frame
+        previous_sources: Dict[str, Dict[str, Any]] = self.last_sources
+        previous_objects: Dict[str, Dict[str, Any]] = previous[1] if previous is not None else {}
+        current: Dict[str, Dict[str, Any]] = {}
+        sources: Dict[str, Dict[str, Any]] = {}
+        for obj in objects:
+            obj_id: str = obj['id']
+            sources[obj_id] = obj
+            if previous_sources.get(obj_id) is obj:
+                current[obj_id] = previous_objects[obj_id]  # Unchanged since the last frame
+            else:
+                current[obj_id] = self._round(obj)
+        self.last_sources = sources
+        is_keyframe: bool = previous is None or self.frame_count % self.keyframe_interval == 0
+        self.frame_count += 1
+        self.last_frame = (tick, current, time)
+
+        if is_keyframe:
+            return True, {'tick': tick, 'time': time, 'keyframe': True, 'gameObjects': list(current.values())}
+
+        base_tick, base, _ = previous
+        created: List[Dict[str, Any]] = []
+        updated: List[Dict[str, Any]] = []
+        moved: List[List[Any]] = []
+        for obj_id, obj in current.items():
+            old: Optional[Dict[str, Any]] = base.get(obj_id)
+            if old is None:
+                created.append(obj)
+                continue
+            if old is obj:
+                continue
+            changes: Dict[str, Any] = self._diff(old, obj)
+            if changes.keys() == {'x', 'y'}:
+                moved.append([obj_id, changes['x'], changes['y']])
+            elif changes:
+                changes['id'] = obj_id
+                updated.append(changes)
+        removed: List[str] = [obj_id for obj_id in base if obj_id not in current]
+
+        return False, {
+            'tick': tick,
+            'time': time,
+            'baseTick': base_tick,
+            'created': created,
+            'moved': moved,
+            'updated': updated,
+            'removed': removed
+        }
+
+    def keyframe(self, last_frame: Optional[Tuple[int, Dict[str, Dict[str, Any]], float]] = None) -> Optional[Dict[str, Any]]:
+        """
+        Get the last encoded frame as a keyframe, the base of the next delta.
+        Used to resync a client that joined late or missed a frame.
+
+        Args:
+            last_frame (tuple, optional): A value of last_frame read earlier, defaults to the current one
+
+        Returns:
+            dict or None: The keyframe, None if nothing was encoded yet
+        """
+        if last_frame is None:
+            last_frame = self.last_frame
+        if last_frame is None:
+            return None
+        tick, objects, time = last_frame
+        return {'tick': tick, 'time': time, 'keyframe': True, 'gameObjects': list(objects.values())}
+
+    def _diff(self, old: Dict[str, Any], new: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Return the fields of new that differ from old, nested dicts only carry their changed keys.
+        Keys of old missing from new are listed in 'cleared', the client deletes them before
+        applying the other changes.
+        """
+        changes: Dict[str, Any] = {}
+        cleared: List[str] = [key for key in old if key not in new]
+        for key, value in new.items():
+            old_value: Any = old.get(key)
+            if value == old_value:
+                continue
+            if isinstance(value, dict) and isinstance(old_value, dict):
+                if old_value.keys() - value.keys():
+                    # Lost keys: replaced whole instead of merged
+                    cleared.append(key)
+                    changes[key] = value
+                else:
+                    changes[key] = {sub_key: sub_value for sub_key, sub_value in value.items()
+                                    if old_value.get(sub_key) != sub_value}
+            else:
+                changes[key] = value
+        if cleared:
+            changes['cleared'] = cleared
+        return changes
+
+    def _round(self, obj: Dict[str, Any]) -> Dict[str, Any]:
+        """Return a copy of an object dict with its floats rounded, nested dicts included."""
+        if self.precision is None:
+            return obj
+        rounded: Dict[str, Any] = {}
+        for key, value in obj.items():
+            if isinstance(value, float):
+                value = round(value, self.precision)
+            elif isinstance(value, dict):
+                value = {sub_key: round(sub_value, self.precision) if isinstance(sub_value, float) else sub_value
+                         for sub_key, sub_value in value.items()}
+            rounded[key] = value
+        return rounded
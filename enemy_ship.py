@@ -11,6 +11,11 @@ class EnemyShip(GameObjectWithHealth):
     """
     Ennemi se déplaçant en ligne droite, rebondissant sur les bords et tirant vers le joueur.
     """
+    __slots__ = ('direction', 'speed', 'fire_rate', 'projectile_speed', 'damage', 'last_shot_time',
+                 'min_x', 'max_x', 'min_y', 'max_y')
+    BATCHED_KINEMATICS: bool = True
+    KINEMATICS_BOUNDS: str = 'bounce'
+
     def __init__(self, game:'Game', x: float, y: float,
                  direction: Vector = Vector(1, 0),
                  speed: float = 25.0, fire_rate: float = 3.0,
@@ -33,22 +38,15 @@ class EnemyShip(GameObjectWithHealth):
         self.add_collider(width=width*1, height=height*1)
 
     def update(self, players: Dict[str, Any], player_keys: Dict[str, Any], delta_time: float) -> None:
-        # déplacement
-        self.position += self.direction * self.speed * delta_time
-
-        # rebonds
-        if self.position.x < self.min_x or self.position.x > self.max_x:
-            self.direction.x = -self.direction.x
-            self.position.x = max(self.min_x, min(self.position.x, self.max_x))
-        if self.position.y < self.min_y or self.position.y > self.max_y:
-            self.direction.y = -self.direction.y
-            self.position.y = max(self.min_y, min(self.position.y, self.max_y))
+        # déplacement, sauf si l'étape de cinématique groupée du jeu l'a déjà fait
+        if not self.kinematics_batched:
+            self.integrate(delta_time)
 
-        
         now = time.time()
         if now - self.last_shot_time >= self.fire_rate:
             direction_player = (self.game.get_spaceship_position() - self.position).normalize()
-            proj = Projectile(
+            proj = self.game.acquire(
+                Projectile,
                 game=self.game,
                 x=self.position.x, y=self.position.y,
                 direction=direction_player,
@@ -60,3 +58,17 @@ class EnemyShip(GameObjectWithHealth):
             )
             self.game.add_game_object(proj)
             self.last_shot_time = now
+
+    def integrate(self, delta_time: float) -> None:
+        # déplacement
+        self.position += self.direction * self.speed * delta_time
+
+        # rebonds
+        if self.position.x < self.min_x or self.position.x > self.max_x:
+            self.direction.x = -self.direction.x
+            self.position.x = max(self.min_x, min(self.position.x, self.max_x))
+            self.mark_dirty()  # nouvelle vitesse envoyée aux clients
+        if self.position.y < self.min_y or self.position.y > self.max_y:
+            self.direction.y = -self.direction.y
+            self.position.y = max(self.min_y, min(self.position.y, self.max_y))
+            self.mark_dirty()
@@ -0,0 +1,140 @@
+import json
+import time
+import threading
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Tuple
+
+class EncodedFrame:
+    """
+    A state frame already encoded to JSON, sent as is by FrameJSON.
+    Emitting it with Socket.IO costs a string concatenation per recipient
+    instead of a full serialization of the state dict.
+    """
+    __slots__ = ('payload',)
+
+    def __init__(self, payload: str):
+        """
+        Initialize the frame.
+
+        Args:
+            payload (str): Compact JSON encoding of the frame
+        """
+        self.payload: str = payload
+
+    def __len__(self) -> int:
+        """Size of the encoded frame in characters."""
+        return len(self.payload)
+
+
+class FrameJSON:
+    """
+    json module for Socket.IO that splices EncodedFrame payloads into the packets.
+    Pass it as SocketIO(app, json=FrameJSON) so emitted EncodedFrame arguments
+    are not serialized again for every client.
+    """
+    spliced: int = 0  # Number of packets that reused an encoded frame
+
+    @staticmethod
+    def dumps(obj: Any, **kwargs: Any) -> str:
+        """Serialize obj like json.dumps, inserting EncodedFrame payloads verbatim."""
+        if isinstance(obj, EncodedFrame):
+            FrameJSON.spliced += 1
+            return obj.payload
+        if isinstance(obj, list) and any(isinstance(item, EncodedFrame) for item in obj):
+            # Socket.IO packets are [event, *args]
+            FrameJSON.spliced += 1
+            return '[' + ','.join(item.payload if isinstance(item, EncodedFrame) else json.dumps(item, **kwargs)
+                                  for item in obj) + ']'
+        return json.dumps(obj, **kwargs)
+
+    @staticmethod
+    def loads(*args: Any, **kwargs: Any) -> Any:
+        """Deserialize like json.loads."""
+        return json.loads(*args, **kwargs)
+
+
+class FrameCache:
+    """
+    Encode-once cache of state frames keyed by (tick, channel).
+    A frame is serialized the first time it is requested for a tick and the
+    same EncodedFrame is handed to every later request of that tick, whether
+    it is the broadcast or a request_game_state answer. Only the most recent
+    frames are kept.
+    """
+    def __init__(self, max_entries: int = 8):
+        """
+        Initialize an empty cache.
+
+        Args:
+            max_entries (int): Number of encoded frames kept
+        """
+        self.max_entries: int = max_entries
+        self.frames: 'OrderedDict[Tuple[int, str], EncodedFrame]' = OrderedDict()
+        self.lock: threading.Lock = threading.Lock()
+        self.hits: int = 0
+        self.misses: int = 0
+        self.encode_time: float = 0.0
+        self.encoded_bytes: int = 0
+
+    def get(self, tick: int, channel: str, build: Callable[[], Any]) -> EncodedFrame:
+        """
+        Get the encoded frame of a tick, building and encoding it on the first request.
+
+        Args:
+            tick (int): Simulation tick of the frame
+            channel (str): Kind of frame, e.g. 'keyframe' or 'delta'
+            build (callable): Returns the frame data, only called on a miss
+
+        Returns:
+            EncodedFrame: The encoded frame
+        """
+        key: Tuple[int, str] = (tick, channel)
+        with self.lock:
+            frame = self.frames.get(key)
+            if frame is not None:
+                self.hits += 1
+                return frame
+
+        start: float = time.perf_counter()
+        frame = EncodedFrame(json.dumps(build(), separators=(',', ':')))
+        duration: float = time.perf_counter() - start
+
+        with self.lock:
+            # Another thread may have encoded it meanwhile, keep the first one
+            frame = self.frames.setdefault(key, frame)
+            while len(self.frames) > self.max_entries:
+                self.frames.popitem(last=False)
+            self.misses += 1
+            self.encode_time += duration
+            self.encoded_bytes += len(frame)
+        return frame
+
+    def put(self, tick: int, channel: str, frame: EncodedFrame) -> None:
+        """
+        Store an already encoded frame under another key.
+
+        Args:
+            tick (int): Simulation tick of the frame
+            channel (str): Kind of frame
+            frame (EncodedFrame): The encoded frame
+        """
+        with self.lock:
+            self.frames[(tick, channel)] = frame
+            while len(self.frames) > self.max_entries:
+                self.frames.popitem(last=False)
+
+    def get_stats(self) -> Dict[str, float]:
+        """
+        Get the cache statistics.
+
+        Returns:
+            dict: hits, misses (frames encoded), mean encode time in ms, mean frame size
+                  and the number of packets that reused an encoded frame
+        """
+        return {
+            'hits': self.hits,
+            'misses': self.misses,
+            'mean_encode_ms': self.encode_time / self.misses * 1000 if self.misses else 0.0,
+            'mean_frame_bytes': self.encoded_bytes / self.misses if self.misses else 0.0,
+            'spliced': FrameJSON.spliced
+        }
@@ -1,44 +1,74 @@
-import time
 import logging
 import threading
 from spaceship import SpaceShip
-from key_touch import KeyTouch
+from player_input import PlayerInputs
 from game_object import GameObject
-from typing import Dict, List, Optional, Any, Tuple, Union
+from broad_phase import BroadPhase, SpatialHashBroadPhase
+from kinematics import KinematicsSystem
+from object_pool import ObjectPool
+from game_loop import FixedTimestepScheduler
+from state_broadcaster import StateBroadcaster
+from interest import DEFAULT_VIEW, VIEWS
+from input_queue import InputQueue
+from tick_profiler import TickProfiler
+from async_mode import join_task, sleep, start_task
+from typing import Dict, List, Optional, Any, Tuple, Type, Union
 from vector import Vector
 
 class Game:
     """
     Main game class that manages the game state, objects, and logic.
     """
-    def __init__(self, socketio=None):
+    def __init__(self, socketio=None, tick_rate: float = 60.0, emit_rate: float = 30.0, wire_format: str = 'json',
+                 encode_once: bool = False, room: Optional[str] = None, shared_loop: bool = False):
         """
         Initialize a new game instance.
         
         Args:
             socketio: The SocketIO instance for emitting updates to clients
+            tick_rate (float): Simulation updates per second (fixed timestep)
+            emit_rate (float): State broadcasts per second
+            wire_format (str): State frame encoding, 'json' or the opt-in compact 'binary'
+            encode_once (bool): Serialize each state frame once for all clients, socketio must use json=FrameJSON
+            room (str, optional): Socket.IO room of the game's clients, None to send to every client
+            shared_loop (bool): Driven by a RoomManager instead of its own simulation and broadcast threads
         """
         self.socketio = socketio
+        self.room: Optional[str] = room
+        self.shared_loop: bool = shared_loop
         self.running: bool = False
         self.game_active: bool = False  # Indique si le jeu est actif ou en pause
-        self.update_thread: Optional[threading.Thread] = None
-        self.update_interval: float = 0.01  # 20 updates per second
+        self.update_thread: Any = None  # Loop task, a thread or a green thread (see async_mode)
+        # Held by each simulation tick, and by the broadcaster while it takes a snapshot
+        self.lock: threading.RLock = threading.RLock()
+        self.tick: int = 0  # Number of simulation ticks run
+        self.sim_time: float = 0.0  # Simulation time of the last tick in seconds, sent in the frames
+        # Per-phase durations and collision counts of the ticks, see /metrics
+        self.profiler: TickProfiler = TickProfiler()
+        # Fixed-timestep simulation, the state is sent by the broadcaster thread at its own rate
+        self.scheduler: FixedTimestepScheduler = FixedTimestepScheduler(self.update, tick_rate=tick_rate)
+        self.broadcaster: StateBroadcaster = StateBroadcaster(self, emit_rate=emit_rate, wire_format=wire_format,
+                                                              encode_once=encode_once)
         
         # Game objects
         self.spaceship: SpaceShip = SpaceShip(socketio=socketio, game=self)  # Passer socketio au vaisseau
         self.game_objects: Dict[str, GameObject] = {}  # Dictionary of game objects by ID
         self.next_object_id: int = 1  # For generating unique object IDs
+        self.broad_phase: BroadPhase = SpatialHashBroadPhase()  # Collision candidate pair selection
+        self.kinematics: KinematicsSystem = KinematicsSystem()  # Batched movement of straight-line movers
+        self.pools: Dict[type, ObjectPool] = {}  # Recycled objects by class, see acquire()
         
         # Add spaceship as a game object
         self.add_game_object(self.spaceship, "spaceship")
         
         # Player tracking
         self.players: Dict[str, Dict[str, Any]] = {}  # player_id -> player data
-        self.player_keys: Dict[str, Dict[str, KeyTouch]] = {}  # player_id -> key states
+        self.player_keys: PlayerInputs = PlayerInputs()  # Button masks and aggregate input of the players
+        self.player_views: Dict[str, str] = {}  # player_id -> name of the state view (see interest.VIEWS)
+        self.inputs: InputQueue = InputQueue()  # Key events from the handlers, applied at the start of each tick
         
         # Game state
         self.last_active_player: Optional[str] = None
-        self.last_update_time: Optional[float] = None
 
         # Add Adversity manager as a game object
         from adversity import Adversity
@@ -52,15 +82,16 @@ class Game:
             
         self.running = True
         self.game_active = True  # Marquer le jeu comme actif
-        self.last_update_time = time.time()
-        self.update_thread = threading.Thread(target=self._game_loop)
-        self.update_thread.daemon = True
-        self.update_thread.start()
+        self.scheduler.reset()
+        if not self.shared_loop:
+            self.update_thread = start_task(self.socketio, self._game_loop)
+            if self.socketio:
+                self.broadcaster.start()
         logging.info("Game loop started")
         
         # Notifier les clients que le jeu a démarré
         if self.socketio:
-            self.socketio.emit('game_started', {'active': True})
+            self.socketio.emit('game_started', {'active': True}, to=self.room)
     
     def pause(self) -> None:
         """Pause the game without stopping the thread"""
@@ -69,40 +100,83 @@ class Game:
         
         # Notifier les clients que le jeu est en pause
         if self.socketio:
-            self.socketio.emit('game_paused', {'active': False})
+            self.socketio.emit('game_paused', {'active': False}, to=self.room)
     
     def resume(self) -> None:
         """Resume the game after being paused"""
         self.game_active = True
-        self.last_update_time = time.time()  # Reset time to avoid big jumps
+        self.scheduler.reset()  # Reset time to avoid big jumps
         logging.info("Game resumed")
         
         # Notifier les clients que le jeu a repris
         if self.socketio:
-            self.socketio.emit('game_resumed', {'active': True})
+            self.socketio.emit('game_resumed', {'active': True}, to=self.room)
     
     def stop(self) -> None:
         """Stop the game loop"""
         self.running = False
+        self.broadcaster.stop()
         if self.update_thread:
-            self.update_thread.join(timeout=1.0)
+            join_task(self.update_thread, timeout=1.0)
             logging.info("Game loop stopped")
     
     def _game_loop(self) -> None:
-        """Main game update loop - runs in a separate thread"""
+        """Main game update loop - runs in a background task"""
         while self.running:
-            current_time: float = time.time()
-            
-            # Ne mettre à jour que si le jeu est actif
-            if self.game_active:
-                delta_time: float = current_time - self.last_update_time
-                self.last_update_time = current_time
-                
-                # Update game state
-                self.update(delta_time)
-            
-            # Sleep to maintain update frequency
-            time.sleep(self.update_interval)
+            sleep(self.socketio, self.run_due())
+    
+    def run_due(self) -> float:
+        """
+        Run the simulation ticks that are due, called by the game loop or a RoomManager.
+        
+        Returns:
+            float: Seconds to wait before the next tick is due
+        """
+        # Ne mettre à jour que si le jeu est actif
+        if self.game_active:
+            return self.scheduler.run_once()
+        self.scheduler.reset()
+        return self.scheduler.tick_interval
+    
+    def set_rates(self, tick_rate: float, emit_rate: float) -> None:
+        """
+        Change the simulation and broadcast frequencies.
+        
+        Args:
+            tick_rate (float): Simulation updates per second
+            emit_rate (float): State broadcasts per second
+        """
+        self.scheduler.set_rates(tick_rate, emit_rate)
+        self.broadcaster.set_rate(emit_rate)
+    
+    def get_loop_stats(self) -> Dict[str, Dict[str, Any]]:
+        """
+        Get the game loop statistics.
+        
+        Returns:
+            dict: 'simulation' (ticks, overruns, tick durations), 'broadcast' (emits, snapshot and emit durations),
+                  'profile' (per-phase percentiles, see TickProfiler) and 'objects' (count by class)
+        """
+        with self.lock:
+            objects: Dict[str, int] = {}
+            for obj in self.game_objects.values():
+                name: str = type(obj).__name__
+                objects[name] = objects.get(name, 0) + 1
+        return {
+            'simulation': self.scheduler.get_stats(),
+            'broadcast': self.broadcaster.get_stats(),
+            'profile': self.profiler.get_stats(),
+            'objects': objects
+        }
+    
+    def start_profile(self, ticks: int) -> None:
+        """
+        Profile the next ticks with cProfile, the report is then in get_loop_stats()['profile']['report'].
+        
+        Args:
+            ticks (int): Number of ticks to profile
+        """
+        self.profiler.start_capture(ticks)
     
     def add_game_object(self, obj: GameObject, obj_id: Optional[str] = None) -> str:
         """
@@ -120,8 +194,38 @@ class Game:
             self.next_object_id += 1
             
         self.game_objects[obj_id] = obj
+        self.kinematics.add(obj_id, obj)
         return obj_id
     
+    def acquire(self, object_class: Type[GameObject], **kwargs: Any) -> GameObject:
+        """
+        Build a game object, recycling a removed one when its class is pooled.
+        Classes opt in by declaring POOLED = True and a reset() method taking
+        the constructor arguments. The object still has to be added with add_game_object.
+        
+        Args:
+            object_class (type): Class of the object to build
+            **kwargs: Constructor arguments
+            
+        Returns:
+            GameObject: The new or recycled object
+        """
+        if not object_class.__dict__.get('POOLED', False):
+            return object_class(**kwargs)
+        pool: Optional[ObjectPool] = self.pools.get(object_class)
+        if pool is None:
+            pool = self.pools[object_class] = ObjectPool(object_class)
+        return pool.acquire(**kwargs)
+    
+    def get_pool_stats(self) -> Dict[str, Dict[str, float]]:
+        """
+        Get the usage statistics of every object pool.
+        
+        Returns:
+            dict: Class name -> pool statistics (hits, misses, released, free, hit_rate)
+        """
+        return {object_class.__name__: pool.get_stats() for object_class, pool in self.pools.items()}
+    
     def remove_game_object(self, obj_id: str) -> Optional[GameObject]:
         """
         Remove a game object from the game.
@@ -135,6 +239,7 @@ class Game:
         if obj_id in self.game_objects:
             obj: GameObject = self.game_objects[obj_id]
             del self.game_objects[obj_id]
+            self.kinematics.remove(obj_id)
             return obj
         return None
     
@@ -153,22 +258,36 @@ class Game:
     def update(self, delta_time: float) -> None:
         """
         Update all game objects and process player input.
+        Called by the scheduler with a fixed delta_time, the state is sent by the broadcaster.
         
         Args:
-            delta_time (float): Time elapsed since last update
-        """
-        # self.spaceship.update(self.players, self.player_keys, delta_time=delta_time)
+            delta_time (float): Simulation step in seconds
+        """
+        with self.lock:
+            profiler: TickProfiler = self.profiler
+            profiler.start_tick()
+            # Apply the input received since the last tick before anything reads it
+            self.apply_inputs()
+            profiler.mark('input')
+            
+            # self.spaceship.update(self.players, self.player_keys, delta_time=delta_time)
 
-        for obj_id, obj in list(self.game_objects.items()):  # Use list to avoid modification during iteration
-            obj.update(self.players, self.player_keys, delta_time=delta_time)
-        
-        self.cleanup_inactive_objects()
+            # Move all straight-line movers at once, their update() only runs the remaining logic
+            self.kinematics.step(delta_time)
+            profiler.mark('kinematics')
 
-        self.check_collisions()
-        
-        if self.socketio:
-            game_state: Dict[str, Any] = self.get_state()
-            self.socketio.emit('game_state_update', game_state)
+            for obj_id, obj in list(self.game_objects.items()):  # Use list to avoid modification during iteration
+                obj.update(self.players, self.player_keys, delta_time=delta_time)
+            profiler.mark('objects')
+            
+            self.cleanup_inactive_objects()
+            profiler.mark('cleanup')
+
+            self.check_collisions()
+            profiler.mark('collisions')
+            self.tick += 1
+            self.sim_time += delta_time
+            profiler.end_tick()
 
     def cleanup_inactive_objects(self) -> None:
         """
@@ -176,20 +295,47 @@ class Game:
         """
         inactive_ids: List[str] = [obj_id for obj_id, obj in self.game_objects.items() if not obj.active]
         for obj_id in inactive_ids:
-            self.remove_game_object(obj_id)
+            obj: Optional[GameObject] = self.remove_game_object(obj_id)
+            # Dead objects of pooled classes are recycled by acquire()
+            pool: Optional[ObjectPool] = self.pools.get(type(obj))
+            if pool is not None:
+                pool.release(obj)
     
     def check_collisions(self) -> None:
         """Check for collisions between game objects."""
         collider_objects: List[Tuple[str, GameObject]] = [(obj_id, obj) for obj_id, obj in self.game_objects.items() 
                            if obj.has_collider() and obj.active]
         
-        for i in range(len(collider_objects)):
-            for j in range(i + 1, len(collider_objects)):
-                obj1_id, obj1 = collider_objects[i]
-                obj2_id, obj2 = collider_objects[j]
-                
-                if obj1.collides_with(obj2):
-                    self.handle_collision(obj1_id, obj1, obj2_id, obj2)
+        # The broad phase only returns pairs that may overlap, in brute force order
+        pairs: List[Tuple[int, int]] = self.broad_phase.find_pairs(collider_objects)
+        tested: int = 0
+        hits: int = 0
+        for i, j in pairs:
+            obj1_id, obj1 = collider_objects[i]
+            obj2_id, obj2 = collider_objects[j]
+            
+            # Skip pairs whose collision layers can never interact
+            if not obj1.can_collide_with(obj2):
+                continue
+            
+            tested += 1
+            if self.broad_phase.narrow_phase(i, obj1, j, obj2):
+                hits += 1
+                self.handle_collision(obj1_id, obj1, obj2_id, obj2)
+        
+        self.profiler.count('collision_objects', len(collider_objects))
+        self.profiler.count('collision_candidates', len(pairs))  # Pairs returned by the broad phase
+        self.profiler.count('collision_tests', tested)           # Pairs reaching the narrow phase
+        self.profiler.count('collision_hits', hits)
+    
+    def set_broad_phase(self, broad_phase: BroadPhase) -> None:
+        """
+        Replace the broad phase used by check_collisions.
+        
+        Args:
+            broad_phase (BroadPhase): The new broad phase (BroadPhase() for brute force)
+        """
+        self.broad_phase = broad_phase
     
     def handle_collision(self, obj1_id: str, obj1: GameObject, obj2_id: str, obj2: GameObject) -> None:
         """
@@ -215,19 +361,106 @@ class Game:
         """
         state: Dict[str, Any] = {}
         
-        game_objects: List[Dict[str, Any]] = []
-        for obj_id, obj in self.game_objects.items():
-            obj_data: Dict[str, Any] = obj.to_dict()
-            obj_data['id'] = obj_id
-            
-            if 'image' in obj_data:
-                obj_data['image']['useRelativeSize'] = True
-                
-            game_objects.append(obj_data)
+        # Objects reuse their previous dict unless they changed, these dicts must not be modified
+        game_objects: List[Dict[str, Any]] = [obj.get_state_dict(obj_id) for obj_id, obj in self.game_objects.items()]
         
         state['gameObjects'] = game_objects
         return state
     
+    def frame_time(self) -> float:
+        """
+        Get the timestamp of the current tick as sent in the state frames.
+        Clients interpolate between frames on this clock rather than on arrival times.
+        
+        Returns:
+            float: Simulation time in milliseconds
+        """
+        return round(self.sim_time * 1000.0, 1)
+    
+    def get_keyframe(self, view: str = DEFAULT_VIEW) -> Any:
+        """
+        Get a full state to (re)synchronize a client with the delta stream of its view.
+        This is the last frame sent by the broadcaster, on which the next delta is based.
+        
+        Args:
+            view (str): Name of the client's view
+        
+        Returns:
+            dict or EncodedFrame: Keyframe with 'tick', 'time', 'keyframe' and 'gameObjects', pre-encoded with encode_once
+        """
+        keyframe: Any = self.broadcaster.get_keyframe_payload(view)
+        if keyframe is None:
+            with self.lock:
+                ship_x, ship_y = self.spaceship.position.as_tuple()
+                objects: List[Dict[str, Any]] = VIEWS[view].select(self.get_state()['gameObjects'], ship_x, ship_y)
+                keyframe = {'tick': self.tick, 'time': self.frame_time(), 'keyframe': True, 'gameObjects': objects}
+        return keyframe
+    
+    def send_keyframe(self, player_id: str, view: Optional[str] = None) -> None:
+        """
+        Send a keyframe to a single client, to (re)synchronize it.
+        
+        Args:
+            player_id (str): Player's unique identifier, which is also its Socket.IO session id
+            view (str, optional): View of the keyframe, the player's view if None
+        """
+        if self.socketio:
+            keyframe: Any = self.get_keyframe(view or self.get_player_view(player_id))
+            self.socketio.emit('game_state_update', keyframe, to=player_id)
+    
+    def set_difficulty(self, difficulty: str) -> None:
+        """
+        Apply a difficulty preset to the adversity manager.
+        
+        Args:
+            difficulty (str): Name of a preset of adversity.DIFFICULTIES
+        """
+        with self.lock:
+            self.game_objects["adversity_manager"].apply_difficulty(difficulty)
+    
+    def repair(self) -> None:
+        """Repair the spaceship, asked by a player."""
+        with self.lock:
+            self.spaceship.repair()
+    
+    def set_player_view(self, player_id: str, view: str) -> bool:
+        """
+        Choose the state view of a player, the caller moves its socket to the view room.
+        
+        Args:
+            player_id (str): Player's unique identifier
+            view (str): Name of a view of interest.VIEWS
+            
+        Returns:
+            bool: True if the view was changed
+        """
+        with self.lock:
+            if player_id not in self.players or view not in VIEWS:
+                return False
+            self.player_views[player_id] = view
+            return True
+    
+    def get_player_view(self, player_id: str) -> str:
+        """
+        Get the state view of a player.
+        
+        Args:
+            player_id (str): Player's unique identifier
+            
+        Returns:
+            str: Name of the view
+        """
+        return self.player_views.get(player_id, DEFAULT_VIEW)
+    
+    def get_active_views(self) -> List[str]:
+        """
+        Get the views used by at least one player.
+        
+        Returns:
+            list: Names of the views
+        """
+        return sorted(set(self.player_views.values()))
+    
     def add_player(self, player_id: str, name: str) -> Dict[str, Any]:
         """
         Add a new player to the game.
@@ -236,26 +469,18 @@ class Game:
             player_id (str): Unique player identifier
             name (str): Player's display name
         """
+        with self.lock:
+            return self._add_player(player_id, name)
+    
+    def _add_player(self, player_id: str, name: str) -> Dict[str, Any]:
+        """Add a new player, the game lock must be held."""
         self.players[player_id] = {
             'id': player_id,
             'name': name
         }
+        self.player_views[player_id] = DEFAULT_VIEW
         
-        self.player_keys[player_id] = {
-            'up':          KeyTouch('up'),
-            'down':        KeyTouch('down'),
-            'left':        KeyTouch('left'),
-            'right':       KeyTouch('right'),
-            'shoot_up':    KeyTouch('shoot_up'),
-            'shoot_down':  KeyTouch('shoot_down'),
-            'shoot_left':  KeyTouch('shoot_left'),
-            'shoot_right': KeyTouch('shoot_right'),
-            'cool':        KeyTouch('cool'),
-            'shield':      KeyTouch('shield'),
-            'weapon':      KeyTouch('weapon', 1),  # Initial weapon = 1
-            'angle':       KeyTouch('angle', 0),   # Initial angle = 0
-            'shoot':       KeyTouch('shoot')       # Key to control rotational firing
-        }
+        self.player_keys.add(player_id)
         
         logging.info(f"Player {name} (ID: {player_id}) joined the game")
         return self.players[player_id]
@@ -270,13 +495,18 @@ class Game:
         Returns:
             dict or None: Removed player's data or None if player wasn't found
         """
+        with self.lock:
+            return self._remove_player(player_id)
+    
+    def _remove_player(self, player_id: str) -> Optional[Dict[str, Any]]:
+        """Remove a player, the game lock must be held."""
         if player_id in self.players:
             player_data: Dict[str, Any] = self.players[player_id]
             del self.players[player_id]
             
             # Clean up player's key states
-            if player_id in self.player_keys:
-                del self.player_keys[player_id]
+            self.player_keys.remove(player_id)
+            self.player_views.pop(player_id, None)
                 
             logging.info(f"Player {player_data['name']} (ID: {player_id}) left the game")
             return player_data
@@ -309,41 +539,58 @@ class Game:
     
     def handle_key_press(self, player_id: str, key_name: str, timestamp: Optional[float] = None) -> None:
         """
-        Handle a key press event from a player.
+        Handle a key press event from a player, applied at the start of the next tick.
         
         Args:
             player_id (str): Player's unique identifier
             key_name (str): Key that was pressed
             timestamp (float, optional): When the key was pressed
         """
-        if player_id in self.player_keys and key_name in self.player_keys[player_id]:
-            self.player_keys[player_id][key_name].press(timestamp)
-            logging.debug(f"Player {player_id} pressed {key_name}")
+        self.inputs.push(InputQueue.PRESS, player_id, key_name, timestamp=timestamp)
     
     def handle_key_release(self, player_id: str, key_name: str) -> None:
         """
-        Handle a key release event from a player.
+        Handle a key release event from a player, applied at the start of the next tick.
         
         Args:
             player_id (str): Player's unique identifier
             key_name (str): Key that was released
         """
-        if player_id in self.player_keys and key_name in self.player_keys[player_id]:
-            self.player_keys[player_id][key_name].release()
-            logging.debug(f"Player {player_id} released {key_name}")
+        self.inputs.push(InputQueue.RELEASE, player_id, key_name)
     
     def handle_key_value_update(self, player_id: str, key_name: str, value: Any) -> None:
         """
-        Update the value of a key for a player.
+        Update the value of a key for a player, applied at the start of the next tick.
         
         Args:
             player_id (str): Player's unique identifier
             key_name (str): Name of the key
             value (Any): New value for the key
         """
-        if player_id in self.player_keys and key_name in self.player_keys[player_id]:
-            self.player_keys[player_id][key_name].set_value(value)
-            logging.debug(f"Player {player_id} updated {key_name} to {value}")
+        self.inputs.push(InputQueue.VALUE, player_id, key_name, value=value)
+    
+    def apply_inputs(self) -> None:
+        """Apply the queued input commands to the player input state, called by the game thread."""
+        player_keys: PlayerInputs = self.player_keys
+        for kind, player_id, key_name, value, timestamp in self.inputs.drain():
+            # Commands of players who left or for unknown keys are ignored
+            if kind == InputQueue.PRESS:
+                if player_keys.press(player_id, key_name, timestamp):
+                    logging.debug(f"Player {player_id} pressed {key_name}")
+            elif kind == InputQueue.RELEASE:
+                if player_keys.release(player_id, key_name):
+                    logging.debug(f"Player {player_id} released {key_name}")
+            elif player_keys.set_value(player_id, key_name, value):
+                logging.debug(f"Player {player_id} updated {key_name} to {value}")
+    
+    def get_input_stats(self) -> Dict[str, int]:
+        """
+        Get the input queue statistics.
+        
+        Returns:
+            dict: Input events per tick, coalesced and deferred commands
+        """
+        return self.inputs.get_stats()
     
     def get_last_active_player(self) -> Optional[str]:
         """
@@ -0,0 +1,157 @@
+import time
+import logging
+import threading
+from typing import Any, Dict, List, Optional
+from game import Game
+from async_mode import join_task, sleep, start_task
+
+class GameHost:
+    """
+    Runs several games, one per room code, on two shared threads instead of
+    two per game: the simulation thread runs the ticks due in every room, and
+    the broadcast thread sends the state of every room at emit_rate.
+    Each game sends its events to its own Socket.IO room (see socket_room).
+    """
+
+    def __init__(self, socketio=None, tick_rate: float = 60.0, emit_rate: float = 30.0, wire_format: str = 'json',
+                 encode_once: bool = False, difficulty: str = 'normal'):
+        """
+        Initialize a host without rooms.
+
+        Args:
+            socketio: The SocketIO instance (or any object with its emit method) for emitting updates
+            tick_rate (float): Simulation updates per second of every room
+            emit_rate (float): State broadcasts per second of every room
+            wire_format (str): State frame encoding, 'json' or 'binary'
+            encode_once (bool): Serialize each state frame once for all clients, socketio must use json=FrameJSON
+            difficulty (str): Difficulty preset of the new rooms, see adversity.DIFFICULTIES
+        """
+        if tick_rate <= 0 or emit_rate <= 0:
+            raise ValueError("tick_rate and emit_rate must be positive")
+        self.socketio = socketio
+        self.tick_rate: float = tick_rate
+        self.emit_rate: float = emit_rate
+        self.emit_interval: float = 1.0 / emit_rate
+        self.wire_format: str = wire_format
+        self.encode_once: bool = encode_once
+        self.difficulty: str = difficulty
+        # Protects rooms, the Socket.IO handlers run on several threads
+        self.lock: threading.RLock = threading.RLock()
+        self.rooms: Dict[str, Game] = {}  # code -> game
+        self.running: bool = False
+        self.threads: List[Any] = []  # Loop tasks, threads or green threads (see async_mode)
+
+    @staticmethod
+    def socket_room(code: str) -> str:
+        """
+        Get the Socket.IO room of the clients of a room.
+
+        Args:
+            code (str): Room code
+
+        Returns:
+            str: Socket.IO room name
+        """
+        return f"room:{code}"
+
+    def add_room(self, code: str, difficulty: Optional[str] = None) -> Game:
+        """
+        Create the game of a room, not started yet.
+
+        Args:
+            code (str): Room code
+            difficulty (str, optional): Difficulty preset of the room, the host's one if None
+
+        Returns:
+            Game: The new game
+        """
+        game: Game = Game(self.socketio, tick_rate=self.tick_rate, emit_rate=self.emit_rate,
+                          wire_format=self.wire_format, encode_once=self.encode_once,
+                          room=self.socket_room(code), shared_loop=True)
+        game.set_difficulty(difficulty or self.difficulty)
+        with self.lock:
+            self.rooms[code] = game
+        logging.info(f"Room {code} created")
+        return game
+
+    def remove_room(self, code: str) -> Optional[Game]:
+        """
+        Stop and remove the game of a room.
+
+        Args:
+            code (str): Room code
+
+        Returns:
+            Game or None: The removed game, None if there is no such room
+        """
+        with self.lock:
+            game: Optional[Game] = self.rooms.pop(code, None)
+        if game is not None:
+            game.stop()
+            logging.info(f"Room {code} closed")
+        return game
+
+    def get_room(self, code: str) -> Optional[Game]:
+        """
+        Get the game of a room.
+
+        Args:
+            code (str): Room code
+
+        Returns:
+            Game or None: The game, None if there is no such room
+        """
+        return self.rooms.get(code)
+
+    def start(self) -> None:
+        """Start the shared simulation and broadcast threads"""
+        if self.running:
+            return
+        self.running = True
+        self.threads = [start_task(self.socketio, self._simulation_loop)]
+        if self.socketio:
+            self.threads.append(start_task(self.socketio, self._broadcast_loop))
+
+    def stop(self) -> None:
+        """Stop the shared threads and every game"""
+        self.running = False
+        for thread in self.threads:
+            join_task(thread, timeout=1.0)
+        self.threads = []
+        with self.lock:
+            games: List[Game] = list(self.rooms.values())
+        for game in games:
+            game.stop()
+
+    def _running_games(self) -> List[Game]:
+        """Snapshot of the games that were started."""
+        with self.lock:
+            return [game for game in self.rooms.values() if game.running]
+
+    def _simulation_loop(self) -> None:
+        """Run the ticks due in every room - runs in a background task"""
+        while self.running:
+            wait: float = 1.0 / self.tick_rate
+            for game in self._running_games():
+                try:
+                    wait = min(wait, game.run_due())
+                except Exception:
+                    logging.exception(f"Update of room {game.room} failed")
+            sleep(self.socketio, wait)
+
+    def _broadcast_loop(self) -> None:
+        """Send the state of every room - runs in a background task"""
+        next_time: float = time.perf_counter()
+        while self.running:
+            for game in self._running_games():
+                try:
+                    game.broadcaster.broadcast()
+                except Exception:
+                    logging.exception(f"State broadcast of room {game.room} failed")
+            next_time += self.emit_interval
+            wait: float = next_time - time.perf_counter()
+            if wait < 0:
+                # En retard : repartir de maintenant sans rattraper les envois manqués
+                next_time = time.perf_counter()
+                wait = 0.0
+            sleep(self.socketio, wait)
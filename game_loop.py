@@ -0,0 +1,130 @@
+import time
+from typing import Callable, Dict, Optional
+
+class FixedTimestepScheduler:
+    """
+    Fixed-timestep scheduler driving the game simulation and the state broadcast.
+    Real elapsed time, read from a monotonic clock, is added to an accumulator
+    that is consumed in steps of exactly 1 / tick_rate, so the simulation always
+    sees the same delta_time whatever the load. Broadcasts run at their own
+    emit_rate, independently of the simulation rate.
+    When the simulation falls behind, at most max_catch_up_ticks ticks are run
+    per call and the remaining backlog is dropped instead of spiralling.
+    """
+    def __init__(self, update: Callable[[float], None], emit: Optional[Callable[[], None]] = None,
+                 tick_rate: float = 60.0, emit_rate: float = 30.0, max_catch_up_ticks: int = 5,
+                 clock: Callable[[], float] = time.perf_counter):
+        """
+        Initialize the scheduler.
+
+        Args:
+            update (callable): Simulation step, called with the fixed delta_time in seconds
+            emit (callable, optional): State broadcast, called at emit_rate
+            tick_rate (float): Simulation ticks per second
+            emit_rate (float): Broadcasts per second
+            max_catch_up_ticks (int): Maximum ticks run by a single call to run_once()
+            clock (callable): Monotonic clock in seconds
+        """
+        self.update: Callable[[float], None] = update
+        self.emit: Optional[Callable[[], None]] = emit
+        self.clock: Callable[[], float] = clock
+        self.max_catch_up_ticks: int = max_catch_up_ticks
+        self.set_rates(tick_rate, emit_rate)
+        self.reset_stats()
+        self.reset()
+
+    def set_rates(self, tick_rate: float, emit_rate: float) -> None:
+        """
+        Change the simulation and broadcast frequencies.
+
+        Args:
+            tick_rate (float): Simulation ticks per second
+            emit_rate (float): Broadcasts per second
+        """
+        if tick_rate <= 0 or emit_rate <= 0:
+            raise ValueError("tick_rate and emit_rate must be positive")
+        self.tick_rate: float = tick_rate
+        self.emit_rate: float = emit_rate
+        self.tick_interval: float = 1.0 / tick_rate
+        self.emit_interval: float = 1.0 / emit_rate
+
+    def reset(self) -> None:
+        """Restart timing from now, discarding pending time (after a pause for instance)."""
+        now: float = self.clock()
+        self.last_time: float = now
+        self.accumulator: float = 0.0
+        self.next_emit_time: float = now
+
+    def reset_stats(self) -> None:
+        """Clear the tick and overrun statistics."""
+        self.ticks: int = 0
+        self.emits: int = 0
+        self.overruns: int = 0         # Ticks that took longer than tick_interval
+        self.dropped_ticks: int = 0    # Ticks skipped by the catch-up cap
+        self.total_tick_time: float = 0.0
+        self.max_tick_time: float = 0.0
+
+    def run_once(self) -> float:
+        """
+        Run the ticks and broadcast that are due.
+
+        Returns:
+            float: Seconds to wait before the next tick or broadcast is due
+        """
+        now: float = self.clock()
+        self.accumulator += now - self.last_time
+        self.last_time = now
+
+        ticks: int = 0
+        while self.accumulator >= self.tick_interval and ticks < self.max_catch_up_ticks:
+            start: float = self.clock()
+            self.update(self.tick_interval)
+            duration: float = self.clock() - start
+            self.accumulator -= self.tick_interval
+            ticks += 1
+            self.ticks += 1
+            self.total_tick_time += duration
+            self.max_tick_time = max(self.max_tick_time, duration)
+            if duration > self.tick_interval:
+                self.overruns += 1
+
+        # Trop de retard : abandonner le reste plutôt que de rattraper indéfiniment
+        if self.accumulator >= self.tick_interval:
+            dropped: int = int(self.accumulator / self.tick_interval)
+            self.dropped_ticks += dropped
+            self.accumulator -= dropped * self.tick_interval
+
+        now = self.clock()
+        if self.emit is not None and now >= self.next_emit_time:
+            self.emit()
+            self.emits += 1
+            self.next_emit_time += self.emit_interval
+            if self.next_emit_time <= now:
+                # Broadcasts are not caught up, skip to the next slot
+                self.next_emit_time = now + self.emit_interval
+
+        next_tick: float = self.tick_interval - self.accumulator - (self.clock() - self.last_time)
+        if self.emit is not None:
+            return max(0.0, min(next_tick, self.next_emit_time - self.clock()))
+        return max(0.0, next_tick)
+
+    def get_stats(self) -> Dict[str, float]:
+        """
+        Get the scheduler statistics.
+
+        Returns:
+            dict: Tick rate and count, overruns, dropped ticks, tick durations in ms, and broadcast rate and count when emit is set
+        """
+        stats: Dict[str, float] = {
+            'tick_rate': self.tick_rate,
+            'ticks': self.ticks,
+            'overruns': self.overruns,
+            'overrun_rate': self.overruns / self.ticks if self.ticks else 0.0,
+            'dropped_ticks': self.dropped_ticks,
+            'mean_tick_ms': self.total_tick_time / self.ticks * 1000 if self.ticks else 0.0,
+            'max_tick_ms': self.max_tick_time * 1000
+        }
+        if self.emit is not None:
+            stats['emit_rate'] = self.emit_rate
+            stats['emits'] = self.emits
+        return stats
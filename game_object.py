@@ -1,16 +1,24 @@
-from key_touch import KeyTouch
 from vector import Vector
 from collider import Collider
-from typing import List, Dict, Optional, Union, Any, TYPE_CHECKING
+from typing import List, Dict, Optional, Tuple, Union, Any, TYPE_CHECKING
 from tag import Tag
+from collision_layer import CollisionLayer, mask_for
 if TYPE_CHECKING:
     from game import Game
+    from player_input import PlayerInputs
 
 class GameObject:
     """
     Base class for all game objects.
     All game objects have a position and can be updated.
     """
+    __slots__ = ('game', 'position', 'width', 'height', 'active', 'kinematics_batched', 'colliders', 'tag', 'z_index',
+                 'collision_layer', 'collision_mask', 'image_url', 'image_width', 'image_height', 'image_angle',
+                 'image_opacity', '_static_state', '_state_cache', '_state_key')
+    # Straight-line movers set this to be moved by Game.kinematics instead of their own update()
+    BATCHED_KINEMATICS: bool = False
+    KINEMATICS_BOUNDS: str = 'cull'
+    
     def __init__(self, game:'Game', x: float = 0, y: float = 0, width: float = 0, height: float = 0, tag: Tag = Tag.EMPTY, z_index: int = 0):
         """
         Initialize a new game object.
@@ -29,16 +37,40 @@ class GameObject:
         self.width: float = width
         self.height: float = height
         self.active: bool = True
+        self.kinematics_batched: bool = False  # Set while registered in the batched kinematics stage
         self.colliders: List[Collider] = []
         self.tag: Tag = tag
         self.z_index: int = z_index
         
+        # Collision filtering (plain ints, checked for every candidate pair)
+        self.collision_layer: int = int(CollisionLayer.DEFAULT)
+        self.collision_mask: int = int(CollisionLayer.ALL)
+        
         # Image properties
         self.image_url: Optional[str] = None
         self.image_width: float = 0
         self.image_height: float = 0
         self.image_angle: float = 0  # Rotation in radians
         self.image_opacity: float = 1.0
+        
+        # Serialized state cache, see get_state_dict()
+        self._static_state: Optional[Dict[str, Any]] = None
+        self._state_cache: Optional[Dict[str, Any]] = None
+        self._state_key: Optional[Tuple] = None
+    
+    def revive(self, x: float, y: float) -> None:
+        """
+        Reactivate a recycled object at a new position.
+        The position Vector is reused, subclasses reset their own state in reset().
+        
+        Args:
+            x (float): New x position
+            y (float): New y position
+        """
+        self.position.x = float(x)
+        self.position.y = float(y)
+        self.active = True
+        self.mark_dirty()
     
     def get_position(self) -> Vector:
         """
@@ -80,6 +112,7 @@ class GameObject:
         """
         collider: Collider = Collider(width, height, offset_x, offset_y, angle)
         self.colliders.append(collider)
+        self.mark_dirty()
         return len(self.colliders) - 1
     
     def remove_collider(self, index: Optional[int] = None) -> None:
@@ -93,6 +126,32 @@ class GameObject:
             self.colliders = []
         elif 0 <= index < len(self.colliders):
             self.colliders.pop(index)
+        self.mark_dirty()
+    
+    def set_collision_layer(self, layer: CollisionLayer, mask: Optional[CollisionLayer] = None) -> None:
+        """
+        Declare the collision layer of this object and the layers it interacts with.
+        
+        Args:
+            layer (CollisionLayer): Layer of this object
+            mask (CollisionLayer, optional): Layers to test against, taken from the collision matrix if None
+        """
+        if mask is None:
+            mask = mask_for(layer)
+        self.collision_layer = int(layer)
+        self.collision_mask = int(mask)
+    
+    def can_collide_with(self, other: 'GameObject') -> bool:
+        """
+        Check if the collision layers of both objects allow them to interact.
+        
+        Args:
+            other (GameObject): The other game object
+            
+        Returns:
+            bool: True if the pair must go through the narrow phase
+        """
+        return bool(self.collision_layer & other.collision_mask or other.collision_layer & self.collision_mask)
     
     def has_collider(self) -> bool:
         """Check if this object has any colliders."""
@@ -114,6 +173,7 @@ class GameObject:
         self.image_height = height or self.height
         self.image_angle = angle
         self.image_opacity = max(0.0, min(1.0, opacity))  # Clamp between 0 and 1
+        self.mark_dirty()
     
     def has_image(self) -> bool:
         """Check if this object has an image."""
@@ -143,13 +203,13 @@ class GameObject:
         
         return False
     
-    def update(self, players: Dict, player_keys: Dict[int, Dict[str, KeyTouch]], delta_time: float) -> None:
+    def update(self, players: Dict, player_keys: 'PlayerInputs', delta_time: float) -> None:
         """
         Update the object state. Must be overridden by subclasses.
         
         Args:
             players (dict): Dictionary of players
-            player_keys (dict[int, dict[str, KeyTouch]]): Dictionary of player keys
+            player_keys (PlayerInputs): Input state of the players
             delta_time (float): Time elapsed since last update in seconds
         """
         pass
@@ -162,7 +222,20 @@ class GameObject:
             tuple: (x, y, width, height)
         """
         return (self.position.x, self.position.y, self.width, self.height)
-    
+
+    def get_collider_bounds(self) -> tuple:
+        """
+        Get the world-space bounding box enclosing all colliders of the object.
+
+        Returns:
+            tuple: (min_x, min_y, max_x, max_y)
+        """
+        if len(self.colliders) == 1:
+            return self.colliders[0].get_bounds(self.position)
+        bounds = [collider.get_bounds(self.position) for collider in self.colliders]
+        return (min(b[0] for b in bounds), min(b[1] for b in bounds),
+                max(b[2] for b in bounds), max(b[3] for b in bounds))
+
     def to_dict(self) -> Dict[str, Any]:
         """
         Convert the game object to a dictionary for sending to clients.
@@ -170,12 +243,44 @@ class GameObject:
         Returns:
             dict: Game object data
         """
-        data: Dict[str, Any] = {
+        data: Dict[str, Any] = self.dynamic_dict()
+        data.update(self.static_dict())
+        return data
+    
+    def dynamic_dict(self) -> Dict[str, Any]:
+        """
+        Fields of to_dict() that change while the object lives, matching state_key().
+        
+        Returns:
+            dict: Position and active flag, extended by subclasses
+        """
+        return {
             'x': self.position.x,
             'y': self.position.y,
+            'active': self.active
+        }
+    
+    def state_key(self) -> Tuple:
+        """
+        Values of the dynamic fields, compared on every get_state_dict() to detect a change.
+        Subclasses adding fields to dynamic_dict() add them here too.
+        
+        Returns:
+            tuple: Position and active flag
+        """
+        return (self.position.x, self.position.y, self.active)
+    
+    def static_dict(self) -> Dict[str, Any]:
+        """
+        Fields of to_dict() that only change through mark_dirty() methods (size, z_index, colliders, image,
+        velocity of straight-line movers).
+        
+        Returns:
+            dict: Static object data
+        """
+        data: Dict[str, Any] = {
             'width': self.width,
             'height': self.height,
-            'active': self.active,
             'z_index': self.z_index
         }
         
@@ -192,8 +297,53 @@ class GameObject:
                 'angle': self.image_angle,
                 'opacity': self.image_opacity
             }
+        
+        # Straight-line movers: velocity in % per second, lets clients extrapolate between frames
+        if self.BATCHED_KINEMATICS:
+            data['velocity'] = {'x': self.direction.x * self.speed, 'y': self.direction.y * self.speed}
             
         return data
+    
+    def mark_dirty(self) -> None:
+        """
+        Invalidate the cached serialized state after a change of a static field.
+        Called by set_image, add_collider, remove_collider and revive, code changing
+        the size, z_index, a collider or an image attribute directly must call it.
+        """
+        self._static_state = None
+        self._state_cache = None
+    
+    def get_state_dict(self, obj_id: str) -> Dict[str, Any]:
+        """
+        Serialized state of the object for Game.get_state, with its ID.
+        The previous dict is returned as long as state_key() is unchanged and the
+        object is not marked dirty. The static part (colliders, image) is only
+        rebuilt after mark_dirty(). The returned dict is shared between frames
+        and must not be modified.
+        
+        Args:
+            obj_id (str): ID of the object in the game
+            
+        Returns:
+            dict: Object data as in to_dict(), plus 'id' and image 'useRelativeSize'
+        """
+        key: Tuple = (obj_id, self.state_key())
+        if self._state_cache is not None and key == self._state_key:
+            return self._state_cache
+        
+        static: Optional[Dict[str, Any]] = self._static_state
+        if static is None:
+            static = self.static_dict()
+            if 'image' in static:
+                static['image']['useRelativeSize'] = True
+            self._static_state = static
+        
+        data: Dict[str, Any] = self.dynamic_dict()
+        data.update(static)  # Colliders and image sub-dicts are shared, never modified
+        data['id'] = obj_id
+        self._state_cache = data
+        self._state_key = key
+        return data
 
     def die(self) -> None:
         """
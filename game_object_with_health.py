@@ -1,16 +1,19 @@
 from game_object import GameObject
 from health import Health
-from typing import Dict, Any, Optional
+from typing import Dict, Any, Optional, Tuple
 from typing import TYPE_CHECKING
 if TYPE_CHECKING:
     from game import Game
 from tag import Tag
+from collision_layer import CollisionKind, layer_for
 
 class GameObjectWithHealth(GameObject):
     """
     Game object with health system.
     Can take damage and die when health is depleted.
     """
+    __slots__ = ('health',)
+
     def __init__(self, game:'Game', x: float = 0, y: float = 0, 
                  width: float = 0, height: float = 0, max_health: float = 100, tag: Tag = Tag.EMPTY,
                  z_index: int = 0):
@@ -29,6 +32,7 @@ class GameObjectWithHealth(GameObject):
         """
         super().__init__(game=game, x=x, y=y, width=width, height=height, tag=tag, z_index=z_index)
         self.health = Health(max_health)
+        self.set_collision_layer(layer_for(tag, CollisionKind.BODY))
     
     def getHit(self, damage: float) -> float:
         """
@@ -75,17 +79,25 @@ class GameObjectWithHealth(GameObject):
         """
         return self.health.getMaxHealth()
     
-    def to_dict(self) -> Dict[str, Any]:
+    def dynamic_dict(self) -> Dict[str, Any]:
         """
-        Convert the game object to a dictionary for sending to clients.
-        Include health information.
+        Dynamic fields of the game object, including health information.
         
         Returns:
             dict: Game object data with health
         """
-        data = super().to_dict()
+        data = super().dynamic_dict()
         data['health'] = {
             'current': self.health.getHealth(),
             'max': self.health.getMaxHealth()
         }
         return data
+    
+    def state_key(self) -> Tuple:
+        """
+        Values of the dynamic fields, including health.
+        
+        Returns:
+            tuple: Position, active flag and health
+        """
+        return (self.position.x, self.position.y, self.active, self.health.getHealth(), self.health.getMaxHealth())
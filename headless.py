@@ -0,0 +1,52 @@
+"""
+Run the game server without the Tk manager window, for machines without a display.
+
+Settings come from the command line or the PILOT_* environment variables
+(see ServerConfig and `python headless.py --help`). The main room is started
+at launch with --autostart, otherwise through the HTTP admin endpoints
+(see admin.py), which also replace the manager window for pausing and
+changing the difficulty. Tkinter is never imported.
+
+Usage:
+    python headless.py --port 5000 --tick-rate 60 --difficulty hard --autostart
+    PILOT_PORT=8000 PILOT_ADMIN_TOKEN=secret python headless.py
+    python headless.py --async-mode threading
+"""
+import os
+import sys
+import logging
+from typing import List, Optional
+import async_mode
+from server_config import ServerConfig
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    config: ServerConfig = ServerConfig.from_args(argv)
+    # Before the server and its locks are imported
+    async_mode.prepare(config.async_mode)
+    # server.py builds its rooms from the environment when it is imported
+    os.environ.update(config.to_env())
+    import server
+    from admin import create_admin_blueprint
+
+    server.app.register_blueprint(create_admin_blueprint(server.rooms, config.admin_token))
+    server.rooms.start()
+    if config.autostart:
+        server.game.start()
+
+    logging.info(f"Headless server on http://{config.host}:{config.port} "
+                 f"({config.tick_rate:g} ticks/s, {config.emit_rate:g} frames/s, difficulty {config.difficulty}, "
+                 f"{config.workers} workers, {config.async_mode} mode)")
+    if not config.autostart:
+        logging.info(f"Start the main room with: curl -X POST http://127.0.0.1:{config.port}/admin/start")
+    try:
+        server.socketio.run(server.app, host=config.host, port=config.port, debug=False, use_reloader=False)
+    except KeyboardInterrupt:
+        pass
+    finally:
+        print("Shutting down server...")
+        server.rooms.stop()
+
+
+if __name__ == '__main__':
+    main(sys.argv[1:])
@@ -2,6 +2,8 @@ class Health:
     """
     Class for managing health points for game objects.
     """
+    __slots__ = ('max_health', 'current_health')
+
     def __init__(self, max_health: float):
         """
         Initialize with maximum health value.
@@ -0,0 +1,112 @@
+from collections import deque
+from typing import Any, Deque, Dict, List, Optional, Set, Tuple
+
+# Input command: (kind, player_id, key_name, value, timestamp)
+InputCommand = Tuple[str, str, str, Any, Optional[float]]
+
+class InputQueue:
+    """
+    Input commands pushed by the Socket.IO handlers and applied by the game thread.
+    Handlers only append to a deque (atomic in CPython, no lock needed) and the
+    game drains it once at the start of each tick, so player input is never
+    mutated while Game.update iterates it and is applied in arrival order.
+    Repeated events of a tick are coalesced: duplicate presses and releases
+    are dropped, only the last value update of a key is kept, and a release
+    following a press in the same tick is deferred to the next tick so short
+    taps are still seen by one update.
+    """
+    PRESS: str = 'press'
+    RELEASE: str = 'release'
+    VALUE: str = 'value'
+
+    def __init__(self):
+        """Initialize an empty queue."""
+        self.commands: Deque[InputCommand] = deque()
+        self.last_tick_events: int = 0  # Commands received for the last drained tick
+        self.total_events: int = 0
+        self.max_tick_events: int = 0
+        self.coalesced: int = 0         # Commands dropped as redundant
+        self.deferred: int = 0          # Releases moved to the next tick
+        self.requeued: int = 0          # Commands put back at the head of the queue by the last drain
+
+    def push(self, kind: str, player_id: str, key_name: str, value: Any = None,
+             timestamp: Optional[float] = None) -> None:
+        """
+        Queue an input command, safe to call from any thread.
+
+        Args:
+            kind (str): PRESS, RELEASE or VALUE
+            player_id (str): Player's unique identifier
+            key_name (str): Name of the key
+            value (any, optional): New value for VALUE commands
+            timestamp (float, optional): When the key was pressed
+        """
+        self.commands.append((kind, player_id, key_name, value, timestamp))
+
+    def drain(self) -> List[InputCommand]:
+        """
+        Take the commands of this tick, coalesced. Called by the game thread only.
+
+        Returns:
+            list: Commands to apply, in arrival order
+        """
+        commands: Deque[InputCommand] = self.commands
+        # Only take what is queued now, commands pushed meanwhile go to the next tick
+        count: int = len(commands)
+        pending: List[InputCommand] = [commands.popleft() for _ in range(count)]
+
+        result: List[Optional[InputCommand]] = []
+        last_button: Dict[Tuple[str, str], str] = {}   # (player, key) -> last press/release kept this tick
+        value_index: Dict[Tuple[str, str], int] = {}   # (player, key) -> index in result of the last value update
+        deferred: List[InputCommand] = []
+        deferred_slots: Set[Tuple[str, str]] = set()
+        for command in pending:
+            kind, player_id, key_name = command[0], command[1], command[2]
+            slot: Tuple[str, str] = (player_id, key_name)
+            if kind == self.VALUE:
+                previous: Optional[int] = value_index.get(slot)
+                if previous is not None:
+                    result[previous] = None
+                    self.coalesced += 1
+                value_index[slot] = len(result)
+                result.append(command)
+            elif slot in deferred_slots:
+                # Keep the order of the key's events after a deferred release
+                deferred.append(command)
+            elif last_button.get(slot) == kind:
+                self.coalesced += 1
+            elif kind == self.RELEASE and last_button.get(slot) == self.PRESS:
+                deferred.append(command)
+                deferred_slots.add(slot)
+            else:
+                last_button[slot] = kind
+                result.append(command)
+
+        # Les relâchements différés passent en tête du prochain tick
+        for command in reversed(deferred):
+            commands.appendleft(command)
+        self.deferred += len(deferred_slots)
+
+        # Deferred commands were already counted when they arrived
+        events: int = count - self.requeued
+        self.requeued = len(deferred)
+        self.last_tick_events = events
+        self.total_events += events
+        self.max_tick_events = max(self.max_tick_events, events)
+        return [command for command in result if command is not None]
+
+    def get_stats(self) -> Dict[str, int]:
+        """
+        Get the input statistics.
+
+        Returns:
+            dict: Events of the last tick, total and max events per tick, coalesced and deferred commands
+        """
+        return {
+            'last_tick_events': self.last_tick_events,
+            'total_events': self.total_events,
+            'max_tick_events': self.max_tick_events,
+            'coalesced': self.coalesced,
+            'deferred': self.deferred,
+            'queued': len(self.commands)
+        }
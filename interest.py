@@ -0,0 +1,125 @@
+import math
+from typing import Any, Dict, List, Optional
+
+class InterestFilter:
+    """
+    Selects the objects of a state frame that are relevant to a client view.
+    Objects without an image (manager objects such as Adversity) and objects
+    entirely outside the visible playfield are dropped. When the estimated
+    frame size goes over the byte budget, objects are kept by priority:
+    highest z_index first, then closest to the spaceship.
+    Clients sharing a view share its frames (one Socket.IO room per view).
+    """
+    PLAYFIELD_MIN: float = 0.0    # Visible playfield in percent of the screen
+    PLAYFIELD_MAX: float = 100.0
+
+    def __init__(self, byte_budget: Optional[int] = None, max_distance: Optional[float] = None):
+        """
+        Initialize the filter.
+
+        Args:
+            byte_budget (int, optional): Maximum estimated size of a full frame in bytes, None for no limit
+            max_distance (float, optional): Only keep objects closer than this to the spaceship (percent of the screen)
+        """
+        self.byte_budget: Optional[int] = byte_budget
+        self.max_distance: Optional[float] = max_distance
+
+    def is_visible(self, obj: Dict[str, Any]) -> bool:
+        """
+        Check if an object can be seen by a client.
+
+        Args:
+            obj (dict): Object dict of the state frame
+
+        Returns:
+            bool: True if the object has an image that overlaps the playfield
+        """
+        image: Optional[Dict[str, Any]] = obj.get('image')
+        if image is None or not obj.get('active', True):
+            return False
+        # Images are centered on the object position
+        half_width: float = image['width'] / 2
+        half_height: float = image['height'] / 2
+        return (obj['x'] + half_width >= self.PLAYFIELD_MIN and obj['x'] - half_width <= self.PLAYFIELD_MAX and
+                obj['y'] + half_height >= self.PLAYFIELD_MIN and obj['y'] - half_height <= self.PLAYFIELD_MAX)
+
+    @staticmethod
+    def estimate_size(obj: Dict[str, Any]) -> int:
+        """
+        Estimate the JSON size of a full object entry without serializing it.
+
+        Args:
+            obj (dict): Object dict of the state frame
+
+        Returns:
+            int: Approximate size in bytes
+        """
+        size: int = 80  # id, x, y, active, width, height, z_index
+        size += 75 * len(obj.get('colliders', ()))
+        if 'image' in obj:
+            size += 120
+        if 'health' in obj:
+            size += 40
+        return size
+
+    def select(self, objects: List[Dict[str, Any]], ship_x: float, ship_y: float) -> List[Dict[str, Any]]:
+        """
+        Filter and prioritize the objects of a frame.
+
+        Args:
+            objects (list): Object dicts of Game.get_state()
+            ship_x (float): X position of the spaceship
+            ship_y (float): Y position of the spaceship
+
+        Returns:
+            list: The relevant objects, in their original order
+        """
+        visible: List[Dict[str, Any]] = [obj for obj in objects if self.is_visible(obj)]
+        if self.max_distance is not None:
+            visible = [obj for obj in visible
+                       if math.hypot(obj['x'] - ship_x, obj['y'] - ship_y) <= self.max_distance]
+        if self.byte_budget is None:
+            return visible
+
+        sizes: List[int] = [self.estimate_size(obj) for obj in visible]
+        if sum(sizes) <= self.byte_budget:
+            return visible
+
+        # Over budget: keep the highest z_index, then the objects closest to the ship
+        order: List[int] = sorted(range(len(visible)), key=lambda i: (
+            -visible[i].get('z_index', 0),
+            (visible[i]['x'] - ship_x) ** 2 + (visible[i]['y'] - ship_y) ** 2))
+        kept: List[bool] = [False] * len(visible)
+        budget: int = self.byte_budget
+        for i in order:
+            if sizes[i] > budget:
+                break
+            budget -= sizes[i]
+            kept[i] = True
+        return [obj for obj, keep in zip(visible, kept) if keep]
+
+
+DEFAULT_VIEW: str = 'full'
+
+# Views a client can pick with the 'set_view' event
+VIEWS: Dict[str, InterestFilter] = {
+    'full': InterestFilter(byte_budget=64 * 1024),
+    # Gunners only need the surroundings of the ship they aim from
+    'gunner': InterestFilter(byte_budget=16 * 1024, max_distance=40.0),
+}
+
+
+def view_room(view: str, room: Optional[str] = None) -> str:
+    """
+    Get the Socket.IO room of the clients using a view.
+
+    Args:
+        view (str): Name of the view
+        room (str, optional): Room of the game when the server hosts several, see RoomManager
+
+    Returns:
+        str: Room name
+    """
+    if room is not None:
+        return f"{room}:view:{view}"
+    return f"view:{view}"
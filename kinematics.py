@@ -0,0 +1,82 @@
+from typing import Dict, TYPE_CHECKING
+if TYPE_CHECKING:
+    from game_object import GameObject
+
+class KinematicsSystem:
+    """
+    Batched movement stage for straight-line movers (projectiles, asteroids, enemy ships).
+    Every registered mover is advanced in one tight loop that updates position
+    and direction in place, together with out-of-bounds culling and edge
+    bouncing, without the temporary Vector objects of the per-object path.
+    Objects opt in with BATCHED_KINEMATICS and skip their own movement in
+    update() while registered.
+    """
+    CULL: str = 'cull'      # Die when leaving the extended playfield
+    BOUNCE: str = 'bounce'  # Bounce on the min_x/max_x/min_y/max_y edges of the object
+
+    # Movers are culled outside this range (percentage of the playfield)
+    CULL_MIN: float = -10.0
+    CULL_MAX: float = 110.0
+
+    def __init__(self):
+        """Initialize the kinematics stage with no registered movers."""
+        self.movers: Dict[str, 'GameObject'] = {}
+
+    def add(self, obj_id: str, obj: 'GameObject') -> bool:
+        """
+        Register an object if it supports batched movement.
+
+        Args:
+            obj_id (str): ID of the game object
+            obj (GameObject): The game object
+
+        Returns:
+            bool: True if the object is now moved by this stage
+        """
+        if not getattr(obj, 'BATCHED_KINEMATICS', False):
+            return False
+        self.movers[obj_id] = obj
+        obj.kinematics_batched = True
+        return True
+
+    def remove(self, obj_id: str) -> None:
+        """
+        Unregister an object, its own update() moves it again.
+
+        Args:
+            obj_id (str): ID of the game object
+        """
+        obj = self.movers.pop(obj_id, None)
+        if obj is not None:
+            obj.kinematics_batched = False
+
+    def step(self, delta_time: float) -> None:
+        """
+        Advance every active mover by delta_time.
+
+        Args:
+            delta_time (float): Time elapsed since last update in seconds
+        """
+        cull_min: float = self.CULL_MIN
+        cull_max: float = self.CULL_MAX
+        for obj in self.movers.values():
+            if not obj.active:
+                continue
+            position = obj.position
+            direction = obj.direction
+            speed: float = obj.speed
+            position.x += direction.x * speed * delta_time
+            position.y += direction.y * speed * delta_time
+
+            if obj.KINEMATICS_BOUNDS == self.BOUNCE:
+                if position.x < obj.min_x or position.x > obj.max_x:
+                    direction.x = -direction.x
+                    position.x = max(obj.min_x, min(position.x, obj.max_x))
+                    obj.mark_dirty()  # Velocity sent to the clients
+                if position.y < obj.min_y or position.y > obj.max_y:
+                    direction.y = -direction.y
+                    position.y = max(obj.min_y, min(position.y, obj.max_y))
+                    obj.mark_dirty()
+            elif (position.x < cull_min or position.x > cull_max or
+                  position.y < cull_min or position.y > cull_max):
+                obj.die()
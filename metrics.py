@@ -0,0 +1,142 @@
+from typing import Any, Dict, List, Optional
+from flask import Blueprint, Response
+from admin import check_admin_access
+from room_manager import RoomManager
+from tick_profiler import QUANTILES
+
+CONTENT_TYPE: str = 'text/plain; version=0.0.4; charset=utf-8'
+
+# Profiler count -> stage label of the pilot_collision_pairs metric
+COLLISION_COUNTS: Dict[str, str] = {
+    'collision_candidates': 'candidates',
+    'collision_tests': 'tests',
+    'collision_hits': 'hits',
+}
+
+
+def _labels(labels: Dict[str, Any]) -> str:
+    """Format Prometheus labels, values escaped."""
+    if not labels:
+        return ''
+    escaped: List[str] = []
+    for name, value in labels.items():
+        text: str = str(value).replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
+        escaped.append(f'{name}="{text}"')
+    return '{' + ','.join(escaped) + '}'
+
+
+class MetricsWriter:
+    """
+    Builds a Prometheus text exposition. Samples are grouped by metric, as the
+    format requires, whatever order the rooms write them in.
+    """
+
+    def __init__(self):
+        """Initialize an empty exposition."""
+        self.metrics: Dict[str, List[str]] = {}  # Metric name -> HELP, TYPE and sample lines
+
+    def declare(self, name: str, kind: str, help_text: str) -> None:
+        """Write the header of a metric, once."""
+        if name not in self.metrics:
+            self.metrics[name] = [f"# HELP {name} {help_text}", f"# TYPE {name} {kind}"]
+
+    def sample(self, name: str, value: float, labels: Optional[Dict[str, Any]] = None,
+               suffix: str = '') -> None:
+        """Write a sample of a declared metric, suffix for the _sum and _count of summaries."""
+        self.metrics[name].append(f"{name}{suffix}{_labels(labels or {})} {float(value)!r}")
+
+    def summary(self, name: str, summary: Dict[str, float], labels: Dict[str, Any]) -> None:
+        """Write the quantiles, sum and count of a TickProfiler summary."""
+        for quantile in QUANTILES:
+            self.sample(name, summary[f"p{round(quantile * 100)}"], dict(labels, quantile=quantile))
+        self.sample(name, summary['sum'], labels, suffix='_sum')
+        self.sample(name, summary['count'], labels, suffix='_count')
+
+    def text(self) -> str:
+        """Get the exposition."""
+        return ''.join(line + '\n' for lines in self.metrics.values() for line in lines)
+
+
+def render_metrics(stats: Dict[str, Any]) -> str:
+    """
+    Format the hosting statistics of RoomManager.get_stats() in the Prometheus text format.
+    Quantiles are computed on the last ticks of each room (TickProfiler window),
+    sums and counts since the room was created.
+
+    Args:
+        stats (dict): Statistics of RoomManager.get_stats()
+
+    Returns:
+        str: The exposition
+    """
+    writer = MetricsWriter()
+    writer.declare('pilot_rooms', 'gauge', "Rooms hosted.")
+    writer.sample('pilot_rooms', stats['rooms'])
+    writer.declare('pilot_players', 'gauge', "Players connected.")
+    writer.sample('pilot_players', stats['players'])
+    if stats.get('workers'):
+        writer.declare('pilot_worker_load', 'gauge', "Measured load of a worker process, in cores.")
+        for index, load in enumerate(stats['workers']):
+            writer.sample('pilot_worker_load', load, {'worker': index})
+
+    for room, loop in sorted(stats['loops'].items()):
+        if not loop:
+            continue  # Sharded room not reported yet
+        labels: Dict[str, Any] = {'room': room}
+        simulation: Dict[str, Any] = loop['simulation']
+        writer.declare('pilot_ticks_total', 'counter', "Simulation ticks run.")
+        writer.sample('pilot_ticks_total', simulation['ticks'], labels)
+        writer.declare('pilot_tick_overruns_total', 'counter', "Ticks that took longer than the tick interval.")
+        writer.sample('pilot_tick_overruns_total', simulation['overruns'], labels)
+        writer.declare('pilot_dropped_ticks_total', 'counter', "Ticks dropped to catch up after a stall.")
+        writer.sample('pilot_dropped_ticks_total', simulation['dropped_ticks'], labels)
+        writer.declare('pilot_broadcasts_total', 'counter', "State broadcasts sent.")
+        writer.sample('pilot_broadcasts_total', loop['broadcast']['emits'], labels)
+
+        profile: Dict[str, Any] = loop.get('profile', {})
+        for phase, summary in sorted(profile.get('phases', {}).items()):
+            writer.declare('pilot_tick_phase_seconds', 'summary',
+                           "Duration of a phase of the tick (tick is the whole update).")
+            writer.summary('pilot_tick_phase_seconds', summary, dict(labels, phase=phase))
+        counts: Dict[str, Dict[str, float]] = profile.get('counts', {})
+        if 'collision_objects' in counts:
+            writer.declare('pilot_collision_objects', 'summary', "Objects with a collider checked per tick.")
+            writer.summary('pilot_collision_objects', counts['collision_objects'], labels)
+        for name, stage in COLLISION_COUNTS.items():
+            if name in counts:
+                writer.declare('pilot_collision_pairs', 'summary',
+                               "Collision pairs per tick: broad phase candidates, narrow phase tests, hits.")
+                writer.summary('pilot_collision_pairs', counts[name], dict(labels, stage=stage))
+        if 'profiling' in profile:
+            writer.declare('pilot_profile_capture_ticks', 'gauge', "Ticks left in the running cProfile capture.")
+            writer.sample('pilot_profile_capture_ticks', profile['profiling'], labels)
+
+        for class_name, count in sorted(loop.get('objects', {}).items()):
+            writer.declare('pilot_objects', 'gauge', "Game objects by class.")
+            writer.sample('pilot_objects', count, dict(labels, **{'class': class_name}))
+    return writer.text()
+
+
+def create_metrics_blueprint(rooms: RoomManager, token: Optional[str] = None) -> Blueprint:
+    """
+    Build the GET /metrics endpoint, for Prometheus.
+    Room codes let anyone join a room, so the endpoint is protected like the
+    admin endpoints: X-Admin-Token or Authorization: Bearer header, or local
+    requests only when no token is set.
+
+    Args:
+        rooms (RoomManager): The rooms of the server
+        token (str, optional): Expected token, None to only accept local requests
+
+    Returns:
+        Blueprint: The endpoint, to register on the Flask app
+    """
+    metrics = Blueprint('metrics', __name__)
+
+    @metrics.get('/metrics')
+    def export() -> Response:
+        """Export the loop statistics of every room"""
+        check_admin_access(token)
+        return Response(render_metrics(rooms.get_stats()), content_type=CONTENT_TYPE)
+
+    return metrics
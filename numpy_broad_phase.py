@@ -0,0 +1,121 @@
+from typing import List, Tuple, TYPE_CHECKING
+from broad_phase import BroadPhase
+try:
+    import numpy as np
+except ImportError:  # numpy is optional, only this backend needs it
+    np = None
+if TYPE_CHECKING:
+    from game_object import GameObject
+
+class NumpyBroadPhase(BroadPhase):
+    """
+    Vectorized collision backend.
+    Collider centres, half-extents and angles of all objects are packed into
+    contiguous NumPy arrays and the overlap matrix is computed with batched
+    array operations. For objects whose colliders are all axis-aligned the box
+    overlap is the exact result, so those pairs skip Collider.intersects.
+    Pairs involving a rotated collider still go through collides_with.
+    """
+    # Padding for the bounds of rotated colliders, like SpatialHashBroadPhase
+    EPSILON: float = 1e-6
+
+    def __init__(self, block_size: int = 512):
+        """
+        Initialize the backend.
+
+        Args:
+            block_size (int): Number of rows of the overlap matrix computed at once, bounds memory use
+        """
+        if np is None:
+            raise ImportError("NumpyBroadPhase requires numpy (pip install numpy)")
+        self.block_size: int = block_size
+        self._exact: List[bool] = []  # Per object: all colliders are axis-aligned
+
+    def find_pairs(self, objects: List[Tuple[str, 'GameObject']]) -> List[Tuple[int, int]]:
+        """
+        Find the overlapping pairs among a list of collider objects.
+        Pairs are returned in the same order as the brute force loop.
+
+        Args:
+            objects (list): (obj_id, GameObject) tuples, all with at least one collider
+
+        Returns:
+            list: (i, j) index pairs with i < j, sorted in ascending order
+        """
+        owners: List[int] = []
+        rows: List[Tuple[float, float, float, float, float]] = []
+        layers: List[int] = []
+        masks: List[int] = []
+        self._exact = []
+        for index, (_, obj) in enumerate(objects):
+            exact: bool = True
+            for collider in obj.colliders:
+                # Zero-sized colliders never intersect anything
+                if collider.width == 0 or collider.height == 0:
+                    continue
+                owners.append(index)
+                rows.append((obj.position.x + collider.offset.x, obj.position.y + collider.offset.y,
+                             collider.width / 2, collider.height / 2, collider.angle))
+                exact = exact and collider.angle == 0
+            self._exact.append(exact)
+            layers.append(obj.collision_layer)
+            masks.append(obj.collision_mask)
+
+        if len(rows) < 2:
+            return []
+
+        shapes = np.array(rows, dtype=np.float64)
+        owner = np.array(owners, dtype=np.int64)
+        layer = np.array(layers, dtype=np.int64)
+        mask = np.array(masks, dtype=np.int64)
+        center_x, center_y, half_w, half_h, angle = shapes.T
+
+        # Rotated colliders are tested through their enclosing box
+        rotated = angle != 0
+        cos_a = np.abs(np.cos(angle))
+        sin_a = np.abs(np.sin(angle))
+        ext_x = np.where(rotated, half_w * cos_a + half_h * sin_a + self.EPSILON, half_w)
+        ext_y = np.where(rotated, half_w * sin_a + half_h * cos_a + self.EPSILON, half_h)
+        min_x, max_x = center_x - ext_x, center_x + ext_x
+        min_y, max_y = center_y - ext_y, center_y + ext_y
+
+        count: int = len(rows)
+        firsts: List = []
+        seconds: List = []
+        for start in range(0, count, self.block_size):
+            stop: int = min(start + self.block_size, count)
+            block = slice(start, stop)
+            # Touching edges count as overlapping, like Collider.intersects
+            overlap = ~((max_x[block, None] < min_x[None, :]) | (max_x[None, :] < min_x[block, None]) |
+                        (max_y[block, None] < min_y[None, :]) | (max_y[None, :] < min_y[block, None]))
+            first, second = np.nonzero(overlap)
+            first += start
+            keep = owner[first] < owner[second]
+            firsts.append(owner[first[keep]])
+            seconds.append(owner[second[keep]])
+
+        first = np.concatenate(firsts)
+        second = np.concatenate(seconds)
+        # Drop pairs whose collision layers can never interact
+        keep = ((layer[first] & mask[second]) != 0) | ((layer[second] & mask[first]) != 0)
+        # Object pairs may appear once per overlapping collider pair
+        keys = np.unique(first[keep] * len(objects) + second[keep])
+        return [(int(key // len(objects)), int(key % len(objects))) for key in keys]
+
+    def narrow_phase(self, i: int, obj1: 'GameObject', j: int, obj2: 'GameObject') -> bool:
+        """
+        Run the narrow phase on a candidate pair.
+        Pairs of axis-aligned objects are already exact, only their active state is rechecked.
+
+        Args:
+            i (int): Index of the first object in the list given to find_pairs
+            obj1 (GameObject): First game object
+            j (int): Index of the second object
+            obj2 (GameObject): Second game object
+
+        Returns:
+            bool: True if the objects collide
+        """
+        if self._exact[i] and self._exact[j]:
+            return obj1.active and obj2.active
+        return obj1.collides_with(obj2)
@@ -0,0 +1,70 @@
+from typing import Any, Dict, List, Type, TYPE_CHECKING
+if TYPE_CHECKING:
+    from game_object import GameObject
+
+class ObjectPool:
+    """
+    Pool of recycled game objects of a single class.
+    Objects removed from the game are kept here and handed back by acquire()
+    through their reset() method instead of building a new instance, which
+    avoids the allocation churn of short-lived projectiles and asteroids.
+    """
+    def __init__(self, object_class: Type['GameObject'], max_size: int = 1024):
+        """
+        Initialize an empty pool.
+
+        Args:
+            object_class (type): Class of the pooled objects, must implement reset() with the __init__ arguments
+            max_size (int): Maximum number of free objects kept, extra released objects are dropped
+        """
+        self.object_class: Type['GameObject'] = object_class
+        self.max_size: int = max_size
+        self.free: List['GameObject'] = []
+        self.hits: int = 0      # acquire() served from the pool
+        self.misses: int = 0    # acquire() had to build a new object
+        self.released: int = 0  # Objects returned to the pool
+
+    def acquire(self, **kwargs: Any) -> 'GameObject':
+        """
+        Get an object initialized with the given arguments.
+
+        Args:
+            **kwargs: Arguments of the class constructor
+
+        Returns:
+            GameObject: A recycled or newly built object
+        """
+        if self.free:
+            obj = self.free.pop()
+            obj.reset(**kwargs)
+            self.hits += 1
+            return obj
+        self.misses += 1
+        return self.object_class(**kwargs)
+
+    def release(self, obj: 'GameObject') -> None:
+        """
+        Return an object that left the game to the pool.
+
+        Args:
+            obj (GameObject): The removed object
+        """
+        if len(self.free) < self.max_size:
+            self.free.append(obj)
+            self.released += 1
+
+    def get_stats(self) -> Dict[str, float]:
+        """
+        Get the pool usage statistics.
+
+        Returns:
+            dict: hits, misses, released, free and hit_rate (0.0 to 1.0)
+        """
+        requests: int = self.hits + self.misses
+        return {
+            'hits': self.hits,
+            'misses': self.misses,
+            'released': self.released,
+            'free': len(self.free),
+            'hit_rate': self.hits / requests if requests else 0.0
+        }
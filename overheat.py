@@ -2,6 +2,8 @@ class Overheat:
     """
     Gère la surchauffe : accumulation de chaleur, blocage des tirs et refroidissement.
     """
+    __slots__ = ('max_temp', 'temperature', 'heat_per_action', 'cool_rate', 'is_cooling')
+
     def __init__(self,
                  max_temp: float = 100.0,
                  heat_per_action: float = 3.0,
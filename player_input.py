@@ -0,0 +1,261 @@
+import math
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+class Button:
+    """
+    Bits of the buttons a player can hold. Plain ints rather than an IntFlag:
+    they are combined every tick and IntFlag operations allocate.
+    """
+    UP: int = 1
+    DOWN: int = 2
+    LEFT: int = 4
+    RIGHT: int = 8
+    SHOOT_UP: int = 16
+    SHOOT_DOWN: int = 32
+    SHOOT_LEFT: int = 64
+    SHOOT_RIGHT: int = 128
+    COOL: int = 256
+    SHIELD: int = 512
+    SHOOT: int = 1024  # Rotating cannon, aimed with the angle slot
+
+    MOVE: int = UP | DOWN | LEFT | RIGHT
+    SHOOT_DIRECTIONS: int = SHOOT_UP | SHOOT_DOWN | SHOOT_LEFT | SHOOT_RIGHT
+
+
+# Key names sent by the clients -> button bit
+BUTTONS: Dict[str, int] = {
+    'up': Button.UP,
+    'down': Button.DOWN,
+    'left': Button.LEFT,
+    'right': Button.RIGHT,
+    'shoot_up': Button.SHOOT_UP,
+    'shoot_down': Button.SHOOT_DOWN,
+    'shoot_left': Button.SHOOT_LEFT,
+    'shoot_right': Button.SHOOT_RIGHT,
+    'cool': Button.COOL,
+    'shield': Button.SHIELD,
+    'shoot': Button.SHOOT,
+}
+
+# Bit index of each button, for the per-button hold counts
+_BIT_INDEX: Dict[int, int] = {bit: bit.bit_length() - 1 for bit in BUTTONS.values()}
+
+
+class PlayerInput:
+    """
+    Input state of one player: a bitmask of the held buttons plus the typed
+    value slots of the rotating cannon.
+    """
+    __slots__ = ('buttons', 'angle', 'weapon', 'last_pressed')
+
+    def __init__(self):
+        """Initialize a player input with no button held."""
+        self.buttons: int = 0
+        self.angle: float = 0.0   # Aim of the rotating cannon in degrees
+        self.weapon: int = 1      # Selected rotating cannon (1-4)
+        self.last_pressed: float = 0  # Timestamp of the last press
+
+    def is_pressed(self, bit: int) -> bool:
+        """
+        Check if a button is held.
+
+        Args:
+            bit (int): Button bit
+
+        Returns:
+            bool: True if the button is held
+        """
+        return bool(self.buttons & bit)
+
+
+class PlayerInputs:
+    """
+    Input state of all the players of a game. Besides each player's own mask,
+    it keeps aggregate state updated on every press and release, so the
+    spaceship resolves the input of a tick in constant time whatever the
+    number of players:
+    - buttons: OR of the masks, a bit is set while at least one player holds it
+    - counts: number of players holding each button, used for movement which
+      sums the directions of all the players
+    - shooters: the players holding the rotating cannon button
+    """
+
+    def __init__(self):
+        """Initialize an empty input state."""
+        self.players: Dict[str, PlayerInput] = {}
+        self.buttons: int = 0
+        self.counts: List[int] = [0] * len(BUTTONS)
+        self.shooters: Dict[str, PlayerInput] = {}
+
+    def __contains__(self, player_id: str) -> bool:
+        return player_id in self.players
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self.players)
+
+    def __len__(self) -> int:
+        return len(self.players)
+
+    def get(self, player_id: str) -> Optional[PlayerInput]:
+        """
+        Get the input state of a player.
+
+        Args:
+            player_id (str): Player's unique identifier
+
+        Returns:
+            PlayerInput or None: The player's input, None if the player is unknown
+        """
+        return self.players.get(player_id)
+
+    def add(self, player_id: str) -> PlayerInput:
+        """
+        Register a player with no button held.
+
+        Args:
+            player_id (str): Player's unique identifier
+
+        Returns:
+            PlayerInput: The new input state of the player
+        """
+        self.remove(player_id)
+        player: PlayerInput = PlayerInput()
+        self.players[player_id] = player
+        return player
+
+    def remove(self, player_id: str) -> None:
+        """
+        Unregister a player, releasing the buttons they held.
+
+        Args:
+            player_id (str): Player's unique identifier
+        """
+        player: Optional[PlayerInput] = self.players.get(player_id)
+        if player is None:
+            return
+        buttons: int = player.buttons
+        while buttons:
+            bit: int = buttons & -buttons
+            self._release(player_id, player, bit)
+            buttons &= buttons - 1
+        del self.players[player_id]
+
+    def press(self, player_id: str, key_name: str, timestamp: Optional[float] = None) -> bool:
+        """
+        Mark a button as held by a player.
+
+        Args:
+            player_id (str): Player's unique identifier
+            key_name (str): Name of the key
+            timestamp (float, optional): When the key was pressed
+
+        Returns:
+            bool: True if the state changed, False otherwise
+        """
+        player: Optional[PlayerInput] = self.players.get(player_id)
+        bit: Optional[int] = BUTTONS.get(key_name)
+        if player is None or bit is None or player.buttons & bit:
+            return False
+        player.buttons |= bit
+        player.last_pressed = timestamp if timestamp is not None else 0
+        self.counts[_BIT_INDEX[bit]] += 1
+        self.buttons |= bit
+        if bit == Button.SHOOT:
+            self.shooters[player_id] = player
+        return True
+
+    def release(self, player_id: str, key_name: str) -> bool:
+        """
+        Mark a button as released by a player.
+
+        Args:
+            player_id (str): Player's unique identifier
+            key_name (str): Name of the key
+
+        Returns:
+            bool: True if the state changed, False otherwise
+        """
+        player: Optional[PlayerInput] = self.players.get(player_id)
+        bit: Optional[int] = BUTTONS.get(key_name)
+        if player is None or bit is None or not player.buttons & bit:
+            return False
+        self._release(player_id, player, bit)
+        return True
+
+    def _release(self, player_id: str, player: PlayerInput, bit: int) -> None:
+        """Clear a held button of a player and update the aggregate state."""
+        player.buttons &= ~bit
+        index: int = _BIT_INDEX[bit]
+        self.counts[index] -= 1
+        if self.counts[index] == 0:
+            self.buttons &= ~bit
+        if bit == Button.SHOOT:
+            self.shooters.pop(player_id, None)
+
+    def set_value(self, player_id: str, key_name: str, value: Any) -> bool:
+        """
+        Set a value slot of a player, converted to the slot's type.
+        Values come straight from the clients: an angle that is not a finite
+        number or a weapon that is not an integer is rejected, so that the
+        ship's cannon code never sees it.
+
+        Args:
+            player_id (str): Player's unique identifier
+            key_name (str): 'angle' (degrees) or 'weapon' (clamped to 1-4)
+            value (any): The new value
+
+        Returns:
+            bool: True if the value was stored, False for an unknown player or slot or an invalid value
+        """
+        player: Optional[PlayerInput] = self.players.get(player_id)
+        if player is None:
+            return False
+        try:
+            if key_name == 'angle':
+                angle: float = float(value)
+                if not math.isfinite(angle):
+                    return False
+                player.angle = angle
+            elif key_name == 'weapon':
+                player.weapon = max(1, min(4, int(value)))
+            else:
+                return False
+        except (TypeError, ValueError, OverflowError):
+            return False
+        return True
+
+    def is_pressed(self, bit: int) -> bool:
+        """
+        Check if any player holds a button.
+
+        Args:
+            bit (int): Button bit
+
+        Returns:
+            bool: True if at least one player holds it
+        """
+        return bool(self.buttons & bit)
+
+    def count(self, bit: int) -> int:
+        """
+        Get the number of players holding a button.
+
+        Args:
+            bit (int): Button bit
+
+        Returns:
+            int: Number of players
+        """
+        return self.counts[_BIT_INDEX[bit]]
+
+    def move_direction(self) -> Tuple[int, int]:
+        """
+        Get the sum of the movement directions held by all the players.
+
+        Returns:
+            tuple: (x, y) direction, not normalized
+        """
+        if not self.buttons & Button.MOVE:
+            return (0, 0)
+        counts: List[int] = self.counts
+        return (counts[3] - counts[2], counts[1] - counts[0])  # right - left, down - up
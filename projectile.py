@@ -2,6 +2,7 @@ from game_object import GameObject
 from game_object_with_health import GameObjectWithHealth
 from vector import Vector
 from tag import Tag
+from collision_layer import CollisionKind, CollisionLayer, layer_for
 from typing import List, Set, Dict, Any, Optional, TYPE_CHECKING
 if TYPE_CHECKING:
     from game import Game
@@ -10,6 +11,10 @@ class Projectile(GameObject):
     """
     A projectile that moves in a straight line and can damage game objects.
     """
+    __slots__ = ('direction', 'speed', 'damage', 'targets', 'disappear_on_hit', 'damaged_objects')
+    BATCHED_KINEMATICS: bool = True
+    POOLED: bool = True  # Recycled by Game.acquire, see reset()
+    
     def __init__(self, game:'Game', x: float, y: float, direction: Vector, speed: float = 150,
                  damage: float = 10.0, targets: List[Tag] = None, disappear_on_hit: bool = True,
                  img_url:str='/static/img/green.png', width: float = 2, height: float = 2):
@@ -35,21 +40,64 @@ class Projectile(GameObject):
         self.targets: List[Tag] = targets or [Tag.ENEMY]  # Default to targeting enemies
         self.disappear_on_hit: bool = disappear_on_hit
         self.damaged_objects: Set[str] = set()  # Track objects already damaged
+        
+        # Projectiles are layered on the tags they target
+        layer: CollisionLayer = CollisionLayer.NONE
+        for target in self.targets:
+            layer |= layer_for(target, CollisionKind.PROJECTILE)
+        self.set_collision_layer(layer)
 
         self.set_image(img_url, self.width, self.height)
         
         # Add a collider
         self.add_collider(width, height)
+    
+    def reset(self, game:'Game', x: float, y: float, direction: Vector, speed: float = 150,
+              damage: float = 10.0, targets: List[Tag] = None, disappear_on_hit: bool = True,
+              img_url:str='/static/img/green.png', width: float = 2, height: float = 2) -> None:
+        """
+        Reinitialize a pooled projectile, reusing its position, collider and damaged set.
+        Takes the same arguments as __init__.
+        """
+        self.game = game
+        self.revive(x, y)
+        self.width = width
+        self.height = height
+        self.direction.set_(direction.x, direction.y).normalize_()
+        self.speed = speed
+        self.damage = damage
+        self.targets = targets or [Tag.ENEMY]
+        self.disappear_on_hit = disappear_on_hit
+        self.damaged_objects.clear()
+        
+        layer: CollisionLayer = CollisionLayer.NONE
+        for target in self.targets:
+            layer |= layer_for(target, CollisionKind.PROJECTILE)
+        self.set_collision_layer(layer)
+        
+        self.set_image(img_url, self.width, self.height)
+        self.colliders[0].resize(width, height)
         
     def update(self, players: Dict, player_keys: Dict, delta_time: float) -> None:
         """
         Update the projectile's position based on its direction and speed.
+        Movement is skipped when the game's batched kinematics stage already moved it.
         
         Args:
             players (dict): Dictionary of players
             player_keys (dict): Dictionary of player keys
             delta_time (float): Time elapsed since last update in seconds
         """
+        if not self.kinematics_batched:
+            self.integrate(delta_time)
+    
+    def integrate(self, delta_time: float) -> None:
+        """
+        Move the projectile and remove it once it leaves the screen.
+        
+        Args:
+            delta_time (float): Time elapsed since last update in seconds
+        """
         # Calculate movement vector
         move_vector: Vector = self.direction * self.speed * delta_time
         
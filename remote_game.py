@@ -0,0 +1,190 @@
+from typing import Any, Dict, List, Optional, TYPE_CHECKING
+from interest import DEFAULT_VIEW, VIEWS
+if TYPE_CHECKING:
+    from room_shard import RoomShard
+
+class RemoteGame:
+    """
+    Parent process side of a game simulated in a shard process.
+    Offers the part of the Game interface used by the Socket.IO handlers and
+    the RoomManager: calls are forwarded to the shard without waiting for an
+    answer, and the player list and views are mirrored here so they can be
+    read without a round trip.
+    """
+
+    def __init__(self, shard: 'RoomShard', code: str, room: str):
+        """
+        Initialize the proxy.
+
+        Args:
+            shard (RoomShard): Shard process running the game
+            code (str): Room code
+            room (str): Socket.IO room of the game's clients
+        """
+        self.shard: 'RoomShard' = shard
+        self.code: str = code
+        self.room: str = room
+        self.running: bool = False
+        self.players: Dict[str, Dict[str, Any]] = {}  # player_id -> player data
+        self.player_views: Dict[str, str] = {}        # player_id -> name of the state view
+
+    def _call(self, method: str, *args: Any) -> None:
+        """Run a Game method in the shard."""
+        self.shard.send('call', self.code, method, args)
+
+    def start(self) -> None:
+        """Start the game"""
+        self.running = True
+        self._call('start')
+
+    def pause(self) -> None:
+        """Pause the game"""
+        self._call('pause')
+
+    def resume(self) -> None:
+        """Resume the game after being paused"""
+        self._call('resume')
+
+    def set_difficulty(self, difficulty: str) -> None:
+        """
+        Apply a difficulty preset to the adversity manager.
+
+        Args:
+            difficulty (str): Name of a preset of adversity.DIFFICULTIES
+        """
+        self._call('set_difficulty', difficulty)
+
+    def start_profile(self, ticks: int) -> None:
+        """
+        Profile the next ticks with cProfile in the shard, the report comes with the next statistics.
+
+        Args:
+            ticks (int): Number of ticks to profile
+        """
+        self._call('start_profile', ticks)
+
+    def stop(self) -> None:
+        """Stop the game and remove it from its shard"""
+        self.running = False
+        self.shard.close_room(self.code)
+
+    def add_player(self, player_id: str, name: str) -> Dict[str, Any]:
+        """
+        Add a new player to the game.
+
+        Args:
+            player_id (str): Unique player identifier
+            name (str): Player's display name
+
+        Returns:
+            dict: Player data
+        """
+        self.players[player_id] = {'id': player_id, 'name': name}
+        self.player_views[player_id] = DEFAULT_VIEW
+        self._call('add_player', player_id, name)
+        return self.players[player_id]
+
+    def remove_player(self, player_id: str) -> Optional[Dict[str, Any]]:
+        """
+        Remove a player from the game.
+
+        Args:
+            player_id (str): Player's unique identifier
+
+        Returns:
+            dict or None: Removed player's data or None if player wasn't found
+        """
+        player_data: Optional[Dict[str, Any]] = self.players.pop(player_id, None)
+        self.player_views.pop(player_id, None)
+        if player_data is not None:
+            self._call('remove_player', player_id)
+        return player_data
+
+    def update_player_name(self, player_id: str, name: str) -> Optional[Dict[str, Any]]:
+        """
+        Update a player's name, only used by the parent process.
+
+        Args:
+            player_id (str): Player's unique identifier
+            name (str): New player name
+
+        Returns:
+            dict or None: Updated player data or None if player wasn't found
+        """
+        if player_id in self.players:
+            self.players[player_id]['name'] = name
+            return self.players[player_id]
+        return None
+
+    def get_players(self) -> List[Dict[str, Any]]:
+        """
+        Get list of all players.
+
+        Returns:
+            list: All player data
+        """
+        return list(self.players.values())
+
+    def get_player_view(self, player_id: str) -> str:
+        """
+        Get the state view of a player.
+
+        Args:
+            player_id (str): Player's unique identifier
+
+        Returns:
+            str: Name of the view
+        """
+        return self.player_views.get(player_id, DEFAULT_VIEW)
+
+    def set_player_view(self, player_id: str, view: str) -> bool:
+        """
+        Choose the state view of a player, the caller moves its socket to the view room.
+
+        Args:
+            player_id (str): Player's unique identifier
+            view (str): Name of a view of interest.VIEWS
+
+        Returns:
+            bool: True if the view was changed
+        """
+        if player_id not in self.players or view not in VIEWS:
+            return False
+        self.player_views[player_id] = view
+        self._call('set_player_view', player_id, view)
+        return True
+
+    def send_keyframe(self, player_id: str, view: Optional[str] = None) -> None:
+        """
+        Send a keyframe to a single client, emitted by the shard.
+
+        Args:
+            player_id (str): Player's unique identifier, which is also its Socket.IO session id
+            view (str, optional): View of the keyframe, the player's view if None
+        """
+        self._call('send_keyframe', player_id, view or self.get_player_view(player_id))
+
+    def repair(self) -> None:
+        """Repair the spaceship, asked by a player."""
+        self._call('repair')
+
+    def handle_key_press(self, player_id: str, key_name: str, timestamp: Optional[float] = None) -> None:
+        """Forward a key press event of a player."""
+        self._call('handle_key_press', player_id, key_name, timestamp)
+
+    def handle_key_release(self, player_id: str, key_name: str) -> None:
+        """Forward a key release event of a player."""
+        self._call('handle_key_release', player_id, key_name)
+
+    def handle_key_value_update(self, player_id: str, key_name: str, value: Any) -> None:
+        """Forward a key value update of a player."""
+        self._call('handle_key_value_update', player_id, key_name, value)
+
+    def get_loop_stats(self) -> Dict[str, Dict[str, Any]]:
+        """
+        Get the game loop statistics last reported by the shard.
+
+        Returns:
+            dict: 'simulation' and 'broadcast' statistics, empty until the first report
+        """
+        return self.shard.stats.get(self.code, {})
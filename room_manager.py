@@ -0,0 +1,278 @@
+import re
+import random
+import string
+import logging
+from typing import Any, Dict, List, Optional, Tuple, Union
+from game import Game
+from adversity import DIFFICULTIES
+from game_host import GameHost
+from remote_game import RemoteGame
+from room_shard import RoomShard
+
+class RoomManager(GameHost):
+    """
+    Hosts several independent games in one server, one per room code.
+    Each room has its own Game (SpaceShip, Adversity, players) and its own
+    Socket.IO room, so its events and state frames only reach its crew.
+    Local rooms are driven by the two shared threads of GameHost.
+    With workers > 0, rooms created by players are simulated in that many
+    worker processes instead (see RoomShard), each new room going to the
+    worker with the lowest measured tick cost, so that rooms use several
+    cores despite the GIL. The front end always stays in this process.
+    The default room is local and started from the game manager window,
+    rooms created by players start as soon as they are created and are
+    closed when their last player leaves.
+    """
+    DEFAULT_ROOM: str = 'MAIN'
+    CODE_LENGTH: int = 4
+    CODE_PATTERN = re.compile(r'^[A-Z0-9]{1,12}$')
+
+    def __init__(self, socketio=None, tick_rate: float = 60.0, emit_rate: float = 30.0, wire_format: str = 'json',
+                 encode_once: bool = False, max_rooms: int = 64, workers: int = 0, difficulty: str = 'normal'):
+        """
+        Initialize the manager with the default room.
+
+        Args:
+            socketio: The SocketIO instance for emitting updates to clients
+            tick_rate (float): Simulation updates per second of every room
+            emit_rate (float): State broadcasts per second of every room
+            wire_format (str): State frame encoding, 'json' or 'binary'
+            encode_once (bool): Serialize each state frame once for all clients, socketio must use json=FrameJSON
+            max_rooms (int): Maximum number of rooms hosted at once
+            workers (int): Worker processes simulating the rooms created by players, 0 to keep them all here
+            difficulty (str): Difficulty preset of the rooms, see adversity.DIFFICULTIES
+        """
+        if difficulty not in DIFFICULTIES:
+            raise ValueError(f"Unknown difficulty: {difficulty}")
+        super().__init__(socketio, tick_rate=tick_rate, emit_rate=emit_rate, wire_format=wire_format,
+                         encode_once=encode_once, difficulty=difficulty)
+        self.max_rooms: int = max_rooms
+        self.player_rooms: Dict[str, str] = {}             # player_id -> code
+        self.remote_rooms: Dict[str, RemoteGame] = {}      # code -> game simulated by a shard
+        self.shards: List[RoomShard] = [
+            RoomShard(index, socketio, tick_rate=tick_rate, emit_rate=emit_rate, wire_format=wire_format,
+                      encode_once=encode_once)
+            for index in range(workers)
+        ]
+        self.add_room(self.DEFAULT_ROOM)
+
+    @classmethod
+    def normalize_code(cls, code: Optional[str]) -> Optional[str]:
+        """
+        Clean up a room code typed by a player.
+
+        Args:
+            code (str, optional): Room code as received
+
+        Returns:
+            str or None: Upper case code, None if empty or invalid
+        """
+        if not code:
+            return None
+        code = code.strip().upper()
+        return code if cls.CODE_PATTERN.match(code) else None
+
+    def _new_code(self) -> str:
+        """Pick an unused random room code, the manager lock must be held."""
+        while True:
+            code: str = ''.join(random.choices(string.ascii_uppercase, k=self.CODE_LENGTH))
+            if self.get_room(code) is None:
+                return code
+
+    def _place_room(self, code: str) -> Union[Game, RemoteGame]:
+        """Create a player room, on the least loaded shard if any. The manager lock must be held."""
+        if not self.shards:
+            return self.add_room(code)
+        # Rooms not measured yet are counted at the mean cost of the measured ones
+        costs: List[float] = [cost for shard in self.shards for cost in map(shard.room_cost, list(shard.rooms))
+                              if cost is not None]
+        unmeasured_cost: float = sum(costs) / len(costs) if costs else 0.0
+        shard: RoomShard = min(self.shards, key=lambda shard: (shard.load(unmeasured_cost), len(shard.rooms)))
+        game: RemoteGame = shard.create_room(code, self.difficulty)
+        self.remote_rooms[code] = game
+        logging.info(f"Room {code} created on {shard.process.name}")
+        return game
+
+    def room_count(self) -> int:
+        """
+        Get the number of rooms hosted.
+
+        Returns:
+            int: Local and sharded rooms
+        """
+        return len(self.rooms) + len(self.remote_rooms)
+
+    def create_room(self, code: Optional[str] = None) -> Optional[Tuple[str, Union[Game, RemoteGame]]]:
+        """
+        Create a room and start its game.
+
+        Args:
+            code (str, optional): Code of the room, a random one if None
+
+        Returns:
+            tuple or None: (code, game), None if the code is taken or the room limit is reached
+        """
+        with self.lock:
+            if self.room_count() >= self.max_rooms:
+                return None
+            code = self.normalize_code(code) or self._new_code()
+            if self.get_room(code) is not None:
+                return None
+            game: Union[Game, RemoteGame] = self._place_room(code)
+        game.start()
+        return code, game
+
+    def get_room(self, code: str) -> Optional[Union[Game, RemoteGame]]:
+        """
+        Get the game of a room.
+
+        Args:
+            code (str): Room code
+
+        Returns:
+            Game or RemoteGame or None: The game, None if there is no such room
+        """
+        return self.rooms.get(code) or self.remote_rooms.get(code)
+
+    def get_player_room(self, player_id: str) -> Optional[str]:
+        """
+        Get the code of the room a player is in.
+
+        Args:
+            player_id (str): Player's unique identifier
+
+        Returns:
+            str or None: Room code, None if the player is not in a room
+        """
+        return self.player_rooms.get(player_id)
+
+    def get_player_game(self, player_id: str) -> Optional[Union[Game, RemoteGame]]:
+        """
+        Get the game a player is in.
+
+        Args:
+            player_id (str): Player's unique identifier
+
+        Returns:
+            Game or RemoteGame or None: The player's game, None if the player is not in a room
+        """
+        code: Optional[str] = self.player_rooms.get(player_id)
+        return self.get_room(code) if code is not None else None
+
+    def join(self, player_id: str, code: Optional[str] = None,
+             name: Optional[str] = None) -> Tuple[str, Union[Game, RemoteGame], Dict[str, Any]]:
+        """
+        Add a player to a room, creating the room if the code is new.
+        Players without a valid code, or arriving when the room limit is
+        reached, join the default room.
+
+        Args:
+            player_id (str): Player's unique identifier
+            code (str, optional): Room code typed by the player
+            name (str, optional): Player's display name, numbered in the room if None
+
+        Returns:
+            tuple: (code, game, player data) of the room actually joined
+        """
+        self.leave(player_id)
+        code = self.normalize_code(code) or self.DEFAULT_ROOM
+        created: bool = False
+        with self.lock:
+            game: Optional[Union[Game, RemoteGame]] = self.get_room(code)
+            if game is None:
+                if self.room_count() < self.max_rooms:
+                    game = self._place_room(code)
+                    created = True
+                else:
+                    logging.warning(f"Room limit reached, player {player_id} sent to room {self.DEFAULT_ROOM}")
+                    code = self.DEFAULT_ROOM
+                    game = self.rooms[code]
+            self.player_rooms[player_id] = code
+            player_data: Dict[str, Any] = game.add_player(player_id, name or f'Player {len(game.players)}')
+        if created:
+            game.start()
+        return code, game, player_data
+
+    def leave(self, player_id: str) -> Optional[Tuple[str, Union[Game, RemoteGame], Dict[str, Any]]]:
+        """
+        Remove a player from their room, closing the room if it becomes empty.
+
+        Args:
+            player_id (str): Player's unique identifier
+
+        Returns:
+            tuple or None: (code, game, player data) of the room left, None if the player was in no room
+        """
+        with self.lock:
+            code: Optional[str] = self.player_rooms.pop(player_id, None)
+            if code is None:
+                return None
+            game: Union[Game, RemoteGame] = self.get_room(code)
+            player_data: Optional[Dict[str, Any]] = game.remove_player(player_id)
+            empty: bool = code != self.DEFAULT_ROOM and not game.players
+            if empty:
+                self.remote_rooms.pop(code, None)
+        if empty:
+            if isinstance(game, RemoteGame):
+                game.stop()
+                logging.info(f"Room {code} closed")
+            else:
+                self.remove_room(code)
+        return (code, game, player_data) if player_data else None
+
+    def set_difficulty(self, difficulty: str) -> None:
+        """
+        Apply a difficulty preset to every room, and to the rooms created later.
+
+        Args:
+            difficulty (str): Name of a preset of adversity.DIFFICULTIES
+        """
+        if difficulty not in DIFFICULTIES:
+            raise ValueError(f"Unknown difficulty: {difficulty}")
+        self.difficulty = difficulty
+        with self.lock:
+            games: List[Union[Game, RemoteGame]] = list(self.rooms.values()) + list(self.remote_rooms.values())
+        for game in games:
+            game.set_difficulty(difficulty)
+
+    def get_players(self) -> List[Dict[str, Any]]:
+        """
+        Get the players of every room.
+
+        Returns:
+            list: All player data
+        """
+        with self.lock:
+            games: List[Union[Game, RemoteGame]] = list(self.rooms.values()) + list(self.remote_rooms.values())
+            return [player for game in games for player in game.get_players()]
+
+    def start(self) -> None:
+        """Start the shared threads and the worker processes"""
+        if self.running:
+            return
+        for shard in self.shards:
+            shard.start()
+        super().start()
+
+    def stop(self) -> None:
+        """Stop every game, the shared threads and the worker processes"""
+        super().stop()
+        for shard in self.shards:
+            shard.stop()
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Get the hosting statistics.
+
+        Returns:
+            dict: Number of rooms and players, the loop statistics of each room by code,
+                  and the measured load of each worker process in fractions of a core
+        """
+        with self.lock:
+            games: Dict[str, Union[Game, RemoteGame]] = {**self.rooms, **self.remote_rooms}
+        return {
+            'rooms': len(games),
+            'players': len(self.player_rooms),
+            'loops': {code: game.get_loop_stats() for code, game in games.items()},
+            'workers': [shard.load(0.0) for shard in self.shards]
+        }
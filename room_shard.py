@@ -0,0 +1,145 @@
+import logging
+import threading
+import multiprocessing
+from multiprocessing.connection import Connection
+from typing import Any, Dict, Optional, Set, Tuple
+from game_host import GameHost
+from remote_game import RemoteGame
+from shard_worker import run_shard
+
+class RoomShard:
+    """
+    Parent process side of a shard: a worker process simulating some of the
+    rooms, so that rooms use several CPU cores despite the GIL.
+    Commands go to the worker over a pipe, and a reader thread emits the
+    events sent back by the worker's games to the clients and keeps the
+    loop statistics the worker reports, used to measure its load.
+    """
+
+    def __init__(self, index: int, socketio=None, tick_rate: float = 60.0, emit_rate: float = 30.0,
+                 wire_format: str = 'json', encode_once: bool = False):
+        """
+        Initialize the shard, the worker process is started by start().
+
+        Args:
+            index (int): Number of the shard, used in the process name
+            socketio: The SocketIO instance emitting the worker's events
+            tick_rate (float): Simulation updates per second of every room
+            emit_rate (float): State broadcasts per second of every room
+            wire_format (str): State frame encoding, 'json' or 'binary'
+            encode_once (bool): Frames are sent pre-encoded, socketio must use json=FrameJSON
+        """
+        self.socketio = socketio
+        self.tick_rate: float = tick_rate
+        # spawn: the parent runs threads (and maybe eventlet), forking them is unsafe
+        context = multiprocessing.get_context('spawn')
+        conn, worker_conn = context.Pipe()
+        self.conn: Connection = conn
+        self.worker_conn: Connection = worker_conn
+        self.process = context.Process(target=run_shard, name=f"room-shard-{index}", daemon=True,
+                                       args=(self.worker_conn, tick_rate, emit_rate, wire_format, encode_once))
+        self.send_lock: threading.Lock = threading.Lock()
+        self.reader: Optional[threading.Thread] = None
+        self.rooms: Set[str] = set()                   # Codes of the rooms placed here
+        self.stats: Dict[str, Dict[str, Any]] = {}     # code -> last reported loop statistics
+
+    def start(self) -> None:
+        """Start the worker process and the reader thread"""
+        self.process.start()
+        self.worker_conn.close()  # Only the worker uses its end
+        self.reader = threading.Thread(target=self._read_loop, daemon=True)
+        self.reader.start()
+
+    def stop(self) -> None:
+        """Stop the worker process"""
+        try:
+            self.send('stop')
+        except (OSError, ValueError):
+            pass
+        self.process.join(timeout=2.0)
+        if self.process.is_alive():
+            self.process.terminate()
+        self.conn.close()
+
+    def send(self, *message: Any) -> None:
+        """
+        Send a command to the worker, safe to call from any thread.
+
+        Args:
+            *message: Command name followed by its arguments
+        """
+        with self.send_lock:
+            self.conn.send(message)
+
+    def _read_loop(self) -> None:
+        """Emit the events of the worker - runs in a separate thread"""
+        while True:
+            try:
+                message: Tuple[Any, ...] = self.conn.recv()
+            except (EOFError, OSError):
+                break
+            if message[0] == 'emit':
+                _, event, data, to = message
+                if self.socketio:
+                    self.socketio.emit(event, data, to=to)
+            elif message[0] == 'stats':
+                self.stats = message[1]
+        if self.process.exitcode not in (None, 0):
+            logging.error(f"Shard {self.process.name} exited with code {self.process.exitcode}")
+
+    def create_room(self, code: str, difficulty: str) -> RemoteGame:
+        """
+        Create a room in the worker.
+
+        Args:
+            code (str): Room code
+            difficulty (str): Difficulty preset of the room
+
+        Returns:
+            RemoteGame: Proxy of the room's game
+        """
+        self.rooms.add(code)
+        self.send('create', code, difficulty)
+        return RemoteGame(self, code, GameHost.socket_room(code))
+
+    def close_room(self, code: str) -> None:
+        """
+        Stop and remove a room from the worker.
+
+        Args:
+            code (str): Room code
+        """
+        self.rooms.discard(code)
+        self.stats.pop(code, None)
+        self.send('close', code)
+
+    def room_cost(self, code: str) -> Optional[float]:
+        """
+        Get the measured CPU cost of a room.
+
+        Args:
+            code (str): Room code
+
+        Returns:
+            float or None: Fraction of a core used by the room's ticks, None until it was measured
+        """
+        simulation: Optional[Dict[str, Any]] = self.stats.get(code, {}).get('simulation')
+        if not simulation or not simulation['ticks']:
+            return None
+        return simulation['mean_tick_ms'] / 1000 * simulation['tick_rate']
+
+    def load(self, unmeasured_cost: float) -> float:
+        """
+        Get the CPU load of the worker.
+
+        Args:
+            unmeasured_cost (float): Cost counted for the rooms not measured yet
+
+        Returns:
+            float: Sum of the room costs, in fractions of a core
+        """
+        total: float = 0.0
+        for code in list(self.rooms):
+            cost: Optional[float] = self.room_cost(code)
+            total += unmeasured_cost if cost is None else cost
+        return total
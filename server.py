@@ -1,26 +1,39 @@
 from flask import Flask, render_template, request
-from flask_socketio import SocketIO, emit
+from flask_socketio import SocketIO, emit, join_room, leave_room
 import socket
 import logging
-import tkinter as tk
 import threading
 import time
 import math
-from game import Game
-from game_manager_window import GameManagerWindow
+from room_manager import RoomManager
+from server_config import ServerConfig
+from frame_cache import FrameJSON
+from interest import view_room
+from metrics import create_metrics_blueprint
 
 # Set up logging
 logging.basicConfig(level=logging.INFO)
 # Filter out werkzeug polling logs
 logging.getLogger('werkzeug').setLevel(logging.WARNING)
 
+# Settings from the PILOT_* environment variables (see ServerConfig, headless.py sets them from its options)
+config = ServerConfig.from_env()
+
 # Initialize Flask app
 app = Flask(__name__)
 app.config['SECRET_KEY'] = 'pilot_together_secret!'
-socketio = SocketIO(app, cors_allowed_origins="*")
-
-# Create the game instance
-game = Game(socketio)
+# FrameJSON lets state frames be serialized once and reused for every client,
+# the game loops run as background tasks of the chosen backend (see async_mode)
+socketio = SocketIO(app, cors_allowed_origins="*", json=FrameJSON, async_mode=config.async_mode)
+
+# One game per room code, driven by the manager's shared threads or, with
+# workers > 0, by that many worker processes (one core each)
+rooms = RoomManager(socketio, tick_rate=config.tick_rate, emit_rate=config.emit_rate, wire_format=config.wire_format,
+                    encode_once=True, workers=config.workers, difficulty=config.difficulty)
+# The default room, controlled from the game manager window
+game = rooms.get_room(RoomManager.DEFAULT_ROOM)
+# Per-phase tick timings of every room for Prometheus, protected by the admin token
+app.register_blueprint(create_metrics_blueprint(rooms, config.admin_token))
 
 # Global variable for game manager window
 game_manager = None
@@ -34,18 +47,22 @@ def index():
 def handle_connect():
     """Handle new player connection"""
     player_id = request.sid
-    player_data = game.add_player(player_id, f'Player {len(game.get_players())}')
-    logging.info(f"New player connected: {player_id}")
+    # Room code typed by the player, sent in the connection query (?room=CODE)
+    code, room_game, player_data = rooms.join(player_id, request.args.get('room'))
+    join_room(room_game.room)
+    join_room(view_room(room_game.get_player_view(player_id), room_game.room))
+    logging.info(f"New player connected: {player_id} (room {code})")
+    emit('room_joined', {'room': code})
     
-    # Notify everyone about the new player
-    emit('player_joined', player_data, broadcast=True)
+    # Notify the crew about the new player
+    emit('player_joined', player_data, to=room_game.room)
     
     # Send the current player list to the new player
-    emit('player_list', game.get_players())
+    emit('player_list', room_game.get_players())
     
     # Update the game manager window
     if game_manager:
-        game_manager.root.after(0, lambda: game_manager.update_player_list(game.get_players()))
+        game_manager.root.after(0, lambda: game_manager.update_player_list(rooms.get_players()))
         game_manager.root.after(0, lambda: game_manager.update_status(f"New player connected: {player_data['name']}"))
 
 # Modification de la liste des touches
@@ -53,15 +70,16 @@ def handle_connect():
 def handle_set_name(data):
     """Handle player name change"""
     player_id = request.sid
-    if 'name' in data:
-        player_data = game.update_player_name(player_id, data['name'])
+    room_game = rooms.get_player_game(player_id)
+    if room_game and 'name' in data:
+        player_data = room_game.update_player_name(player_id, data['name'])
         if player_data:
-            # Notify everyone about the name change
-            emit('player_updated', player_data, broadcast=True)
+            # Notify the crew about the name change
+            emit('player_updated', player_data, to=room_game.room)
             
             # Update the game manager window
             if game_manager:
-                game_manager.root.after(0, lambda: game_manager.update_player_list(game.get_players()))
+                game_manager.root.after(0, lambda: game_manager.update_player_list(rooms.get_players()))
                 game_manager.root.after(0, lambda: game_manager.update_status(
                     f"Player renamed: {player_data['name']}"
                 ))
@@ -70,36 +88,56 @@ def handle_set_name(data):
 def handle_disconnect():
     """Handle player disconnection"""
     player_id = request.sid
-    player_data = game.remove_player(player_id)
-    if player_data:
-        logging.info(f"Player disconnected: {player_id}")
+    left = rooms.leave(player_id)
+    if left:
+        code, room_game, player_data = left
+        logging.info(f"Player disconnected: {player_id} (room {code})")
         
-        # Notify everyone about the player leaving
-        emit('player_left', player_data, broadcast=True)
+        # Notify the crew about the player leaving
+        emit('player_left', player_data, to=room_game.room)
         
         # Update the game manager window
         if game_manager:
-            game_manager.root.after(0, lambda: game_manager.update_player_list(game.get_players()))
+            game_manager.root.after(0, lambda: game_manager.update_player_list(rooms.get_players()))
             game_manager.root.after(0, lambda: game_manager.update_status(f"Player left: {player_data['name']}"))
 
 @socketio.on('request_game_state')
 def handle_request_game_state():
     """Handle player requesting the current game state"""
-    emit('game_state_update', game.get_state())
+    room_game = rooms.get_player_game(request.sid)
+    if room_game:
+        room_game.send_keyframe(request.sid)
+
+@socketio.on('set_view')
+def handle_set_view(data=None):
+    """Handle a player choosing the state view it receives (e.g. 'gunner')"""
+    player_id = request.sid
+    room_game = rooms.get_player_game(player_id)
+    # Only a view name can be looked up in interest.VIEWS
+    if room_game is None or not isinstance(data, dict) or not isinstance(data.get('view'), str):
+        return
+    old_view = room_game.get_player_view(player_id)
+    if room_game.set_player_view(player_id, data['view']):
+        leave_room(view_room(old_view, room_game.room))
+        join_room(view_room(data['view'], room_game.room))
+        # Resync on the delta stream of the new view
+        room_game.send_keyframe(player_id, data['view'])
 
 @socketio.on('key_down')
 def handle_key_down(data):
     """Handle key press"""
     player_id = request.sid
-    if 'key' in data:
-        game.handle_key_press(player_id, data['key'], time.time())
+    room_game = rooms.get_player_game(player_id)
+    if room_game and 'key' in data:
+        room_game.handle_key_press(player_id, data['key'], time.time())
 
 @socketio.on('key_up')
 def handle_key_up(data):
     """Handle key release"""
     player_id = request.sid
-    if 'key' in data:
-        game.handle_key_release(player_id, data['key'])
+    room_game = rooms.get_player_game(player_id)
+    if room_game and 'key' in data:
+        room_game.handle_key_release(player_id, data['key'])
 
 @socketio.on('repair')
 def handle_repair():
@@ -107,7 +145,9 @@ def handle_repair():
     Handle repair requests from clients.
     """
     # Heal via la méthode spaceship.repair(), qui émet déjà health_update
-    game.spaceship.repair()
+    room_game = rooms.get_player_game(request.sid)
+    if room_game:
+        room_game.repair()
 
 @socketio.on('weapon_select')
 def handle_weapon_select(data):
@@ -118,11 +158,11 @@ def handle_weapon_select(data):
         data: Dictionary with weapon selection
     """
     player_id = request.sid
-    if 'weapon' in data:
+    room_game = rooms.get_player_game(player_id)
+    if room_game and 'weapon' in data:
         weapon = data['weapon']
-        if player_id in game.player_keys and 'weapon' in game.player_keys[player_id]:
-            game.player_keys[player_id]['weapon'].set_value(weapon)
-            logging.info(f"Player {player_id} selected weapon {weapon}")
+        room_game.handle_key_value_update(player_id, 'weapon', weapon)
+        logging.info(f"Player {player_id} selected weapon {weapon}")
 
 @socketio.on('rotate_shoot')
 def handle_rotate_shoot(data):
@@ -130,18 +170,19 @@ def handle_rotate_shoot(data):
     Handle rotating cannon shoot request.
     """
     player_id = request.sid
-    if player_id in game.player_keys:
+    room_game = rooms.get_player_game(player_id)
+    if room_game:
         # Mettre à jour l'angle si présent
         if 'angle' in data:
             angle = data.get('angle', 0)
-            game.handle_key_value_update(player_id, 'angle', angle)
+            room_game.handle_key_value_update(player_id, 'angle', angle)
         
         # Activer ou désactiver le tir
         if 'firing' in data:
             if data['firing']:
-                game.handle_key_press(player_id, 'shoot', time.time())
+                room_game.handle_key_press(player_id, 'shoot', time.time())
             else:
-                game.handle_key_release(player_id, 'shoot')
+                room_game.handle_key_release(player_id, 'shoot')
 
 def get_local_ip():
     """Get the local IP address to display connection info"""
@@ -158,13 +199,21 @@ def get_local_ip():
 
 def start_flask(host, port):
     """Start the Flask server in a separate thread"""
+    # Started here so that in eventlet mode the loops are green threads of the
+    # server's hub, the main thread being taken by the Tk main loop
+    rooms.start()
     socketio.run(app, host=host, port=port, debug=False, use_reloader=False)
 
 if __name__ == '__main__':
+    # The manager window is only loaded here, headless.py runs the server without Tkinter
+    import tkinter as tk
+    from game_manager_window import GameManagerWindow
+    
     local_ip = get_local_ip()
-    port = 5000
+    port = config.port
     print(f"Game server starting!")
     print(f"Players can join at: http://{local_ip}:{port}")
+    print(f"Separate crews can play in their own room: http://{local_ip}:{port}/?room=CODE")
     
     # Create and start the Tkinter window
     root = tk.Tk()
@@ -174,16 +223,18 @@ if __name__ == '__main__':
     
     # Le jeu n'est plus démarré automatiquement ici
     # game.start() <- supprimé
-    
+    # Les boucles partagées tournent dès le lancement du serveur, chaque salle attend son démarrage
     # Start Flask in a separate thread
-    flask_thread = threading.Thread(target=start_flask, args=('0.0.0.0', port))
+    flask_thread = threading.Thread(target=start_flask, args=(config.host, port))
     flask_thread.daemon = True
     flask_thread.start()
+    if config.autostart:
+        game_manager.start_game()
     
     # Run the Tkinter main loop
     try:
         root.mainloop()
     except KeyboardInterrupt:
         print("Shutting down server...")
-        game.stop()
+        rooms.stop()
         root.quit()
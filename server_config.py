@@ -0,0 +1,144 @@
+import os
+import argparse
+from typing import Dict, List, Mapping, Optional, Tuple
+from adversity import DIFFICULTIES
+from async_mode import ASYNC_MODES
+from state_broadcaster import StateBroadcaster
+
+class ServerConfig:
+    """
+    Settings of the game server, read from PILOT_* environment variables.
+    The headless entry point also reads them from the command line, command
+    line options taking precedence over the environment.
+    """
+    # Attribute -> environment variable
+    ENV_VARS: Dict[str, str] = {
+        'host': 'PILOT_HOST',
+        'port': 'PILOT_PORT',
+        'tick_rate': 'PILOT_TICK_RATE',
+        'emit_rate': 'PILOT_EMIT_RATE',
+        'workers': 'PILOT_WORKERS',
+        'difficulty': 'PILOT_DIFFICULTY',
+        'autostart': 'PILOT_AUTOSTART',
+        'admin_token': 'PILOT_ADMIN_TOKEN',
+        'async_mode': 'PILOT_ASYNC_MODE',
+        'wire_format': 'PILOT_WIRE_FORMAT',
+    }
+    # State frame encodings, see StateBroadcaster
+    WIRE_FORMATS: Tuple[str, ...] = (StateBroadcaster.JSON, StateBroadcaster.BINARY)
+
+    def __init__(self, host: str = '0.0.0.0', port: int = 5000, tick_rate: float = 60.0, emit_rate: float = 30.0,
+                 workers: int = 0, difficulty: str = 'normal', autostart: bool = False,
+                 admin_token: Optional[str] = None, async_mode: str = 'eventlet', wire_format: str = 'json'):
+        """
+        Initialize the settings.
+
+        Args:
+            host (str): Interface the server listens on
+            port (int): HTTP port
+            tick_rate (float): Simulation updates per second of every room
+            emit_rate (float): State broadcasts per second of every room
+            workers (int): Worker processes simulating the rooms created by players
+            difficulty (str): Difficulty preset of the rooms, see adversity.DIFFICULTIES
+            autostart (bool): Start the default room at launch instead of waiting for the admin
+            admin_token (str, optional): Token required by the HTTP admin endpoints, None for local requests only
+            async_mode (str): Networking backend, see async_mode.ASYNC_MODES
+            wire_format (str): State frame encoding, 'json' (keyframes and deltas) or 'binary' (packed full frames)
+        """
+        if tick_rate <= 0 or emit_rate <= 0:
+            raise ValueError("tick_rate and emit_rate must be positive")
+        if workers < 0:
+            raise ValueError("workers must not be negative")
+        if difficulty not in DIFFICULTIES:
+            raise ValueError(f"Unknown difficulty: {difficulty}")
+        if async_mode not in ASYNC_MODES:
+            raise ValueError(f"Unknown async mode: {async_mode}")
+        if wire_format not in self.WIRE_FORMATS:
+            raise ValueError(f"Unknown wire format: {wire_format}")
+        self.host: str = host
+        self.port: int = port
+        self.tick_rate: float = tick_rate
+        self.emit_rate: float = emit_rate
+        self.workers: int = workers
+        self.difficulty: str = difficulty
+        self.autostart: bool = autostart
+        self.admin_token: Optional[str] = admin_token
+        self.async_mode: str = async_mode
+        self.wire_format: str = wire_format
+
+    @classmethod
+    def from_env(cls, environ: Mapping[str, str] = os.environ) -> 'ServerConfig':
+        """
+        Read the settings from the environment, missing variables keep their default.
+
+        Args:
+            environ (mapping): Environment variables
+
+        Returns:
+            ServerConfig: The settings
+        """
+        config: ServerConfig = cls()
+        return cls(
+            host=environ.get('PILOT_HOST', config.host),
+            port=int(environ.get('PILOT_PORT', config.port)),
+            tick_rate=float(environ.get('PILOT_TICK_RATE', config.tick_rate)),
+            emit_rate=float(environ.get('PILOT_EMIT_RATE', config.emit_rate)),
+            workers=int(environ.get('PILOT_WORKERS', config.workers)),
+            difficulty=environ.get('PILOT_DIFFICULTY', config.difficulty),
+            autostart=environ.get('PILOT_AUTOSTART', '0').lower() in ('1', 'true', 'yes', 'on'),
+            admin_token=environ.get('PILOT_ADMIN_TOKEN') or None,
+            async_mode=environ.get('PILOT_ASYNC_MODE', config.async_mode),
+            wire_format=environ.get('PILOT_WIRE_FORMAT', config.wire_format),
+        )
+
+    @classmethod
+    def from_args(cls, argv: Optional[List[str]] = None, environ: Mapping[str, str] = os.environ) -> 'ServerConfig':
+        """
+        Read the settings from the command line, with the environment as defaults.
+
+        Args:
+            argv (list, optional): Command line arguments, sys.argv[1:] if None
+            environ (mapping): Environment variables
+
+        Returns:
+            ServerConfig: The settings
+        """
+        defaults: ServerConfig = cls.from_env(environ)
+        parser = argparse.ArgumentParser(description="Pilot Together game server without the Tk manager window.")
+        parser.add_argument('--host', default=defaults.host, help='interface to listen on (PILOT_HOST)')
+        parser.add_argument('--port', type=int, default=defaults.port, help='HTTP port (PILOT_PORT)')
+        parser.add_argument('--tick-rate', type=float, default=defaults.tick_rate,
+                            help='simulation updates per second (PILOT_TICK_RATE)')
+        parser.add_argument('--emit-rate', type=float, default=defaults.emit_rate,
+                            help='state broadcasts per second (PILOT_EMIT_RATE)')
+        parser.add_argument('--workers', type=int, default=defaults.workers,
+                            help='worker processes for the rooms created by players (PILOT_WORKERS)')
+        parser.add_argument('--difficulty', choices=sorted(DIFFICULTIES), default=defaults.difficulty,
+                            help='difficulty preset (PILOT_DIFFICULTY)')
+        parser.add_argument('--autostart', action=argparse.BooleanOptionalAction, default=defaults.autostart,
+                            help='start the main room at launch (PILOT_AUTOSTART)')
+        parser.add_argument('--admin-token', default=defaults.admin_token,
+                            help='token of the /admin endpoints, local requests only if unset (PILOT_ADMIN_TOKEN)')
+        parser.add_argument('--async-mode', choices=ASYNC_MODES, default=defaults.async_mode,
+                            help='networking backend, eventlet runs the game loops as green threads (PILOT_ASYNC_MODE)')
+        parser.add_argument('--wire-format', choices=cls.WIRE_FORMATS, default=defaults.wire_format,
+                            help='state frame encoding, binary sends packed full frames (PILOT_WIRE_FORMAT)')
+        args = parser.parse_args(argv)
+        return cls(host=args.host, port=args.port, tick_rate=args.tick_rate, emit_rate=args.emit_rate,
+                   workers=args.workers, difficulty=args.difficulty, autostart=args.autostart,
+                   admin_token=args.admin_token, async_mode=args.async_mode, wire_format=args.wire_format)
+
+    def to_env(self) -> Dict[str, str]:
+        """
+        Get the settings as environment variables, read back by from_env().
+
+        Returns:
+            dict: Variable name -> value
+        """
+        env: Dict[str, str] = {}
+        for name, variable in self.ENV_VARS.items():
+            value = getattr(self, name)
+            if value is None:
+                continue
+            env[variable] = ('1' if value else '0') if isinstance(value, bool) else str(value)
+        return env
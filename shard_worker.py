@@ -0,0 +1,104 @@
+import time
+import logging
+import threading
+from multiprocessing.connection import Connection
+from typing import Any, Dict, Optional, Tuple
+from game_host import GameHost
+
+# Game methods the parent process can call on a room of a shard (see RemoteGame)
+REMOTE_METHODS: Tuple[str, ...] = (
+    'start', 'pause', 'resume', 'set_difficulty', 'start_profile',
+    'add_player', 'remove_player', 'set_player_view', 'send_keyframe', 'repair',
+    'handle_key_press', 'handle_key_release', 'handle_key_value_update',
+)
+
+STATS_INTERVAL: float = 1.0  # Seconds between two loop statistics reports
+
+
+class PipeEmitter:
+    """
+    Stands for the SocketIO instance in a shard process: every emit is sent
+    to the parent process, which emits it to the clients.
+    """
+
+    def __init__(self, conn: Connection):
+        """
+        Initialize the emitter.
+
+        Args:
+            conn (Connection): Shard end of the pipe to the parent process
+        """
+        self.conn: Connection = conn
+        # The simulation and broadcast threads and the command loop all send
+        self.lock: threading.Lock = threading.Lock()
+
+    def emit(self, event: str, data: Any = None, to: Optional[str] = None) -> None:
+        """
+        Forward an event to the parent process.
+
+        Args:
+            event (str): Event name
+            data (any): Event payload, must be picklable
+            to (str, optional): Socket.IO room or session id, None for every client
+        """
+        self.send(('emit', event, data, to))
+
+    def send(self, message: Tuple[Any, ...]) -> None:
+        """Send a message to the parent process."""
+        with self.lock:
+            self.conn.send(message)
+
+
+def run_shard(conn: Connection, tick_rate: float, emit_rate: float, wire_format: str, encode_once: bool) -> None:
+    """
+    Entry point of a shard process: hosts the rooms placed on it and runs
+    the commands received from the parent until 'stop' or the pipe closes.
+
+    Messages from the parent:
+        ('create', code, difficulty), ('close', code), ('call', code, method, args), ('stop',)
+    Messages to the parent:
+        ('emit', event, data, to), ('stats', {code: loop statistics})
+
+    Args:
+        conn (Connection): Shard end of the pipe to the parent process
+        tick_rate (float): Simulation updates per second of every room
+        emit_rate (float): State broadcasts per second of every room
+        wire_format (str): State frame encoding, 'json' or 'binary'
+        encode_once (bool): Send JSON frames pre-encoded, the parent's SocketIO must use json=FrameJSON
+    """
+    emitter: PipeEmitter = PipeEmitter(conn)
+    host: GameHost = GameHost(emitter, tick_rate=tick_rate, emit_rate=emit_rate, wire_format=wire_format,
+                              encode_once=encode_once)
+    host.start()
+    next_report: float = time.perf_counter() + STATS_INTERVAL
+    try:
+        while True:
+            if conn.poll(STATS_INTERVAL):
+                message: Tuple[Any, ...] = conn.recv()
+                command: str = message[0]
+                if command == 'stop':
+                    break
+                elif command == 'create':
+                    host.add_room(message[1], message[2])
+                elif command == 'close':
+                    host.remove_room(message[1])
+                elif command == 'call':
+                    code, method, args = message[1], message[2], message[3]
+                    game = host.get_room(code)
+                    if game is not None and method in REMOTE_METHODS:
+                        try:
+                            getattr(game, method)(*args)
+                        except Exception:
+                            logging.exception(f"Call of {method} on room {code} failed")
+
+            now: float = time.perf_counter()
+            if now >= next_report:
+                next_report = now + STATS_INTERVAL
+                with host.lock:
+                    games = list(host.rooms.items())
+                stats: Dict[str, Dict[str, Any]] = {code: game.get_loop_stats() for code, game in games}
+                emitter.send(('stats', stats))
+    except (EOFError, OSError):
+        pass  # Parent process gone
+    finally:
+        host.stop()
@@ -2,6 +2,7 @@ from typing import TYPE_CHECKING
 from projectile import Projectile
 from vector import Vector
 from tag import Tag
+from collision_layer import CollisionKind, layer_for
 
 if TYPE_CHECKING:
     from game import Game
@@ -10,6 +11,9 @@ class ShieldBarrier(Projectile):
     """
     Barrier projectile that moves forward and destroys incoming enemy projectiles on collision.
     """
+    __slots__ = ('lifespan', 'age')
+    POOLED: bool = True
+    
     def __init__(self, game:'Game', x: float, y: float, direction: Vector,
                  speed: float = 20.0, width: float = 12.0, height: float = 12.0,
                  lifespan: float = 2):
@@ -28,6 +32,27 @@ class ShieldBarrier(Projectile):
         )
         self.lifespan = lifespan
         self.age = 0.0
+        self.set_collision_layer(layer_for(self.tag, CollisionKind.BARRIER))
+
+    def reset(self, game:'Game', x: float, y: float, direction: Vector,
+              speed: float = 20.0, width: float = 12.0, height: float = 12.0,
+              lifespan: float = 2) -> None:
+        # Same arguments as __init__, used when the barrier is taken back from its pool
+        super().reset(
+            game=game,
+            x=x, y=y,
+            direction=direction,
+            speed=speed,
+            damage=0.0,
+            targets=[],
+            disappear_on_hit=False,
+            img_url='/static/img/shield.png',
+            width=width,
+            height=height
+        )
+        self.lifespan = lifespan
+        self.age = 0.0
+        self.set_collision_layer(layer_for(self.tag, CollisionKind.BARRIER))
 
     def update(self, players, player_keys, delta_time: float) -> None:
         # Move like a normal projectile
@@ -31,7 +31,8 @@ class ShieldCannon:
             return False
         # mettre à jour position
         x, y = self.position.x, self.position.y
-        barrier = ShieldBarrier(
+        barrier = self.game.acquire(
+            ShieldBarrier,
             game=self.game,
             x=x, y=y,
             direction=self.direction,
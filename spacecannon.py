@@ -63,7 +63,8 @@ class SpaceCannon:
             direction = self.direction
 
         # Create a projectile at the cannon's position
-        projectile = Projectile(
+        projectile = self.game.acquire(
+            Projectile,
             game=self.game,
             x=self.position.x,
             y=self.position.y,
@@ -1,19 +1,31 @@
 from game_object_with_health import GameObjectWithHealth
-from key_touch import KeyTouch
+from player_input import Button, PlayerInputs
 from spacecannon import SpaceCannon
 from shield_cannon import ShieldCannon
 from vector import Vector
-from typing import Dict, Optional, Any, TYPE_CHECKING
+from typing import Dict, Optional, Any, Tuple, TYPE_CHECKING
 if TYPE_CHECKING:
     from game import Game
 from tag import Tag
 from overheat import Overheat
 import math
 
+# Directional cannons: (button bit, key of space_cannons_directions)
+SHOOT_DIRECTIONS: Tuple[Tuple[int, str], ...] = (
+    (Button.SHOOT_UP, 'up'),
+    (Button.SHOOT_DOWN, 'down'),
+    (Button.SHOOT_LEFT, 'left'),
+    (Button.SHOOT_RIGHT, 'right'),
+)
+
 class SpaceShip(GameObjectWithHealth):
     """
     A spaceship that can be controlled by players.
     """
+    __slots__ = ('speed', 'max_x', 'max_y', 'socketio', 'repair_value', 'projectile_speed', 'reload_time',
+                 'projetile_damage', 'space_cannons_directions', 'linked_game_objects', 'overheat', 'shield_cannon',
+                 'heat_shoot', 'heat_shield', 'rotating_cannons', 'player_cannons', 'active_cannons')
+
     def __init__(self, game:'Game', x: float = 50, y: float = 50, speed: float = 25, 
                  max_health: float = 100, socketio=None, z_index: int = 10, 
                  projectile_speed: float = 200.0, projetile_damage: float = 5.0, reload_time: float = 0.3):
@@ -172,13 +184,13 @@ class SpaceShip(GameObjectWithHealth):
         
         return old_position != self.position
     
-    def update(self, players: Dict, player_keys: Dict[int, Dict[str, KeyTouch]], delta_time: float):
+    def update(self, players: Dict, player_keys: PlayerInputs, delta_time: float):
         """
         Update the spaceship state based on player inputs.
         
         Args:
             players (dict): Dictionary of players
-            player_keys (dict[int, dict[str, KeyTouch]]): Dictionary of player keys
+            player_keys (PlayerInputs): Input state of the players
             delta_time (float): Time elapsed since last update in seconds
         """
         self.manage_movement(player_keys, delta_time)
@@ -188,126 +200,99 @@ class SpaceShip(GameObjectWithHealth):
             self.manage_rotate_cannon(player_keys)  # Gère le canon rotatif
         
         # Overheat cooling key
-        cool_active = any(
-            keys.get('cool') and keys['cool'].is_active()
-            for keys in player_keys.values()
-        )
-        if cool_active:
+        if player_keys.buttons & Button.COOL:
             self.overheat.cool_down(delta_time)
         else:
             self.overheat.stop_cooling()
 
-    def manage_movement(self, player_keys: Dict[int, Dict[str, KeyTouch]], delta_time:float) -> None:
-        move_vector: Vector = Vector(0, 0)
-        for keys in player_keys.values():
-            for key in keys.values():
-                if key.is_active():
-                    if key.key_name in ['up', 'down', 'left', 'right']:
-                        move_vector += Vector.from_direction(key.key_name)
-        if move_vector.magnitude() > 0:
-            self.move(move_vector, self.speed * delta_time)
+    def manage_movement(self, player_keys: PlayerInputs, delta_time:float) -> None:
+        dx, dy = player_keys.move_direction()
+        if dx or dy:
+            self.move(Vector(dx, dy), self.speed * delta_time)
 
-    def manage_cannon(self, player_keys: Dict[int, Dict[str, KeyTouch]]) -> None:
+    def manage_cannon(self, player_keys: PlayerInputs) -> None:
         """
         Handle input for the space cannon based on player keys.
         
         Args:
-            player_keys (dict[int, dict[str, KeyTouch]]): Dictionary of player keys
+            player_keys (PlayerInputs): Input state of the players
         """
-        direction_shoot:Dict[str, bool] = {
-            'shoot_up': False,
-            'shoot_down': False,
-            'shoot_left': False,
-            'shoot_right': False
-        }
-        for keys in player_keys.values():
-            for key in keys.values():
-                if key.is_active() and key.key_name in direction_shoot:
-                    direction_shoot[key.key_name] = True
-
-        for dir, isActive in direction_shoot.items():
-            if isActive :
-                dir_shot = dir.removeprefix("shoot_")
+        buttons: int = player_keys.buttons & Button.SHOOT_DIRECTIONS
+        if not buttons:
+            return
+        for bit, dir_shot in SHOOT_DIRECTIONS:
+            if buttons & bit:
                 has_shoot:bool = self.space_cannons_directions[dir_shot].shoot(damage=self.projetile_damage)
                 if has_shoot:
                     self.overheat.add_heat(self.heat_shoot)
 
-    def manage_shield(self, player_keys: Dict[int, Dict[str, KeyTouch]]) -> None:
+    def manage_shield(self, player_keys: PlayerInputs) -> None:
         """
         Gère l'activation du bouclier basé sur les touches des joueurs.
         
         Args:
-            player_keys (dict[int, dict[str, KeyTouch]]): Dictionnaire des touches des joueurs
+            player_keys (PlayerInputs): État des touches des joueurs
         """
         # Mise à jour de la position du canon
         self.shield_cannon.set_position(self.position.x, self.position.y)
         
         # Vérification si la touche shield est pressée par un joueur
-        shield_active = any(
-            keys.get('shield') and keys['shield'].is_active()
-            for keys in player_keys.values()
-        )
-        
-        if shield_active:
+        if player_keys.buttons & Button.SHIELD:
             has_shoot = self.shield_cannon.shoot()
             if has_shoot:
                 self.overheat.add_heat(self.heat_shield)
 
-    def manage_rotate_cannon(self, player_keys: Dict[int, Dict[str, KeyTouch]]) -> None:
+    def manage_rotate_cannon(self, player_keys: PlayerInputs) -> None:
         """
         Gère le tir du canon rotatif basé sur les touches des joueurs.
         
         Args:
-            player_keys (dict[int, dict[str, KeyTouch]]): Dictionnaire des touches des joueurs
+            player_keys (PlayerInputs): État des touches des joueurs
         """
-        # Traiter tous les joueurs qui tirent, pas seulement le premier
-        for player_id, keys in player_keys.items():
-            if (keys.get('shoot') and keys.get('shoot').is_active() and 
-                keys.get('angle') is not None):
+        # Seuls les joueurs qui maintiennent la touche de tir sont parcourus
+        for player_id, player in player_keys.shooters.items():
+            # Récupérer l'angle et l'arme sélectionnée
+            angle = player.angle
+            weapon = player.weapon
+            
+            # S'assurer que l'arme est dans les limites valides et active
+            weapon = max(1, min(4, weapon))
+            if weapon > self.active_cannons:
+                # Utiliser le premier canon si celui demandé n'est pas actif
+                weapon = min(1, self.active_cannons)
+            
+            # Ne tirer que si au moins un canon est actif
+            if self.active_cannons > 0:
+                # Utiliser un canon spécifique au joueur plutôt qu'un partagé
+                player_canon_key = f"{player_id}_{weapon}"
                 
-                # Récupérer l'angle et l'arme sélectionnée
-                angle = keys.get('angle').get_value()
-                weapon_key = keys.get('weapon')
-                weapon = weapon_key.get_value() if weapon_key else 1
+                # Si ce joueur n'a pas encore de canon attribué pour cette arme, en créer un
+                if player_canon_key not in self.player_cannons:
+                    self.player_cannons[player_canon_key] = SpaceCannon(
+                        x=self.position.x, y=self.position.y,
+                        direction=Vector(1, 0),
+                        game=self.game,
+                        reload_time=self.reload_time,
+                        projectile_speed=self.projectile_speed,
+                        img_url='/static/img/green.png',
+                        projectile_width=3, projectile_height=3
+                    )
                 
-                # S'assurer que l'arme est dans les limites valides et active
-                weapon = max(1, min(4, weapon))
-                if weapon > self.active_cannons:
-                    # Utiliser le premier canon si celui demandé n'est pas actif
-                    weapon = min(1, self.active_cannons)
+                # Récupérer le canon du joueur
+                cannon = self.player_cannons[player_canon_key]
                 
-                # Ne tirer que si au moins un canon est actif
-                if self.active_cannons > 0:
-                    # Utiliser un canon spécifique au joueur plutôt qu'un partagé
-                    player_canon_key = f"{player_id}_{weapon}"
-                    
-                    # Si ce joueur n'a pas encore de canon attribué pour cette arme, en créer un
-                    if player_canon_key not in self.player_cannons:
-                        self.player_cannons[player_canon_key] = SpaceCannon(
-                            x=self.position.x, y=self.position.y,
-                            direction=Vector(1, 0),
-                            game=self.game,
-                            reload_time=self.reload_time,
-                            projectile_speed=self.projectile_speed,
-                            img_url='/static/img/green.png',
-                            projectile_width=3, projectile_height=3
-                        )
-                    
-                    # Récupérer le canon du joueur
-                    cannon = self.player_cannons[player_canon_key]
-                    
-                    # Mettre à jour la direction du canon
-                    dir_vec = Vector.from_angle(math.radians(angle))
-                    cannon.direction = dir_vec.normalize()
-                    
-                    # Mettre à jour la position
-                    cannon.set_position(self.position.x, self.position.y)
-                    
-                    # Tirer avec le canon sélectionné (même dégâts pour tous les canons)
-                    has_shot = cannon.shoot(damage=self.projetile_damage)
-                    if has_shot:
-                        # Même chaleur générée pour tous les canons
-                        self.overheat.add_heat(self.heat_shoot)
+                # Mettre à jour la direction du canon
+                dir_vec = Vector.from_angle(math.radians(angle))
+                cannon.direction = dir_vec.normalize()
+                
+                # Mettre à jour la position
+                cannon.set_position(self.position.x, self.position.y)
+                
+                # Tirer avec le canon sélectionné (même dégâts pour tous les canons)
+                has_shot = cannon.shoot(damage=self.projetile_damage)
+                if has_shot:
+                    # Même chaleur générée pour tous les canons
+                    self.overheat.add_heat(self.heat_shoot)
     
     def set_active_cannons(self, count: int) -> None:
         """
@@ -321,7 +306,7 @@ class SpaceShip(GameObjectWithHealth):
         
         # Notifier les clients si socketio est disponible
         if self.socketio:
-            self.socketio.emit('update_active_cannons', {'active_cannons': self.active_cannons})
+            self.socketio.emit('update_active_cannons', {'active_cannons': self.active_cannons}, to=self.game.room)
         
         # Journaliser le changement
         import logging
@@ -347,7 +332,7 @@ class SpaceShip(GameObjectWithHealth):
                     'max': self.getMaxHealth()
                 }
             }
-            self.socketio.emit('spaceship_health_update', health_data)
+            self.socketio.emit('spaceship_health_update', health_data, to=self.game.room)
             
         return remaining_health
     
@@ -363,19 +348,28 @@ class SpaceShip(GameObjectWithHealth):
                     'max': self.getMaxHealth()
                 }
             }
-            self.socketio.emit('spaceship_health_update', health_data)
+            self.socketio.emit('spaceship_health_update', health_data, to=self.game.room)
         return new_health
     
-    def to_dict(self) -> Dict[str, Any]:
+    def dynamic_dict(self) -> Dict[str, Any]:
         """
-        Convert the spaceship data to a dictionary for sending to clients.
+        Dynamic spaceship data for sending to clients.
         
         Returns:
             dict: Spaceship data
         """
-        data = super().to_dict()
+        data = super().dynamic_dict()
         data['temperature'] = self.overheat.temperature
         data['maxTemperature'] = self.overheat.max_temp
         data['active_cannons'] = self.active_cannons
         return data
+    
+    def state_key(self) -> Tuple:
+        """
+        Values of the dynamic fields, including temperature and active cannons.
+        
+        Returns:
+            tuple: Position, active flag, health, temperature and active cannons
+        """
+        return super().state_key() + (self.overheat.temperature, self.overheat.max_temp, self.active_cannons)
 
@@ -154,7 +154,7 @@ class SpaceshipSettingsWindow:
                 
                 # Notify clients about the change
                 if self.game.socketio:
-                    self.game.socketio.emit('update_active_cannons', {'active_cannons': active_cannons})
+                    self.game.socketio.emit('update_active_cannons', {'active_cannons': active_cannons}, to=self.game.room)
         except ValueError:
             # Reset to current value if invalid input
             self.active_cannons_var.set(self.active_cannons)
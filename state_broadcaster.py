@@ -0,0 +1,214 @@
+import time
+import logging
+from typing import Any, Dict, List, Optional, TYPE_CHECKING
+from delta_encoder import DeltaEncoder
+from binary_state_codec import BinaryStateCodec
+from frame_cache import FrameCache
+from interest import VIEWS, view_room
+from async_mode import join_task, sleep, start_task
+if TYPE_CHECKING:
+    from game import Game
+
+class StateBroadcaster:
+    """
+    Network send loop running in its own thread at its own rate.
+    Each round takes a snapshot of the game state while holding the game lock,
+    which only blocks the simulation for the time of building plain dicts, then
+    serializes and emits it outside the lock so socket I/O never stalls physics.
+    Rounds with no new simulation tick since the last send are skipped.
+    With the 'json' wire format, keyframes are sent on 'game_state_update' and
+    the frames in between on 'game_state_delta' (see DeltaEncoder). With the
+    opt-in 'binary' wire format, every frame is a full binary state sent on
+    'game_state_binary' (see BinaryStateCodec).
+    With encode_once, JSON frames are serialized once per tick through a
+    FrameCache and emitted pre-encoded, which needs SocketIO(json=FrameJSON).
+    Each view in use (see interest.VIEWS) gets its own filtered stream, sent
+    to the room of the view, with its own delta encoder.
+    """
+    JSON: str = 'json'
+    BINARY: str = 'binary'
+
+    def __init__(self, game: 'Game', emit_rate: float = 30.0, use_deltas: bool = True, keyframe_interval: int = 60,
+                 wire_format: str = 'json', encode_once: bool = False):
+        """
+        Initialize the broadcaster.
+
+        Args:
+            game (Game): The game whose state is sent
+            emit_rate (float): Broadcasts per second
+            use_deltas (bool): Send deltas between keyframes instead of full states
+            keyframe_interval (int): Frames between two keyframes when deltas are used
+            wire_format (str): 'json' or 'binary'
+            encode_once (bool): Emit JSON frames pre-encoded from the frame cache
+        """
+        self.game: 'Game' = game
+        self.use_deltas: bool = use_deltas
+        self.keyframe_interval: int = keyframe_interval
+        self.encoders: Dict[str, DeltaEncoder] = {}  # One delta stream per view
+        self.binary_codec: BinaryStateCodec = BinaryStateCodec()
+        self.encode_once: bool = encode_once
+        self.frame_cache: FrameCache = FrameCache()
+        self.set_wire_format(wire_format)
+        self.running: bool = False
+        self.thread: Any = None  # Send loop task, a thread or a green thread (see async_mode)
+        self.set_rate(emit_rate)
+        self.last_tick: int = -1          # Simulation tick of the last snapshot sent
+        self.rounds: int = 0              # Broadcasts that sent a state, one snapshot each
+        self.emits: int = 0               # Frames sent, one per view in use and round
+        self.keyframes: int = 0
+        self.binary_frames: int = 0
+        self.skipped: int = 0             # Rounds without a new tick
+        self.total_snapshot_time: float = 0.0  # Time spent holding the game lock
+        self.total_emit_time: float = 0.0      # Time spent serializing and sending
+        self.binary_bytes: int = 0             # Size of the binary frames sent
+
+    def set_rate(self, emit_rate: float) -> None:
+        """
+        Change the broadcast frequency.
+
+        Args:
+            emit_rate (float): Broadcasts per second
+        """
+        if emit_rate <= 0:
+            raise ValueError("emit_rate must be positive")
+        self.emit_rate: float = emit_rate
+        self.emit_interval: float = 1.0 / emit_rate
+
+    def set_wire_format(self, wire_format: str) -> None:
+        """
+        Choose how state frames are encoded.
+
+        Args:
+            wire_format (str): 'json' (keyframes and deltas) or 'binary' (packed full frames)
+        """
+        if wire_format not in (self.JSON, self.BINARY):
+            raise ValueError(f"Unknown wire format: {wire_format}")
+        self.wire_format: str = wire_format
+
+    def start(self) -> None:
+        """Start the send loop in a background task"""
+        if self.running:
+            return
+        self.running = True
+        self.thread = start_task(self.game.socketio, self._send_loop)
+
+    def stop(self) -> None:
+        """Stop the send loop"""
+        self.running = False
+        join_task(self.thread, timeout=1.0)
+
+    def _send_loop(self) -> None:
+        """Send loop - runs in a background task"""
+        next_time: float = time.perf_counter()
+        while self.running:
+            try:
+                self.broadcast()
+            except Exception:
+                logging.exception("State broadcast failed")
+            next_time += self.emit_interval
+            wait: float = next_time - time.perf_counter()
+            if wait < 0:
+                # En retard : repartir de maintenant sans rattraper les envois manqués
+                next_time = time.perf_counter()
+                wait = 0.0
+            sleep(self.game.socketio, wait)
+
+    def broadcast(self) -> bool:
+        """
+        Send the current state to the clients of every view in use if the simulation advanced.
+
+        Returns:
+            bool: True if a state was sent
+        """
+        start: float = time.perf_counter()
+        with self.game.lock:
+            tick: int = self.game.tick
+            if tick == self.last_tick:
+                self.skipped += 1
+                return False
+            frame_time: float = self.game.frame_time()
+            state_start: float = time.perf_counter()
+            state: Dict[str, Any] = self.game.get_state()
+            state_time: float = time.perf_counter() - state_start
+            ship_x, ship_y = self.game.spaceship.position.as_tuple()
+            views: List[str] = self.game.get_active_views()
+        snapshot_done: float = time.perf_counter()
+
+        self.last_tick = tick
+        self.rounds += 1
+        for view in views:
+            self._send_view(view, tick, frame_time, VIEWS[view].select(state['gameObjects'], ship_x, ship_y))
+        emit_time: float = time.perf_counter() - snapshot_done
+        self.total_snapshot_time += snapshot_done - start
+        self.total_emit_time += emit_time
+        self.game.profiler.record('get_state', state_time)
+        self.game.profiler.record('emit', emit_time)
+        return True
+
+    def _send_view(self, view: str, tick: int, frame_time: float, objects: List[Dict[str, Any]]) -> None:
+        """Encode the objects selected for a view and send them to its room."""
+        room: str = view_room(view, self.game.room)
+        if self.wire_format == self.BINARY:
+            payload: bytes = self.binary_codec.encode(tick, objects, frame_time)
+            self.binary_bytes += len(payload)
+            self.binary_frames += 1
+            self.game.socketio.emit('game_state_binary', payload, to=room)
+            self.keyframes += 1
+        else:
+            if self.use_deltas:
+                is_keyframe, frame = self._encoder(view).encode(tick, objects, frame_time)
+            else:
+                is_keyframe, frame = True, {'tick': tick, 'time': frame_time, 'gameObjects': objects}
+            if self.encode_once:
+                channel: str = f"{view}:{'keyframe' if is_keyframe else 'delta'}"
+                frame = self.frame_cache.get(tick, channel, lambda: frame)
+            self.game.socketio.emit('game_state_update' if is_keyframe else 'game_state_delta', frame, to=room)
+            self.keyframes += is_keyframe
+        self.emits += 1
+
+    def _encoder(self, view: str) -> DeltaEncoder:
+        """Get the delta encoder of a view, created on first use."""
+        encoder: Optional[DeltaEncoder] = self.encoders.get(view)
+        if encoder is None:
+            encoder = self.encoders[view] = DeltaEncoder(keyframe_interval=self.keyframe_interval)
+        return encoder
+
+    def get_keyframe_payload(self, view: str) -> Any:
+        """
+        Get the keyframe answering a request_game_state, ready to emit.
+        With encode_once, every request of the same tick shares one encoded frame,
+        the broadcast keyframe itself when that tick was a keyframe.
+
+        Args:
+            view (str): View of the requesting client
+
+        Returns:
+            dict or EncodedFrame or None: The keyframe, None if no frame was sent yet for this view
+        """
+        encoder: Optional[DeltaEncoder] = self.encoders.get(view)
+        last_frame = encoder.last_frame if encoder is not None else None
+        if last_frame is None or not self.encode_once:
+            return encoder.keyframe(last_frame) if last_frame is not None else None
+        return self.frame_cache.get(last_frame[0], f"{view}:keyframe", lambda: encoder.keyframe(last_frame))
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Get the broadcaster statistics.
+
+        Returns:
+            dict: Rate, wire format, round, emit and keyframe counts, mean snapshot duration per round
+                  and emit duration per frame in ms, mean binary frame size in bytes and the frame cache statistics
+        """
+        return {
+            'emit_rate': self.emit_rate,
+            'wire_format': self.wire_format,
+            'rounds': self.rounds,
+            'emits': self.emits,
+            'keyframes': self.keyframes,
+            'skipped': self.skipped,
+            # One snapshot per round, shared by the views
+            'mean_snapshot_ms': self.total_snapshot_time / self.rounds * 1000 if self.rounds else 0.0,
+            'mean_emit_ms': self.total_emit_time / self.emits * 1000 if self.emits else 0.0,
+            'mean_binary_bytes': self.binary_bytes / self.binary_frames if self.binary_frames else 0.0,
+            'frame_cache': self.frame_cache.get_stats()
+        }
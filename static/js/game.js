@@ -4,6 +4,8 @@ document.addEventListener('DOMContentLoaded', () => {
     const gameArea = document.querySelector('.game-area');
     const playerNameInput = document.getElementById('playerName');
     const joinBtn = document.getElementById('joinBtn');
+    const roomCodeInput = document.getElementById('roomCode');
+    const roomLabel = document.getElementById('roomLabel');
     const playersList = document.getElementById('playersList');
     const connectionStatus = document.getElementById('connectionStatus');
     const gameStatus = document.getElementById('gameStatus');
@@ -89,6 +91,11 @@ document.addEventListener('DOMContentLoaded', () => {
     };
     let gameObjects = []; // Store all game objects for rendering
     
+    // Snapshots delta : objets de la dernière frame appliquée, par ID
+    let snapshotObjects = new Map();
+    let snapshotTick = null; // Tick de la dernière frame appliquée (base du prochain delta)
+    let resyncPending = false;
+    
     // Track pressed keys locally
     const pressedKeys = {
         up: false,
@@ -262,7 +269,9 @@ document.addEventListener('DOMContentLoaded', () => {
 
     // Initialize the game connection
     function initConnection() {
-        socket = io();
+        // Salle rejointe : code saisi ou ?room=CODE, la salle principale sinon
+        const room = roomCodeInput.value.trim().toUpperCase();
+        socket = io(room ? { query: { room: room } } : {});
         
         // Connection events
         socket.on('connect', () => {
@@ -270,6 +279,12 @@ document.addEventListener('DOMContentLoaded', () => {
             connectionStatus.textContent = 'Connected to game server!';
             connectionStatus.className = 'connected';
             playerId = socket.id;
+            
+            // Vue optionnelle (ex: ?view=gunner) pour ne recevoir que les objets utiles
+            const view = new URLSearchParams(window.location.search).get('view');
+            if (view) {
+                socket.emit('set_view', { view: view });
+            }
         });
         
         socket.on('disconnect', () => {
@@ -281,6 +296,11 @@ document.addEventListener('DOMContentLoaded', () => {
             Object.keys(pressedKeys).forEach(key => pressedKeys[key] = false);
         });
         
+        // Code of the room actually joined, share it with the crew
+        socket.on('room_joined', (data) => {
+            roomLabel.textContent = data.room;
+        });
+        
         // Game events
         socket.on('player_list', (players) => {
             updatePlayersList(players);
@@ -306,9 +326,19 @@ document.addEventListener('DOMContentLoaded', () => {
             updatePlayerInList(player);
         });
         
-        // Game state update event
+        // Game state update event (keyframe: every object in full)
         socket.on('game_state_update', (newState) => {
-            updateGameState(newState);
+            applyKeyframe(newState);
+        });
+        
+        // Changes since the previous frame
+        socket.on('game_state_delta', (delta) => {
+            applyDelta(delta);
+        });
+        
+        // Full state in the compact binary format (opt-in on the server)
+        socket.on('game_state_binary', (buffer) => {
+            applyKeyframe(decodeBinaryState(buffer));
         });
         
         socket.on('player_action', (action) => {
@@ -389,6 +419,130 @@ document.addEventListener('DOMContentLoaded', () => {
         }
     }
     
+    // Replace the known objects by those of a keyframe
+    function applyKeyframe(state) {
+        snapshotObjects = new Map(state.gameObjects.map(obj => [obj.id, obj]));
+        snapshotTick = state.tick !== undefined ? state.tick : null;
+        resyncPending = false;
+        updateGameState(state);
+    }
+    
+    // Apply a delta (created / moved / updated / removed objects) on top of the previous frame
+    function applyDelta(delta) {
+        if (snapshotTick !== null && delta.tick <= snapshotTick) return; // Frame déjà couverte
+        if (delta.baseTick !== snapshotTick) {
+            // Frame manquée ou pas encore synchronisé : redemander un keyframe
+            requestResync();
+            return;
+        }
+        
+        delta.removed.forEach(id => snapshotObjects.delete(id));
+        delta.created.forEach(obj => snapshotObjects.set(obj.id, obj));
+        delta.moved.forEach(([id, x, y]) => {
+            const obj = snapshotObjects.get(id);
+            if (obj) {
+                obj.x = x;
+                obj.y = y;
+            }
+        });
+        delta.updated.forEach(changes => {
+            const obj = snapshotObjects.get(changes.id);
+            if (!obj) return;
+            // Champs que l'objet n'a plus (colliders retirés, image supprimée), ou sous-objets remplacés en entier
+            if (changes.cleared) changes.cleared.forEach(key => delete obj[key]);
+            Object.keys(changes).forEach(key => {
+                if (key === 'cleared') return;
+                const value = changes[key];
+                // Les sous-objets (image, health) ne contiennent que les champs modifiés
+                if (value && typeof value === 'object' && !Array.isArray(value) && obj[key]) {
+                    Object.assign(obj[key], value);
+                } else {
+                    obj[key] = value;
+                }
+            });
+        });
+        
+        snapshotTick = delta.tick;
+        updateGameState({ tick: delta.tick, time: delta.time, gameObjects: Array.from(snapshotObjects.values()) });
+    }
+    
+    // Décoder une frame binaire (voir binary_state_codec.py pour le format)
+    const BINARY_FLAG_ACTIVE = 1;
+    const BINARY_FLAG_IMAGE = 2;
+    const BINARY_FLAG_RELATIVE_SIZE = 4;
+    const BINARY_FLAG_HEALTH = 8;
+    const BINARY_FLAG_SHIP = 16;
+    const BINARY_FLAG_VELOCITY = 32;
+    const textDecoder = new TextDecoder();
+    
+    function decodeBinaryState(buffer) {
+        const bytes = buffer instanceof ArrayBuffer ? new Uint8Array(buffer) : new Uint8Array(buffer.buffer, buffer.byteOffset, buffer.byteLength);
+        const view = new DataView(bytes.buffer, bytes.byteOffset, bytes.byteLength);
+        const tick = view.getUint32(4, true);
+        const time = view.getFloat64(8, true);
+        const objectCount = view.getUint16(16, true);
+        const stringCount = view.getUint8(18);
+        let offset = 19;
+        
+        const strings = [];
+        for (let i = 0; i < stringCount; i++) {
+            const length = view.getUint8(offset);
+            strings.push(textDecoder.decode(bytes.subarray(offset + 1, offset + 1 + length)));
+            offset += 1 + length;
+        }
+        
+        const objects = [];
+        for (let i = 0; i < objectCount; i++) {
+            const numericId = view.getInt32(offset, true);
+            const imageIndex = view.getUint8(offset + 4);
+            const flags = view.getUint8(offset + 5);
+            const obj = {
+                id: numericId >= 0 ? `obj_${numericId}` : strings[-numericId - 1],
+                z_index: view.getInt16(offset + 6, true),
+                x: view.getFloat32(offset + 8, true),
+                y: view.getFloat32(offset + 12, true),
+                width: view.getFloat32(offset + 16, true),
+                height: view.getFloat32(offset + 20, true),
+                active: (flags & BINARY_FLAG_ACTIVE) !== 0
+            };
+            offset += 24;
+            if (flags & BINARY_FLAG_IMAGE) {
+                obj.image = {
+                    url: strings[imageIndex],
+                    width: view.getFloat32(offset, true),
+                    height: view.getFloat32(offset + 4, true),
+                    angle: view.getFloat32(offset + 8, true),
+                    opacity: view.getFloat32(offset + 12, true),
+                    useRelativeSize: (flags & BINARY_FLAG_RELATIVE_SIZE) !== 0
+                };
+                offset += 16;
+            }
+            if (flags & BINARY_FLAG_HEALTH) {
+                obj.health = { current: view.getFloat32(offset, true), max: view.getFloat32(offset + 4, true) };
+                offset += 8;
+            }
+            if (flags & BINARY_FLAG_SHIP) {
+                obj.temperature = view.getFloat32(offset, true);
+                obj.maxTemperature = view.getFloat32(offset + 4, true);
+                obj.active_cannons = view.getUint8(offset + 8);
+                offset += 9;
+            }
+            if (flags & BINARY_FLAG_VELOCITY) {
+                // Objets en ligne droite, extrapolés par le snapshot buffer
+                obj.velocity = { x: view.getFloat32(offset, true), y: view.getFloat32(offset + 4, true) };
+                offset += 8;
+            }
+            objects.push(obj);
+        }
+        return { tick: tick, time: time, keyframe: true, gameObjects: objects };
+    }
+    
+    function requestResync() {
+        if (resyncPending || !socket) return;
+        resyncPending = true;
+        socket.emit('request_game_state');
+    }
+    
     // Update game state and render all game objects
     function updateGameState(newState) {
         gameState = newState;
@@ -399,8 +553,8 @@ document.addEventListener('DOMContentLoaded', () => {
         // Sort objects by z-index for proper rendering order (lower z-index first)
         sortedObjects.sort((a, b) => (a.z_index || 0) - (b.z_index || 0));
         
-        // Render all game objects with a unified approach
-        renderGameObjects(sortedObjects);
+        // Drawn from the animation frames, slightly in the past (see snapshotBuffer)
+        snapshotBuffer.push(gameState.time, sortedObjects);
         
         // Update spaceship health bar if the spaceship exists
         const shipObject = sortedObjects.find(obj => obj.id === 'spaceship');
@@ -644,6 +798,310 @@ document.addEventListener('DOMContentLoaded', () => {
         }
     }
     
+    // Sprites du jeu, chargés dans l'atlas au démarrage (les autres URL y sont ajoutées à leur première apparition)
+    const SPRITE_URLS = [
+        '/static/img/spaceship.png', '/static/img/asteroid.png', '/static/img/green.png', '/static/img/jaune.png',
+        '/static/img/red.png', '/static/img/shield.png', '/static/img/white.png'
+    ];
+    const ATLAS_MAX_WIDTH = 1024;
+    const ATLAS_PADDING = 1; // Évite que le filtrage déborde sur le sprite voisin
+    
+    // Texture atlas: every sprite copied once into a single canvas, objects are drawn from regions of it
+    function createSpriteAtlas(urls) {
+        const canvas = document.createElement('canvas');
+        const images = new Map();  // url -> Image chargée
+        const regions = new Map(); // url -> { x, y, width, height } dans l'atlas
+        const loading = new Set();
+        
+        // Rangement en étagères : les sprites sont posés de gauche à droite, une nouvelle rangée quand elle est pleine
+        function pack() {
+            const sprites = Array.from(images.entries()).sort((a, b) => b[1].naturalHeight - a[1].naturalHeight);
+            let x = 0, y = 0, rowHeight = 0, width = 0;
+            regions.clear();
+            sprites.forEach(([url, image]) => {
+                if (x > 0 && x + image.naturalWidth > ATLAS_MAX_WIDTH) {
+                    x = 0;
+                    y += rowHeight + ATLAS_PADDING;
+                    rowHeight = 0;
+                }
+                regions.set(url, { x: x, y: y, width: image.naturalWidth, height: image.naturalHeight });
+                x += image.naturalWidth + ATLAS_PADDING;
+                rowHeight = Math.max(rowHeight, image.naturalHeight);
+                width = Math.max(width, x);
+            });
+            canvas.width = Math.max(1, width);
+            canvas.height = Math.max(1, y + rowHeight);
+            const context = canvas.getContext('2d');
+            regions.forEach((region, url) => context.drawImage(images.get(url), region.x, region.y));
+        }
+        
+        function load(url) {
+            loading.add(url);
+            const image = new Image();
+            image.onload = () => {
+                loading.delete(url);
+                images.set(url, image);
+                pack();
+            };
+            image.onerror = () => console.error(`Sprite not found: ${url}`);
+            image.src = url;
+        }
+        
+        urls.forEach(load);
+        
+        return {
+            canvas: canvas,
+            // Région d'un sprite, null tant qu'il n'est pas chargé
+            region(url) {
+                const region = regions.get(url);
+                if (!region && !loading.has(url) && !images.has(url)) load(url);
+                return region || null;
+            }
+        };
+    }
+    
+    // DOM renderer: one positioned div per object (see renderGameObjects)
+    function createDomRenderer() {
+        return { name: 'dom', render: renderGameObjects };
+    }
+    
+    // Canvas renderer: the whole board drawn on one canvas from the sprite atlas, no layout work per object
+    function createCanvasRenderer(container) {
+        const canvas = document.createElement('canvas');
+        canvas.className = 'game-canvas';
+        container.insertBefore(canvas, container.firstChild);
+        const context = canvas.getContext('2d');
+        const atlas = createSpriteAtlas(SPRITE_URLS);
+        const colliders = []; // Objets dont les colliders sont dessinés après les sprites (mode debug)
+        // Le vaisseau est dessiné sur le canvas comme les autres objets
+        if (spaceship) spaceship.style.display = 'none';
+        
+        // Canvas à la taille du conteneur en pixels physiques, pour rester net sur les écrans haute densité
+        function resize() {
+            const ratio = window.devicePixelRatio || 1;
+            const width = Math.round(container.clientWidth * ratio);
+            const height = Math.round(container.clientHeight * ratio);
+            if (canvas.width !== width || canvas.height !== height) {
+                canvas.width = width;
+                canvas.height = height;
+            }
+        }
+        
+        function render(objects) {
+            resize();
+            context.setTransform(1, 0, 0, 1, 0, 0);
+            context.globalAlpha = 1.0;
+            context.clearRect(0, 0, canvas.width, canvas.height);
+            // Les positions et tailles sont en pourcentage du conteneur
+            const unitX = canvas.width / 100;
+            const unitY = canvas.height / 100;
+            
+            objects.forEach(obj => {
+                if (!obj || obj.active === false) return;
+                // Debug : contour des colliders, au-dessus du sprite
+                if (obj.colliders && window.debugMode) colliders.push(obj);
+                if (!obj.image) return;
+                const region = atlas.region(obj.image.url);
+                if (!region) return;
+                
+                // Même boîte que le rendu DOM, l'image y est contenue (background-size: contain)
+                const boxWidth = (obj.image.useRelativeSize ? obj.image.width : 8) * unitX;
+                const boxHeight = (obj.image.useRelativeSize ? obj.image.height : 8) * unitY;
+                const fit = Math.min(boxWidth / region.width, boxHeight / region.height);
+                const drawWidth = region.width * fit;
+                const drawHeight = region.height * fit;
+                const angle = obj.image.angle || 0;
+                const cos = Math.cos(angle);
+                const sin = Math.sin(angle);
+                
+                context.globalAlpha = obj.image.opacity !== undefined ? obj.image.opacity : 1.0;
+                context.setTransform(cos, sin, -sin, cos, obj.x * unitX, obj.y * unitY);
+                context.drawImage(atlas.canvas, region.x, region.y, region.width, region.height,
+                                  -drawWidth / 2, -drawHeight / 2, drawWidth, drawHeight);
+            });
+            
+            if (colliders.length) {
+                drawColliders(colliders, unitX, unitY);
+                colliders.length = 0;
+            }
+        }
+        
+        // Rectangles testés par le serveur (Collider.get_corners), en unités du jeu puis en pixels
+        function drawColliders(objects, unitX, unitY) {
+            context.setTransform(1, 0, 0, 1, 0, 0);
+            context.globalAlpha = 1.0;
+            context.strokeStyle = 'rgba(255, 0, 0, 0.7)';
+            context.lineWidth = 1;
+            context.setLineDash([4, 3]);
+            context.beginPath();
+            objects.forEach(obj => {
+                if (!Array.isArray(obj.colliders)) return;
+                obj.colliders.forEach(collider => {
+                    const centerX = obj.x + (collider.offsetX || 0);
+                    const centerY = obj.y + (collider.offsetY || 0);
+                    const cos = Math.cos(collider.angle || 0);
+                    const sin = Math.sin(collider.angle || 0);
+                    const halfWidth = collider.width / 2;
+                    const halfHeight = collider.height / 2;
+                    [[-halfWidth, -halfHeight], [halfWidth, -halfHeight], [halfWidth, halfHeight], [-halfWidth, halfHeight]]
+                        .forEach(([x, y], index) => {
+                            const pixelX = (centerX + x * cos - y * sin) * unitX;
+                            const pixelY = (centerY + x * sin + y * cos) * unitY;
+                            if (index === 0) context.moveTo(pixelX, pixelY);
+                            else context.lineTo(pixelX, pixelY);
+                        });
+                    context.closePath();
+                });
+            });
+            context.stroke();
+            context.setLineDash([]);
+        }
+        
+        return { name: 'canvas', render: render };
+    }
+    
+    // Rendu choisi par ?renderer=dom|canvas, canvas par défaut
+    const rendererName = new URLSearchParams(window.location.search).get('renderer') === 'dom' ? 'dom' : 'canvas';
+    const renderer = rendererName === 'dom' ? createDomRenderer() : createCanvasRenderer(spaceshipContainer);
+    
+    // Interpolation : rendu en retard d'environ deux intervalles entre frames, ?interp=0 pour dessiner chaque frame à son arrivée
+    const INTERPOLATION = new URLSearchParams(window.location.search).get('interp') !== '0';
+    const INTERPOLATION_DELAY_MIN = 50;    // ms
+    const INTERPOLATION_DELAY_MAX = 300;   // ms
+    const MAX_EXTRAPOLATION = 250;         // ms au-delà de la dernière frame, pour les objets en ligne droite
+    const CLOCK_RESET_THRESHOLD = 1000;    // ms de retard des frames au-delà duquel l'horloge est recalée (pause, onglet masqué)
+    const SNAPSHOT_HISTORY = 32;
+    
+    // Snapshot buffer: states received with their server time, replayed on the local clock slightly in the past.
+    // Positions are interpolated between the two snapshots around the render time, objects moving in a
+    // straight line (sent with a velocity) are extrapolated for a while when the next snapshot is late.
+    function createSnapshotBuffer() {
+        const snapshots = []; // { time, objects, positions: Map id -> [x, y] }, par temps croissant
+        let clockOffset = null; // Heure locale - heure serveur, estimée sur les frames les plus rapides
+        let meanInterval = 1000 / 30; // Intervalle moyen entre frames (ms, temps serveur)
+        let latestObjects = null;     // Sans interpolation : dernière frame pas encore dessinée
+        let settled = false;          // Rien n'a changé depuis le dernier rendu
+        
+        function updateClock(serverTime) {
+            const sample = performance.now() - serverTime;
+            if (clockOffset === null || sample < clockOffset || sample - clockOffset > CLOCK_RESET_THRESHOLD) {
+                clockOffset = sample;
+            } else {
+                // Dérive lente vers le haut, pour suivre une latence qui augmente
+                clockOffset += (sample - clockOffset) * 0.02;
+            }
+        }
+        
+        function delay() {
+            return Math.min(INTERPOLATION_DELAY_MAX, Math.max(INTERPOLATION_DELAY_MIN, 2 * meanInterval));
+        }
+        
+        function push(serverTime, objects) {
+            if (!INTERPOLATION || serverTime === undefined) {
+                latestObjects = objects;
+                return;
+            }
+            const last = snapshots[snapshots.length - 1];
+            if (last && serverTime <= last.time) {
+                // Keyframe de resynchronisation du même tick, ou horloge serveur repartie de zéro
+                if (serverTime < last.time) snapshots.length = 0;
+                else snapshots.pop();
+            } else if (last) {
+                meanInterval += (Math.min(serverTime - last.time, INTERPOLATION_DELAY_MAX) - meanInterval) * 0.1;
+            }
+            // Les objets sont modifiés en place par les deltas suivants : copier les positions
+            const positions = new Map();
+            objects.forEach(obj => positions.set(obj.id, [obj.x, obj.y]));
+            snapshots.push({ time: serverTime, objects: objects, positions: positions });
+            if (snapshots.length > SNAPSHOT_HISTORY) snapshots.shift();
+            updateClock(serverTime);
+            settled = false;
+        }
+        
+        function place(obj, x, y) {
+            return (x === obj.x && y === obj.y) ? obj : Object.assign({}, obj, { x: x, y: y });
+        }
+        
+        // Objets à dessiner à l'instant local now, null si rien n'a changé depuis le dernier rendu
+        function objectsAt(now) {
+            if (!INTERPOLATION || !snapshots.length) {
+                const objects = latestObjects;
+                latestObjects = null;
+                return objects;
+            }
+            if (settled) return null;
+            const renderTime = now - clockOffset - delay();
+            
+            // Retirer les snapshots devenus inutiles (on garde celui juste avant renderTime)
+            while (snapshots.length > 2 && snapshots[1].time <= renderTime) snapshots.shift();
+            
+            const newest = snapshots[snapshots.length - 1];
+            if (renderTime >= newest.time) {
+                // Frame suivante en retard : extrapoler les objets en ligne droite
+                const elapsed = Math.min(renderTime - newest.time, MAX_EXTRAPOLATION);
+                if (renderTime - newest.time >= MAX_EXTRAPOLATION) settled = true;
+                return newest.objects.map(obj => {
+                    const [x, y] = newest.positions.get(obj.id);
+                    if (!obj.velocity) return place(obj, x, y);
+                    return place(obj, x + obj.velocity.x * elapsed / 1000, y + obj.velocity.y * elapsed / 1000);
+                });
+            }
+            
+            const older = snapshots[0];
+            if (renderTime <= older.time || snapshots.length < 2) {
+                return older.objects.map(obj => place(obj, ...older.positions.get(obj.id)));
+            }
+            const newer = snapshots[1];
+            const alpha = (renderTime - older.time) / (newer.time - older.time);
+            return newer.objects.map(obj => {
+                const [x1, y1] = newer.positions.get(obj.id);
+                const from = older.positions.get(obj.id);
+                if (!from) return place(obj, x1, y1);
+                return place(obj, from[0] + (x1 - from[0]) * alpha, from[1] + (y1 - from[1]) * alpha);
+            });
+        }
+        
+        return { push: push, objectsAt: objectsAt };
+    }
+    
+    const snapshotBuffer = createSnapshotBuffer();
+    
+    // Compteur d'images (?fps=1) : animation frames par seconde, frames dessinées et temps de rendu moyen
+    const fpsCounter = new URLSearchParams(window.location.search).has('fps') ? document.createElement('div') : null;
+    if (fpsCounter) {
+        fpsCounter.className = 'fps-counter';
+        spaceshipContainer.appendChild(fpsCounter);
+    }
+    const fpsStats = { start: performance.now(), animationFrames: 0, renders: 0, renderTime: 0 };
+    
+    function updateFpsCounter(now) {
+        fpsStats.animationFrames++;
+        const elapsed = now - fpsStats.start;
+        if (elapsed < 1000) return;
+        const fps = fpsStats.animationFrames * 1000 / elapsed;
+        const drawn = fpsStats.renders * 1000 / elapsed;
+        const renderMs = fpsStats.renders ? fpsStats.renderTime / fpsStats.renders : 0;
+        fpsCounter.textContent = `${renderer.name} ${fps.toFixed(0)} fps · ${drawn.toFixed(0)} frames/s · ${renderMs.toFixed(2)} ms`;
+        fpsStats.start = now;
+        fpsStats.animationFrames = 0;
+        fpsStats.renders = 0;
+        fpsStats.renderTime = 0;
+    }
+    
+    // Boucle d'affichage : au plus un rendu par rafraîchissement de l'écran
+    function renderLoop(now) {
+        const objects = snapshotBuffer.objectsAt(now);
+        if (objects) {
+            const start = performance.now();
+            renderer.render(objects);
+            fpsStats.renderTime += performance.now() - start;
+            fpsStats.renders++;
+        }
+        if (fpsCounter) updateFpsCounter(now);
+        requestAnimationFrame(renderLoop);
+    }
+    requestAnimationFrame(renderLoop);
+    
     // Fonction pour mettre à jour les boutons d'armes actives
     function updateActiveWeapons(activeCount) {
         // Mettre à jour les boutons d'armes
@@ -935,6 +1393,9 @@ document.addEventListener('DOMContentLoaded', () => {
         }
     });
     
+    // Pré-remplir le code de salle depuis l'URL (?room=CODE)
+    roomCodeInput.value = new URLSearchParams(window.location.search).get('room') || '';
+    
     // Allow pressing Enter to join
     playerNameInput.addEventListener('keyup', (e) => {
         if (e.key === 'Enter') {
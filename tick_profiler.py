@@ -0,0 +1,173 @@
+import io
+import time
+import pstats
+import cProfile
+from collections import deque
+from typing import Any, Deque, Dict, List, Optional, Tuple
+
+# Percentiles reported for every phase and count
+QUANTILES: Tuple[float, ...] = (0.5, 0.95, 0.99)
+
+
+class RollingSeries:
+    """
+    Values of the last `window` samples, for percentiles, plus the total count
+    and sum of every sample recorded, for rates and means.
+    """
+
+    def __init__(self, window: int):
+        """
+        Initialize an empty series.
+
+        Args:
+            window (int): Number of recent samples kept for the percentiles
+        """
+        self.samples: Deque[float] = deque(maxlen=window)
+        self.count: int = 0
+        self.sum: float = 0.0
+
+    def add(self, value: float) -> None:
+        """Record a sample."""
+        self.samples.append(value)
+        self.count += 1
+        self.sum += value
+
+    def summary(self) -> Dict[str, float]:
+        """
+        Get the percentiles of the recent samples and the totals.
+
+        Returns:
+            dict: 'count' and 'sum' of every sample, 'p50', 'p95' and 'p99' of the recent ones
+        """
+        ordered: List[float] = sorted(self.samples)
+        summary: Dict[str, float] = {'count': self.count, 'sum': self.sum}
+        for quantile in QUANTILES:
+            key: str = f"p{round(quantile * 100)}"
+            summary[key] = ordered[min(len(ordered) - 1, int(quantile * len(ordered)))] if ordered else 0.0
+        return summary
+
+
+class TickProfiler:
+    """
+    Built-in instrumentation of a game's ticks.
+    Game.update marks the end of each of its phases (input, kinematics, object
+    updates, cleanup, collisions) and the broadcaster records the snapshot
+    (get_state) and emit durations. Collision stages record how many pairs they
+    handled. Every series keeps rolling percentiles over the last `window`
+    ticks, reported with the loop statistics and exposed by /metrics.
+    A cProfile capture of the next N ticks can be requested at any time, its
+    report replaces the previous one once the N ticks have run.
+    """
+    # Lines of the cProfile report, sorted by cumulative time
+    REPORT_LINES: int = 30
+
+    def __init__(self, window: int = 600):
+        """
+        Initialize the profiler.
+
+        Args:
+            window (int): Number of recent ticks the percentiles are computed on
+        """
+        self.window: int = window
+        self.phases: Dict[str, RollingSeries] = {}  # Phase name -> durations in seconds
+        self.counts: Dict[str, RollingSeries] = {}  # Count name -> values per tick
+        self.tick_start: float = 0.0
+        self.last_mark: float = 0.0
+        # cProfile capture: ticks still to profile (set from any thread), running profile, last report
+        self.profile_ticks: int = 0
+        self.profile: Optional[cProfile.Profile] = None
+        self.profiled_ticks: int = 0
+        self.profile_report: Optional[str] = None
+
+    def _series(self, table: Dict[str, RollingSeries], name: str) -> RollingSeries:
+        """Get a series, created on first use."""
+        series: Optional[RollingSeries] = table.get(name)
+        if series is None:
+            series = table[name] = RollingSeries(self.window)
+        return series
+
+    def start_tick(self) -> None:
+        """Start timing a tick, and profiling it if a capture is running."""
+        if self.profile_ticks > 0 and self.profile is None:
+            self.profile = cProfile.Profile()
+            self.profiled_ticks = 0
+        if self.profile is not None:
+            self.profile.enable()
+        self.tick_start = self.last_mark = time.perf_counter()
+
+    def mark(self, phase: str) -> None:
+        """
+        Record the duration of a phase of the tick, since the previous mark.
+
+        Args:
+            phase (str): Name of the phase that just ended
+        """
+        now: float = time.perf_counter()
+        self._series(self.phases, phase).add(now - self.last_mark)
+        self.last_mark = now
+
+    def end_tick(self) -> None:
+        """Record the whole tick duration, and finish the capture after its last tick."""
+        self._series(self.phases, 'tick').add(time.perf_counter() - self.tick_start)
+        if self.profile is None:
+            return
+        self.profile.disable()
+        self.profiled_ticks += 1
+        self.profile_ticks -= 1
+        if self.profile_ticks <= 0:
+            self.profile_report = self._report(self.profile, self.profiled_ticks)
+            self.profile = None
+
+    def record(self, phase: str, seconds: float) -> None:
+        """
+        Record the duration of a phase timed elsewhere (broadcast snapshot and emit).
+
+        Args:
+            phase (str): Name of the phase
+            seconds (float): Duration
+        """
+        self._series(self.phases, phase).add(seconds)
+
+    def count(self, name: str, value: int) -> None:
+        """
+        Record a count of the current tick (collision pairs).
+
+        Args:
+            name (str): Name of the count
+            value (int): Value for this tick
+        """
+        self._series(self.counts, name).add(value)
+
+    def start_capture(self, ticks: int) -> None:
+        """
+        Profile the next ticks with cProfile, the report is available after the last one.
+
+        Args:
+            ticks (int): Number of ticks to profile
+        """
+        if ticks <= 0:
+            raise ValueError("ticks must be positive")
+        self.profile_ticks = ticks
+
+    def _report(self, profile: cProfile.Profile, ticks: int) -> str:
+        """Format a finished capture, the most expensive functions first."""
+        stream = io.StringIO()
+        stream.write(f"{ticks} ticks profiled\n")
+        pstats.Stats(profile, stream=stream).sort_stats('cumulative').print_stats(self.REPORT_LINES)
+        return stream.getvalue()
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Get the profiler statistics, small and picklable so shards can report them.
+
+        Returns:
+            dict: 'phases' (duration summaries in seconds by phase), 'counts' (summaries by count name),
+                  'window', 'profiling' (ticks left to capture) and the last cProfile 'report' or None
+        """
+        return {
+            'window': self.window,
+            'phases': {name: series.summary() for name, series in list(self.phases.items())},
+            'counts': {name: series.summary() for name, series in list(self.counts.items())},
+            'profiling': max(0, self.profile_ticks),
+            'report': self.profile_report,
+        }
@@ -6,6 +6,7 @@ class Vector:
     A 2D vector class for game physics and movement calculations.
     Handles vector operations like addition, subtraction, scaling, etc.
     """
+    __slots__ = ('x', 'y')
     
     def __init__(self, x: float = 0.0, y: float = 0.0):
         """
@@ -61,7 +62,49 @@ class Vector:
         if scalar == 0:
             raise ZeroDivisionError("Cannot divide vector by zero")
         return Vector(self.x / scalar, self.y / scalar)
-    
+
+    def __iadd__(self, other) -> 'Vector':
+        """Add another vector in place, without creating a new vector."""
+        if isinstance(other, Vector):
+            self.x += other.x
+            self.y += other.y
+            return self
+        raise TypeError("Can only add Vector objects")
+
+    def __isub__(self, other) -> 'Vector':
+        """Subtract another vector in place, without creating a new vector."""
+        if isinstance(other, Vector):
+            self.x -= other.x
+            self.y -= other.y
+            return self
+        raise TypeError("Can only subtract Vector objects")
+
+    def scale_(self, scalar: float) -> 'Vector':
+        """Multiply this vector by a scalar in place and return it."""
+        self.x *= scalar
+        self.y *= scalar
+        return self
+
+    def add_scaled_(self, other: 'Vector', scalar: float) -> 'Vector':
+        """Add other * scalar to this vector in place and return it (no temporary vector)."""
+        self.x += other.x * scalar
+        self.y += other.y * scalar
+        return self
+
+    def set_(self, x: float, y: float) -> 'Vector':
+        """Set both components in place and return this vector."""
+        self.x = float(x)
+        self.y = float(y)
+        return self
+
+    def normalize_(self) -> 'Vector':
+        """Normalize this vector in place and return it. A zero vector stays zero."""
+        mag: float = self.magnitude()
+        if mag != 0:
+            self.x /= mag
+            self.y /= mag
+        return self
+
     def magnitude(self) -> float:
         """Calculate the magnitude (length) of the vector."""
         return math.sqrt(self.x * self.x + self.y * self.y)